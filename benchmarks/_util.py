@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+# Copyright © YodaPY 2024-present
+#
+# This file is part of tk-netgraph.
+#
+# tk-netgraph is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# tk-netgraph is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with tk-netgraph. If not, see <https://www.gnu.org/licenses/>.
+
+"""Shared helpers for the benchmark scripts: measuring, reporting and persisting results"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field, asdict
+import contextlib
+import datetime
+import json
+import platform
+import subprocess
+import time
+import tkinter as tk
+import tracemalloc
+import typing as t
+
+if t.TYPE_CHECKING:
+    from netgraph import HeadlessCanvas
+
+
+@dataclass
+class Measurement:
+    benchmark: str
+    case: str
+    scale: int
+    phase: str
+    seconds: float = 0.0
+    calls: dict[str, int] = field(default_factory=dict)
+    peak_bytes: t.Optional[int] = None
+    extra: dict[str, t.Any] = field(default_factory=dict)
+
+    @property
+    def total_calls(self) -> int:
+        return sum(self.calls.values())
+
+    @property
+    def key(self) -> tuple[str, str, int, str]:
+        return self.benchmark, self.case, self.scale, self.phase
+
+
+class Recorder:
+    """Times a phase and records the canvas calls made during it, optionally tracing peak memory"""
+    __slots__: t.Sequence[str] = ("_canvas", "_trace_memory")
+
+    def __init__(self, canvas: t.Optional[HeadlessCanvas], *, trace_memory: bool) -> None:
+        self._canvas = canvas
+        self._trace_memory = trace_memory
+
+    @contextlib.contextmanager
+    def phase(self, measurement: Measurement) -> t.Iterator[Measurement]:
+        before = dict(self._canvas.calls) if self._canvas is not None else {}
+        if self._trace_memory:
+            tracemalloc.start()
+
+        start = time.perf_counter()
+        try:
+            yield measurement
+        finally:
+            measurement.seconds = time.perf_counter() - start
+            if self._trace_memory:
+                measurement.peak_bytes = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+
+            if self._canvas is not None:
+                measurement.calls = {
+                    name: count - before.get(name, 0)
+                    for name, count in self._canvas.calls.items()
+                    if count != before.get(name, 0)
+                }
+
+
+def merge_memory(timed: list[Measurement], traced: list[Measurement]) -> list[Measurement]:
+    """
+    Copies the peak memory of the traced run into the timed run.
+    Memory is traced in a separate run so tracemalloc's overhead does not distort the timings.
+    """
+    peaks = {m.key: m.peak_bytes for m in traced}
+    for measurement in timed:
+        measurement.peak_bytes = peaks.get(measurement.key)
+
+    return timed
+
+
+def make_event(x: float, y: float, **attributes: t.Any) -> tk.Event:
+    event = tk.Event()
+    event.x, event.y = int(x), int(y)
+    for name, value in attributes.items():
+        setattr(event, name, value)
+
+    return event
+
+
+def _git_revision() -> t.Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def write_results(path: str, measurements: list[Measurement], **meta: t.Any) -> None:
+    document = {
+        "meta": {
+            "revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            **meta,
+        },
+        "results": [{**asdict(m), "total_calls": m.total_calls} for m in measurements],
+    }
+    with open(path, "w", encoding="utf-8") as fp:
+        json.dump(document, fp, indent=2)
+
+
+def load_results(path: str) -> dict[tuple[str, str, int, str], dict[str, t.Any]]:
+    with open(path, encoding="utf-8") as fp:
+        document = json.load(fp)
+
+    return {
+        (r["benchmark"], r["case"], r["scale"], r["phase"]): r
+        for r in document["results"]
+    }
+
+
+def _format_bytes(value: t.Optional[int]) -> str:
+    if value is None:
+        return "-"
+
+    return f"{value / 1024 / 1024:.1f}MiB"
+
+
+def print_table(measurements: list[Measurement], baseline: t.Optional[str] = None) -> None:
+    previous = load_results(baseline) if baseline is not None else {}
+
+    header = f"{'benchmark':<12} {'case':<16} {'scale':>8} {'phase':<12} {'seconds':>10} {'tk calls':>10} {'peak mem':>10}"
+    if previous:
+        header += f" {'vs base':>9}"
+
+    print(header)
+    print("-" * len(header))
+    for m in measurements:
+        line = (
+            f"{m.benchmark:<12} {m.case:<16} {m.scale:>8} {m.phase:<12} "
+            f"{m.seconds:>10.4f} {m.total_calls:>10} {_format_bytes(m.peak_bytes):>10}"
+        )
+        if previous:
+            base = previous.get(m.key)
+            line += f" {m.seconds / base['seconds']:>8.2f}x" if base and base["seconds"] else f" {'-':>9}"
+
+        print(line)
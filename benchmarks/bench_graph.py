@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+# Copyright © YodaPY 2024-present
+#
+# This file is part of tk-netgraph.
+#
+# tk-netgraph is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# tk-netgraph is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with tk-netgraph. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Benchmarks graph construction, rendering, drag updates and replacing nodes on a `HeadlessCanvas`.
+
+Usage: python -m benchmarks.bench_graph [--scales 1000 10000 100000] [--shapes sparse dense ...] [--output results.json]
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import argparse
+import math
+import random
+import typing as t
+
+from netgraph import HeadlessCanvas, NetConfig, NetManager, NodeConfig
+
+from benchmarks._util import Measurement, Recorder, make_event, merge_memory, print_table, write_results
+
+if t.TYPE_CHECKING:
+    from netgraph.api._edge import CanvasEdge
+    from netgraph.api._node import CanvasNode
+
+DRAG_STEPS: t.Final[int] = 20
+EVENTS_PER_FRAME: t.Final[int] = 4
+"""The number of motion events delivered between two frames, i.e. before the canvas becomes idle"""
+DRAGGED_NODES: t.Final[int] = 10
+DRAGGED_EDGES: t.Final[int] = 5
+GRID_SPACING: t.Final[int] = 150
+QUERIES: t.Final[int] = 100
+PAN_STEPS: t.Final[int] = 40
+PAN_STEP: t.Final[int] = 60
+"""How far the view is scrolled per frame, in pixels"""
+CHURNED_NODES: t.Final[int] = 50
+"""The number of nodes removed and replaced by new nodes with the same edges"""
+
+
+@dataclass(frozen=True)
+class GraphShape:
+    name: str
+    edges_per_node: float
+    """The average number of edges per node, determines how the element budget is split"""
+    selfloop_ratio: float = 0.0
+    """The fraction of edges that are self-loops"""
+    pair_pool: t.Optional[float] = None
+    """If set, edges are drawn from a pool of `nodes * pair_pool` node pairs which produces parallel edges"""
+
+    def generate(self, elements: int, rng: random.Random) -> tuple[int, list[tuple[int, int]]]:
+        node_count = max(2, int(elements / (1 + self.edges_per_node)))
+        edge_count = max(1, elements - node_count)
+
+        pairs: t.Optional[list[tuple[int, int]]] = None
+        if self.pair_pool is not None:
+            pairs = [
+                (rng.randrange(node_count), rng.randrange(node_count))
+                for _ in range(max(1, int(node_count * self.pair_pool)))
+            ]
+
+        edges: list[tuple[int, int]] = []
+        for _ in range(edge_count):
+            if rng.random() < self.selfloop_ratio:
+                node = rng.randrange(node_count)
+                edges.append((node, node))
+            elif pairs is not None:
+                edges.append(rng.choice(pairs))
+            else:
+                edges.append((rng.randrange(node_count), rng.randrange(node_count)))
+
+        return node_count, edges
+
+
+SHAPES: t.Final[dict[str, GraphShape]] = {
+    shape.name: shape for shape in (
+        GraphShape("sparse", edges_per_node=1.5),
+        GraphShape("dense", edges_per_node=10),
+        GraphShape("multigraph", edges_per_node=6, pair_pool=0.5),
+        GraphShape("selfloops", edges_per_node=2, selfloop_ratio=0.5),
+    )
+}
+
+
+def _grid_position(index: int, columns: int) -> tuple[int, int]:
+    return (index % columns) * GRID_SPACING, (index // columns) * GRID_SPACING
+
+
+def _end_frame(canvas: HeadlessCanvas, step: int, steps: int) -> None:
+    if step % EVENTS_PER_FRAME == 0 or step == steps:
+        canvas.update()
+
+
+def _drag_node(canvas: HeadlessCanvas, node: CanvasNode, steps: int) -> None:
+    x, y = node.get_center()
+    event = make_event(x, y)
+    node._drag_start(event)  # type: ignore[attr-defined]
+    for step in range(1, steps + 1):
+        event = make_event(x + step * 3, y + step * 2)
+        node._update_edges(event)  # type: ignore[attr-defined]
+        _end_frame(canvas, step, steps)
+
+
+def _drag_edge(canvas: HeadlessCanvas, edge: CanvasEdge, steps: int) -> None:
+    x, y = edge.endpoints[0].get_center()
+    edge._drag_start(make_event(x, y))  # type: ignore[attr-defined]
+    for step in range(1, steps + 1):
+        edge._drag(make_event(x + step * 3, y + step * 2))  # type: ignore[attr-defined]
+        _end_frame(canvas, step, steps)
+
+
+def _churn(manager: NetManager, nodes: list[CanvasNode], rng: random.Random) -> None:
+    churned = rng.sample(nodes, min(len(nodes) // 2, CHURNED_NODES))
+    removed = set(churned)
+    replacements = [
+        (node.get_center(), [other for edge in node.edges for other in edge.endpoints if other not in removed])
+        for node in churned
+    ]
+    manager.remove_nodes(churned)
+    for index, ((x, y), neighbors) in enumerate(replacements):
+        node = manager.create_node(f"churn{index}")
+        node.render((int(x), int(y)))
+        for other in neighbors:
+            manager.create_edge((node, other), "", 1).render()
+
+
+def run_case(
+    shape: GraphShape,
+    scale: int,
+    *,
+    seed: int,
+    trace_memory: bool,
+    virtualize: bool = False,
+    sprites: bool = False,
+    raster: bool = False
+) -> list[Measurement]:
+    rng = random.Random(seed)
+    node_count, edge_pairs = shape.generate(scale, rng)
+
+    canvas = HeadlessCanvas()
+    config = NetConfig(virtualize=virtualize, raster=raster, node_config=NodeConfig(sprite=sprites))
+    manager = NetManager(canvas, config)
+    recorder = Recorder(canvas, trace_memory=trace_memory)
+    measurements: list[Measurement] = []
+
+    def measurement(phase: str) -> Measurement:
+        case = shape.name + "/virtual" * virtualize + "/sprites" * sprites + "/raster" * raster
+        m = Measurement("graph", case, scale, phase, extra={"nodes": node_count, "edges": len(edge_pairs)})
+        measurements.append(m)
+        return m
+
+    with recorder.phase(measurement("construct")):
+        nodes = [manager.create_node(str(i)) for i in range(node_count)]
+        edges = [manager.create_edge((nodes[u], nodes[v]), "", 1) for u, v in edge_pairs]
+
+    columns = max(1, math.isqrt(node_count))
+    with recorder.phase(measurement("render")):
+        for index, node in enumerate(nodes):
+            node.render(_grid_position(index, columns))
+        for edge in edges:
+            edge.render()
+
+    with recorder.phase(measurement("bulk_load")):
+        bulk_canvas = HeadlessCanvas()
+        bulk_manager = NetManager(bulk_canvas, config)
+        bulk_nodes = bulk_manager.add_nodes_from(
+            (str(i) for i in range(node_count)),
+            (_grid_position(index, columns) for index in range(node_count))
+        )
+        bulk_manager.add_edges_from((bulk_nodes[u], bulk_nodes[v], "", 1) for u, v in edge_pairs)
+    measurements[-1].calls = dict(bulk_canvas.calls)
+    del bulk_canvas, bulk_manager, bulk_nodes
+
+    dragged_nodes = sorted(nodes, key=lambda node: len(node.edges), reverse=True)[:DRAGGED_NODES // 2]
+    dragged_nodes += rng.sample(nodes, min(len(nodes), DRAGGED_NODES - len(dragged_nodes)))
+    with recorder.phase(measurement("drag_node")):
+        for node in dragged_nodes:
+            _drag_node(canvas, node, DRAG_STEPS)
+
+    with recorder.phase(measurement("drag_edge")):
+        for edge in rng.sample(edges, min(len(edges), DRAGGED_EDGES)):
+            _drag_edge(canvas, edge, DRAG_STEPS)
+
+    extent = columns * GRID_SPACING
+    with recorder.phase(measurement("query")):
+        for _ in range(QUERIES):
+            x, y = rng.uniform(0, extent), rng.uniform(0, extent)
+            manager.nodes_in(x, y, x + 4 * GRID_SPACING, y + 3 * GRID_SPACING)
+            manager.edges_in(x, y, x + 4 * GRID_SPACING, y + 3 * GRID_SPACING)
+            manager.nearest_node(x, y)
+            manager.nearest_edge(x, y)
+
+    with recorder.phase(measurement("pan")) as m:
+        manager.start_pan(make_event(0, 0))
+        for step in range(1, PAN_STEPS + 1):
+            manager.pan(make_event(-step * PAN_STEP, -step * PAN_STEP * 3 // 4))
+            canvas.update()
+        m.extra["items"] = canvas.item_count
+
+    # Replaced nodes and edges are drawn with the hidden items of the removed ones
+    with recorder.phase(measurement("churn")) as m:
+        hits, misses = canvas.item_pool.hits, canvas.item_pool.misses
+        _churn(manager, nodes, rng)
+        m.extra["pool_hits"] = canvas.item_pool.hits - hits
+        m.extra["pool_misses"] = canvas.item_pool.misses - misses
+
+    return measurements
+
+
+def main(argv: t.Optional[t.Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", type=int, nargs="+", default=[1_000, 10_000, 100_000], help="Number of elements (nodes + edges)")
+    parser.add_argument("--shapes", nargs="+", choices=sorted(SHAPES), default=list(SHAPES))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--virtualize", action="store_true", help="Only draw what is in view (NetConfig.virtualize)")
+    parser.add_argument("--sprites", action="store_true", help="Draw nodes as cached images (NodeConfig.sprite)")
+    parser.add_argument("--raster", action="store_true", help="Draw the graph into image tiles (NetConfig.raster)")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the second run that traces peak memory")
+    parser.add_argument("--output", default="bench_results.json", help="Path of the JSON result file")
+    parser.add_argument("--baseline", help="A previous result file to compare timings against")
+    args = parser.parse_args(argv)
+
+    results: list[Measurement] = []
+    for scale in args.scales:
+        for name in args.shapes:
+            options = {"seed": args.seed, "virtualize": args.virtualize, "sprites": args.sprites, "raster": args.raster}
+            timed = run_case(SHAPES[name], scale, trace_memory=False, **options)
+            if not args.no_memory:
+                timed = merge_memory(timed, run_case(SHAPES[name], scale, trace_memory=True, **options))
+
+            results.extend(timed)
+
+    print_table(results, args.baseline)
+    write_results(args.output, results, seed=args.seed, drag_steps=DRAG_STEPS, events_per_frame=EVENTS_PER_FRAME)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+# Copyright © YodaPY 2024-present
+#
+# This file is part of tk-netgraph.
+#
+# tk-netgraph is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# tk-netgraph is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with tk-netgraph. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Compares the exact O(n²) repulsion of the spring layout with the Barnes-Hut approximation, in time and accuracy.
+
+Usage: python -m benchmarks.bench_layout [--nodes 1000 10000 50000] [--thetas 0.5 1.0] [--workers 4] [--output results.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import typing as t
+
+import numpy as np
+
+from netgraph import HeadlessCanvas, NetManager
+from netgraph.layout import LayoutGraph, ParallelSpringLayout, QuadTree, SpringLayout
+from netgraph.layout._spring import _exact_repulsion
+
+from benchmarks._util import Measurement, Recorder, merge_memory, print_table, write_results
+
+EDGES_PER_NODE: t.Final[float] = 1.5
+SPACING: t.Final[float] = 100.0
+
+
+def _build_graph(node_count: int, seed: int) -> NetManager:
+    rng = random.Random(seed)
+    manager = NetManager(HeadlessCanvas())
+    nodes = manager.add_nodes_from(str(i) for i in range(node_count))
+    # A random tree keeps the graph connected, the remaining edges are random
+    edges = [(nodes[i], nodes[rng.randrange(i)]) for i in range(1, node_count)]
+    edges += [
+        (nodes[rng.randrange(node_count)], nodes[rng.randrange(node_count)])
+        for _ in range(max(0, int(node_count * EDGES_PER_NODE) - len(edges)))
+    ]
+    manager.add_edges_from(edges, render=False)
+    return manager
+
+
+def _relative_error(approximate: np.ndarray, exact: np.ndarray) -> np.ndarray:
+    return np.linalg.norm(approximate - exact, axis=1) / np.maximum(np.linalg.norm(exact, axis=1), 1e-12)
+
+
+def _edge_length_spread(graph: LayoutGraph) -> float:
+    """The coefficient of variation of the edge lengths, lower means a more even layout"""
+    delta = graph.positions[graph.edges[:, 0]] - graph.positions[graph.edges[:, 1]]
+    lengths = np.hypot(delta[:, 0], delta[:, 1])
+    return float(lengths.std() / lengths.mean())
+
+
+def run_case(
+    node_count: int,
+    thetas: t.Sequence[float],
+    *,
+    seed: int,
+    iterations: int,
+    exact_limit: int,
+    workers: t.Optional[int],
+    trace_memory: bool
+) -> list[Measurement]:
+    manager = _build_graph(node_count, seed)
+    recorder = Recorder(None, trace_memory=trace_memory)
+    measurements: list[Measurement] = []
+    cases = ([0.0] if node_count <= exact_limit else []) + list(thetas)
+
+    def measurement(case: str, phase: str, **extra: t.Any) -> Measurement:
+        m = Measurement("layout", case, node_count, phase, extra={"edges": len(manager.edges), **extra})
+        measurements.append(m)
+        return m
+
+    start = SpringLayout(spacing=SPACING, seed=seed).graph(manager).positions
+    exact: t.Optional[np.ndarray] = None
+    for theta in cases:
+        name = "exact" if theta == 0 else f"theta={theta}"
+        with recorder.phase(measurement(name, "repulsion")) as m:
+            force = (
+                _exact_repulsion(start, SPACING) if theta == 0
+                else QuadTree(start).repulsion(start, SPACING, theta)
+            )
+
+        if theta == 0:
+            exact = force
+        elif exact is not None:
+            error = _relative_error(force, exact)
+            m.extra.update(median_error=float(np.median(error)), p95_error=float(np.percentile(error, 95)))
+
+    for theta in cases:
+        name = "exact" if theta == 0 else f"theta={theta}"
+        layout = SpringLayout(iterations=iterations, spacing=SPACING, seed=seed, tolerance=0, theta=theta)
+        graph = layout.graph(manager)
+        with recorder.phase(measurement(name, "layout", iterations=iterations)) as m:
+            for _ in layout.iterate(graph):
+                pass
+
+        m.extra["edge_length_spread"] = _edge_length_spread(graph)
+
+    if workers is not None:
+        for theta in cases:
+            name = ("exact" if theta == 0 else f"theta={theta}") + f"/{workers}p"
+            layout = ParallelSpringLayout(
+                workers=workers, iterations=iterations, spacing=SPACING, seed=seed, tolerance=0, theta=theta
+            )
+            graph = layout.graph(manager)
+            # Includes starting the worker processes
+            with recorder.phase(measurement(name, "layout", iterations=iterations)) as m:
+                for _ in layout.iterate(graph):
+                    pass
+
+            m.extra["edge_length_spread"] = _edge_length_spread(graph)
+
+    return measurements
+
+
+def main(argv: t.Optional[t.Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    parser.add_argument("--thetas", type=float, nargs="+", default=[0.5, 1.0], help="Barnes-Hut accuracies to compare")
+    parser.add_argument("--iterations", type=int, default=20, help="Iterations of the full layout runs")
+    parser.add_argument("--exact-limit", type=int, default=20_000, help="Skip the exact repulsion above this node count")
+    parser.add_argument("--workers", type=int, help="Also run the layouts on this many processes")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-memory", action="store_true", help="Skip the second run that traces peak memory")
+    parser.add_argument("--output", default="bench_results.json", help="Path of the JSON result file")
+    parser.add_argument("--baseline", help="A previous result file to compare timings against")
+    args = parser.parse_args(argv)
+
+    results: list[Measurement] = []
+    for node_count in args.nodes:
+        options = dict(seed=args.seed, iterations=args.iterations, exact_limit=args.exact_limit, workers=args.workers)
+        timed = run_case(node_count, args.thetas, trace_memory=False, **options)
+        if not args.no_memory:
+            timed = merge_memory(timed, run_case(node_count, args.thetas, trace_memory=True, **options))
+
+        results.extend(timed)
+
+    print_table(results, args.baseline)
+    for m in results:
+        quality = {name: value for name, value in m.extra.items() if name.endswith(("error", "spread"))}
+        if quality:
+            print(f"{m.case:<12} {m.scale:>8} {m.phase:<12} " + " ".join(f"{name}={value:.4f}" for name, value in quality.items()))
+
+    write_results(args.output, results, seed=args.seed, iterations=args.iterations)
+
+
+if __name__ == "__main__":
+    main()
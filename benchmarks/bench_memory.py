@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+# Copyright © YodaPY 2024-present
+#
+# This file is part of tk-netgraph.
+#
+# tk-netgraph is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# tk-netgraph is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with tk-netgraph. If not, see <https://www.gnu.org/licenses/>.
+"""
+Measures the memory a graph keeps per node and per edge, once for the graph model alone and once more
+after everything was drawn. Memory the `HeadlessCanvas` keeps for its items is left out, with a real canvas
+the items live in Tk.
+
+Usage: python -m benchmarks.bench_memory [--scales 10000 100000] [--shapes sparse dense ...] [--output results.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import math
+import random
+import time
+import tracemalloc
+import typing as t
+
+from netgraph import HeadlessCanvas, NetManager
+
+from benchmarks._util import Measurement, print_table, write_results
+from benchmarks.bench_graph import SHAPES, GraphShape, _grid_position
+
+_EXCLUDE: t.Final[tuple[tracemalloc.Filter, ...]] = (
+    tracemalloc.Filter(False, "*_headless.py"),
+    tracemalloc.Filter(False, tracemalloc.__file__),
+)
+
+
+def _retained() -> int:
+    gc.collect()
+    snapshot = tracemalloc.take_snapshot().filter_traces(_EXCLUDE)
+    return sum(stat.size for stat in snapshot.statistics("filename"))
+
+
+def run_case(shape: GraphShape, scale: int, *, seed: int) -> list[Measurement]:
+    rng = random.Random(seed)
+    node_count, edge_pairs = shape.generate(scale, rng)
+    labels = [str(i) for i in range(node_count)]
+    columns = max(1, math.isqrt(node_count))
+    measurements: list[Measurement] = []
+
+    def measurement(phase: str) -> Measurement:
+        m = Measurement("memory", shape.name, scale, phase, extra={"nodes": node_count, "edges": len(edge_pairs)})
+        measurements.append(m)
+        return m
+
+    tracemalloc.start()
+    try:
+        canvas = HeadlessCanvas()
+        manager = NetManager(canvas)
+        baseline = _retained()
+
+        m = measurement("model")
+        start = time.perf_counter()
+        nodes = manager.add_nodes_from(labels)
+        after_nodes = _retained()
+        manager.add_edges_from(((nodes[u], nodes[v], "", 1) for u, v in edge_pairs), render=False)
+        m.seconds = time.perf_counter() - start
+        after_edges = _retained()
+        m.extra["bytes_per_node"] = (after_nodes - baseline) / node_count
+        m.extra["bytes_per_edge"] = (after_edges - after_nodes) / len(edge_pairs)
+
+        m = measurement("rendered")
+        calls = dict(canvas.calls)
+        start = time.perf_counter()
+        manager.set_positions({node: _grid_position(index, columns) for index, node in enumerate(nodes)})
+        with manager.batch():
+            for edge in manager.edges:
+                edge.render()
+        canvas.update()
+        m.seconds = time.perf_counter() - start
+        m.calls = {name: count - calls.get(name, 0) for name, count in canvas.calls.items() if count != calls.get(name, 0)}
+        m.extra["bytes_per_element"] = (_retained() - baseline) / (node_count + len(edge_pairs))
+        m.extra["bytes_per_element_model"] = (after_edges - baseline) / (node_count + len(edge_pairs))
+    finally:
+        tracemalloc.stop()
+
+    return measurements
+
+
+def main(argv: t.Optional[t.Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", type=int, nargs="+", default=[10_000, 100_000], help="Number of elements (nodes + edges)")
+    parser.add_argument("--shapes", nargs="+", choices=sorted(SHAPES), default=["sparse", "dense"])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="bench_results.json", help="Path of the JSON result file")
+    parser.add_argument("--baseline", help="A previous result file to compare timings against")
+    args = parser.parse_args(argv)
+
+    results: list[Measurement] = []
+    for scale in args.scales:
+        for name in args.shapes:
+            results.extend(run_case(SHAPES[name], scale, seed=args.seed))
+
+    print_table(results, args.baseline)
+    print()
+    print(f"{'case':<16} {'scale':>8} {'B/node':>10} {'B/edge':>10} {'B/element':>10} {'drawn':>10}")
+    for model, rendered in zip(results[0::2], results[1::2]):
+        print(
+            f"{model.case:<16} {model.scale:>8} {model.extra['bytes_per_node']:>10.0f} "
+            f"{model.extra['bytes_per_edge']:>10.0f} {rendered.extra['bytes_per_element_model']:>10.0f} "
+            f"{rendered.extra['bytes_per_element']:>10.0f}"
+        )
+
+    write_results(args.output, results, seed=args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+# Copyright © YodaPY 2024-present
+#
+# This file is part of tk-netgraph.
+#
+# tk-netgraph is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# tk-netgraph is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with tk-netgraph. If not, see <https://www.gnu.org/licenses/>.
+"""
+Measures the startup time of a graph: building it from labels and node pairs with `add_nodes_from` and
+`add_edges_from` compared with loading it from a file written by `NetManager.save`.
+
+Usage: python -m benchmarks.bench_persist [--scales 1000 10000 100000] [--shapes sparse dense ...] [--compress] [--output results.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import math
+import random
+import typing as t
+
+from netgraph import HeadlessCanvas, NetManager
+
+from benchmarks._util import Measurement, Recorder, merge_memory, print_table, write_results
+from benchmarks.bench_graph import SHAPES, GraphShape, _grid_position
+
+
+def run_case(shape: GraphShape, scale: int, *, seed: int, compress: bool, trace_memory: bool) -> list[Measurement]:
+    rng = random.Random(seed)
+    node_count, edge_pairs = shape.generate(scale, rng)
+    columns = max(1, math.isqrt(node_count))
+    measurements: list[Measurement] = []
+
+    def measurement(phase: str) -> Measurement:
+        case = shape.name + "/compress" * compress
+        m = Measurement("persist", case, scale, phase, extra={"nodes": node_count, "edges": len(edge_pairs)})
+        measurements.append(m)
+        return m
+
+    canvas = HeadlessCanvas()
+    manager = NetManager(canvas)
+    with Recorder(canvas, trace_memory=trace_memory).phase(measurement("build")):
+        nodes = manager.add_nodes_from(
+            (str(i) for i in range(node_count)),
+            (_grid_position(index, columns) for index in range(node_count))
+        )
+        manager.add_edges_from((nodes[u], nodes[v], "", 1) for u, v in edge_pairs)
+
+    file = io.BytesIO()
+    with Recorder(None, trace_memory=trace_memory).phase(measurement("save")) as m:
+        manager.save(file, compress=compress)
+    m.extra["bytes"] = file.tell()
+    del canvas, manager, nodes
+
+    file.seek(0)
+    load_canvas = HeadlessCanvas()
+    with Recorder(load_canvas, trace_memory=trace_memory).phase(measurement("load")):
+        NetManager(load_canvas).load(file)
+
+    return measurements
+
+
+def main(argv: t.Optional[t.Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", type=int, nargs="+", default=[1_000, 10_000, 100_000], help="Number of elements (nodes + edges)")
+    parser.add_argument("--shapes", nargs="+", choices=sorted(SHAPES), default=["sparse", "multigraph"])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--compress", action="store_true", help="Write compressed files (NetManager.save(compress=True))")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the second run that traces peak memory")
+    parser.add_argument("--output", default="bench_results.json", help="Path of the JSON result file")
+    parser.add_argument("--baseline", help="A previous result file to compare timings against")
+    args = parser.parse_args(argv)
+
+    results: list[Measurement] = []
+    for scale in args.scales:
+        for name in args.shapes:
+            options = {"seed": args.seed, "compress": args.compress}
+            timed = run_case(SHAPES[name], scale, trace_memory=False, **options)
+            if not args.no_memory:
+                timed = merge_memory(timed, run_case(SHAPES[name], scale, trace_memory=True, **options))
+
+            results.extend(timed)
+
+    print_table(results, args.baseline)
+    for m in results:
+        if "bytes" in m.extra:
+            print(f"{m.case:<16} {m.scale:>8} file size {m.extra['bytes'] / 1024:.1f}KiB")
+
+    write_results(args.output, results, seed=args.seed, compress=args.compress)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+# Copyright © YodaPY 2024-present
+#
+# This file is part of tk-netgraph.
+#
+# tk-netgraph is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# tk-netgraph is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with tk-netgraph. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Compares sending the coordinate and text updates of dragged edges one tkinter call at a time with sending them
+through the command buffer of `NetCanvas` as a single Tcl call per frame.
+
+Without a display the canvas widget command is replaced by a Tcl procedure that does nothing, which leaves
+exactly the part the buffer saves: converting the arguments and calling from python into Tcl.
+
+Usage: python -m benchmarks.bench_tcl [--edges 1000 5000 20000] [--frames 10] [--output results.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import tkinter as tk
+import typing as t
+
+from netgraph import HeadlessCanvas, NetCanvas, NetManager
+from netgraph._commands import _CommandBuffer, _define_run_commands
+from netgraph._edge import _EdgeGeometry, _compute_geometries
+
+from benchmarks._util import Measurement, Recorder, print_table, write_results
+
+COLUMNS: t.Final[int] = 100
+SPACING: t.Final[int] = 150
+
+
+class _TclCanvas(NetCanvas):
+    """A NetCanvas whose widget command is a Tcl procedure that ignores its arguments"""
+
+    def __init__(self) -> None:  # pylint: disable=super-init-not-called
+        self.tk = tk.Tcl().tk
+        self._w = ".netgraph_bench"
+        self._aa_circle_canvas_ids: set[int] = set()
+        self.tk.eval(f"proc {self._w} {{args}} {{}}")
+        _define_run_commands(self.tk)
+        self._commands = _CommandBuffer(self._send_commands)
+
+
+def _make_canvas() -> tuple[NetCanvas, str]:
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        return _TclCanvas(), "tcl"
+
+    root.withdraw()
+    return NetCanvas(root), "tk"
+
+
+def _edge_geometries(edge_count: int) -> list[_EdgeGeometry]:
+    manager = NetManager(HeadlessCanvas())
+    nodes = manager.add_nodes_from(
+        (str(i) for i in range(edge_count + 1)),
+        (((i % COLUMNS) * SPACING, (i // COLUMNS) * SPACING) for i in range(edge_count + 1))
+    )
+    edges = manager.add_edges_from(((nodes[i], nodes[i + 1], "label", 1) for i in range(edge_count)), render=False)
+    return _compute_geometries(edges)
+
+
+def _create_items(canvas: NetCanvas, geometries: list[_EdgeGeometry]) -> list[tuple[int, int, int, int]]:
+    if isinstance(canvas, _TclCanvas):
+        # The stub doesn't create anything, the IDs only have to look like canvas IDs
+        return [(4 * i + 1, 4 * i + 2, 4 * i + 3, 4 * i + 4) for i in range(len(geometries))]
+
+    items: list[tuple[int, int, int, int]] = []
+    for geometry in geometries:
+        halo, line = canvas.create_line(*geometry.points, smooth=True), canvas.create_line(*geometry.points, smooth=True)
+        label, weight = canvas.create_text(*geometry.anchor, text="label"), canvas.create_text(*geometry.anchor, text="1")
+        items.append((halo, line, label, weight))
+
+    return items
+
+
+def _update(canvas: NetCanvas, items: list[tuple[int, int, int, int]], geometries: list[_EdgeGeometry], shift: float) -> None:
+    """The calls `CanvasEdge._apply_geometry` makes for every edge: two lines, and two texts that are rotated and placed"""
+    for (halo, line, label, weight), geometry in zip(items, geometries):
+        points = [value + shift for value in geometry.points]
+        canvas.coords(halo, *points)
+        canvas.coords(line, *points)
+        for text, gap in ((label, 20), (weight, -20)):
+            x, y = geometry.text_position(gap)
+            canvas.itemconfig(text, angle=geometry.angle or 0)
+            canvas.coords(text, x + shift, y + shift)
+
+
+def run_case(edge_count: int, *, frames: int) -> list[Measurement]:
+    canvas, backend = _make_canvas()
+    geometries = _edge_geometries(edge_count)
+    items = _create_items(canvas, geometries)
+    recorder = Recorder(None, trace_memory=False)
+    extra = {"backend": backend, "frames": frames, "commands": 6 * edge_count * frames}
+
+    per_call = Measurement("tcl", backend, edge_count, "per_call", extra=extra)
+    with recorder.phase(per_call):
+        for frame in range(frames):
+            _update(canvas, items, geometries, frame)
+    per_call.calls = {"tcl": 6 * edge_count * frames}
+
+    buffered = Measurement("tcl", backend, edge_count, "buffered", extra=extra)
+    with recorder.phase(buffered):
+        for frame in range(frames):
+            with canvas.buffering():
+                _update(canvas, items, geometries, frame)
+    buffered.calls = {"tcl": frames}
+
+    return [per_call, buffered]
+
+
+def main(argv: t.Optional[t.Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--edges", type=int, nargs="+", default=[1_000, 5_000, 20_000], help="Number of updated edges per frame")
+    parser.add_argument("--frames", type=int, default=10, help="Number of frames, i.e. flushes, per case")
+    parser.add_argument("--output", default="bench_results.json", help="Path of the JSON result file")
+    parser.add_argument("--baseline", help="A previous result file to compare timings against")
+    args = parser.parse_args(argv)
+
+    results: list[Measurement] = []
+    for edge_count in args.edges:
+        results.extend(run_case(edge_count, frames=args.frames))
+
+    print_table(results, args.baseline)
+    for per_call, buffered in zip(results[0::2], results[1::2]):
+        print(f"{per_call.case:<12} {per_call.scale:>8} speedup {per_call.seconds / buffered.seconds:.2f}x")
+
+    write_results(args.output, results, frames=args.frames)
+
+
+if __name__ == "__main__":
+    main()
@@ -17,8 +17,10 @@
 # along with tk-netgraph. If not, see <https://www.gnu.org/licenses/>.
 
 from netgraph._canvas import *
+from netgraph._headless import *
 from netgraph._config import *
 from netgraph._netmanager import *
+from netgraph._mapped import *
 from netgraph._node import *
 from netgraph._edge import *
 from netgraph._objects import *
\ No newline at end of file
@@ -19,14 +19,26 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import contextlib
 import tkinter as tk
 import typing as t
 
 import customtkinter as ctk
 
-from netgraph._objects import _ObjectContainer, _convert_to_canvas_objects
+try:
+    from PIL import ImageTk
+except ImportError: # Pillow is optional, see `photo_image`
+    ImageTk = None # type: ignore[assignment]
+
+from netgraph._commands import _Command, _CommandBuffer, _define_run_commands, _run_commands
+from netgraph._dispatch import _EventDispatcher
+from netgraph._objects import _ObjectContainer
+from netgraph._pool import _ItemPool
+from netgraph._scheduler import _RenderScheduler
 
 if t.TYPE_CHECKING:
+    from PIL import Image
+
     from netgraph.api._node import CanvasNode
 
     from netgraph._types import CanvasObjectsLike
@@ -35,6 +47,23 @@ __all__: t.Sequence[str] = (
     "NetCanvas",
 )
 
+_AA_CIRCLE_TAG: t.Final[str] = "ctk_aa_circle_font_element"
+_AA_CIRCLE_FONT: t.Final[str] = "CustomTkinter_shapes_font"
+_ITEM_POOL_SIZE: t.Final[int] = 4096
+
+def _flatten(args: t.Iterable[t.Any]) -> list[t.Any]:
+    """
+    The coordinates of the given arguments, which are single coordinates or pairs of coordinates
+    """
+    coords: list[t.Any] = []
+    for arg in args:
+        if isinstance(arg, (tuple, list)):
+            coords.extend(arg)
+        else:
+            coords.append(arg)
+
+    return coords
+
 @dataclass(frozen=True)
 class _ActiveNode:
     node: CanvasNode
@@ -42,12 +71,27 @@ class _ActiveNode:
 
 
 class NetCanvas(ctk.CTkCanvas):
-    __slots__: t.Sequence[str] = ("_active_node",)
+    __slots__: t.Sequence[str] = (
+        "_active_node", "_scheduler", "_dispatcher", "_creation_tags", "_commands", "_item_pool"
+    )
 
     def __init__(self, *args, **kwargs) -> None:  #type: ignore
         super().__init__(*args, **kwargs)
 
+        _define_run_commands(self.tk)
+        self._init_net_canvas()
+
+    def _init_net_canvas(self) -> None:
+        """
+        Set up the state and bindings shared by every canvas backend.
+        Called once the underlying canvas is able to accept item and binding commands.
+        """
         self._active_node: t.Optional[_ActiveNode] = None
+        self._scheduler = _RenderScheduler(self)
+        self._dispatcher = _EventDispatcher(self)
+        self._creation_tags: tuple[str, ...] = ()
+        self._commands = _CommandBuffer(self._send_commands)
+        self._item_pool = _ItemPool(_ITEM_POOL_SIZE)
 
         self.tag_bind("all", "<Enter>", lambda _: self.config(cursor="hand2"))
         self.tag_bind("all", "<Leave>", lambda _: self.config(cursor=""))
@@ -55,32 +99,259 @@ class NetCanvas(ctk.CTkCanvas):
     @property
     def active_node(self) -> t.Optional[_ActiveNode]:
         return self._active_node
+
+    @property
+    def scheduler(self) -> _RenderScheduler:
+        return self._scheduler
+
+    @property
+    def dispatcher(self) -> _EventDispatcher:
+        return self._dispatcher
+
+    @property
+    def item_pool(self) -> _ItemPool:
+        """
+        The hidden items of removed objects that new objects are drawn with, see `release_items`
+        """
+        return self._item_pool
     
-    def create_border_circle(self, pos: tuple[int, int], radius: int, width: int) -> CanvasObjectsLike:
+    @contextlib.contextmanager
+    def tagging(self, tags: t.Sequence[str]) -> t.Iterator[None]:
+        """
+        Add the given tags to every canvas object that is created inside the with-block.
+        Tagging objects when they're created saves one call per object and tag.
+        """
+        previous, self._creation_tags = self._creation_tags, (*self._creation_tags, *tags)
+        try:
+            yield
+        finally:
+            self._creation_tags = previous
+
+    def buffering(self) -> t.ContextManager[None]:
+        """
+        Collect the coords, itemconfig and move calls made inside the with-block and send them to Tcl
+        in a single call when the outermost block is left. Reading coordinates or bounding boxes sends the
+        collected commands first, so the canvas is always up to date when it is queried.
+        """
+        return self._commands.collect()
+
+    def _send_commands(self, commands: list[_Command]) -> None:
+        _run_commands(self.tk, commands)
+
+    def coords(self, tag_or_id, *args):  # type: ignore
+        # Tags of antialiased circles need extra calls, see CTkCanvas.coords
+        if args and isinstance(tag_or_id, int):
+            if len(args) == 3 and tag_or_id in self._aa_circle_canvas_ids:
+                # The radius is the size of the circle glyph
+                *args, radius = args
+                if self._commands.add(self._w, "coords", tag_or_id, *args):
+                    self._commands.add(self._w, "itemconfigure", tag_or_id, *self._aa_circle_options(radius))
+                    return []
+
+                args = (*args, radius)
+
+            elif self._commands.add(self._w, "coords", tag_or_id, *args):
+                return []
+
+        self._commands.flush()
+        return super().coords(tag_or_id, *args)
+
+    def move(self, *args) -> None:  # type: ignore
+        if not self._commands.add(self._w, "move", *args):
+            super().move(*args)
+
+    def itemconfig(self, tag_or_id, *args, **kwargs):  # type: ignore
+        if not args and isinstance(tag_or_id, int):
+            if tag_or_id in self._aa_circle_canvas_ids:
+                kwargs.pop("outline", None)
+
+            options: list[t.Any] = []
+            for name, value in kwargs.items():
+                if not isinstance(value, (str, int, float)):
+                    break
+
+                options += (f"-{name}", value)
+            else:
+                if self._commands.add(self._w, "itemconfigure", tag_or_id, *options):
+                    return None
+
+        self._commands.flush()
+        return super().itemconfig(tag_or_id, *args, **kwargs)
+
+    def bbox(self, *args):  # type: ignore
+        self._commands.flush()
+        return super().bbox(*args)
+
+    def tag_raise(self, *args) -> None:  # type: ignore
+        # Stacking changes are buffered too, so they are applied in order with the recycled items they raise
+        if not self._commands.add(self._w, "raise", *args):
+            super().tag_raise(*args)
+
+    def tag_lower(self, *args) -> None:  # type: ignore
+        if not self._commands.add(self._w, "lower", *args):
+            super().tag_lower(*args)
+
+    def addtag_withtag(self, *args) -> None:  # type: ignore
+        self._commands.flush()
+        super().addtag_withtag(*args)
+
+    def dtag(self, *args) -> None:  # type: ignore
+        self._commands.flush()
+        super().dtag(*args)
+
+    def delete(self, *args) -> None:  # type: ignore
+        self._commands.flush()
+        self._forget_items(args)
+        super().delete(*args)
+
+    def _forget_items(self, deleted: t.Sequence[t.Union[str, int]]) -> None:
+        if "all" in deleted:
+            self._item_pool.clear()
+        else:
+            self._item_pool.forget(int(item) for item in deleted if isinstance(item, int) or item.isdigit())
+
+    def release_items(self, tag: str, items: t.Sequence[int]) -> None:
+        """
+        Remove the objects with the given tag, whose canvas items are the given items.
+        Items the item pool has room for are hidden and reused for the next objects that are created with the same
+        options, which is cheaper than deleting them and creating new items. The rest is deleted.
+        """
+        # Pending work for the items would otherwise reach the objects the items are reused for
+        self._scheduler.forget(tag, items)
+        hidden = self._item_pool.release(items) if self._item_pool.enabled else []
+        if hidden:
+            self._aa_circle_canvas_ids.difference_update(hidden)
+            with self.buffering():
+                for item in hidden:
+                    self.itemconfig(item, state="hidden", tags="")
+
+        if len(hidden) < len(items) or not items:
+            self.delete(tag)
+
+    def _create_pooled(
+        self, kind: str, create: t.Callable[..., int], args: tuple[t.Any, ...], kwargs: dict[str, t.Any]
+    ) -> int:
+        """
+        Create an item with the given function, or reuse a hidden item of the same kind and options.
+        Only the items of object containers are pooled, they are the ones released by `release_items`.
+        """
+        if not self._creation_tags or not self._item_pool.enabled:
+            return create(*args, **kwargs)
+
+        key = (kind, *sorted(kwargs))
+        item = self._item_pool.acquire(key)
+        if item is None:
+            # Recycled items waiting to be raised must not end up above the new item
+            self._commands.flush()
+            item = create(*args, **kwargs)
+            self._item_pool.track(item, key)
+            return item
+
+        tags = kwargs.pop("tags")
+        if kind == "aa_circle":
+            tags = (*tags, _AA_CIRCLE_TAG)
+            self._aa_circle_canvas_ids.add(item)
+
+        # Like a new item, the item is configured from scratch and put on top
+        self.coords(item, *_flatten(args))
+        self.itemconfig(item, state="normal", tags=" ".join(tags), **kwargs)
+        self.tag_raise(item)
+        return item
+
+    def _add_creation_tags(self, kwargs: dict[str, t.Any]) -> dict[str, t.Any]:
+        if self._creation_tags:
+            tags = kwargs.get("tags", ())
+            tags = tags.split() if isinstance(tags, str) else tags
+            kwargs["tags"] = (*tags, *self._creation_tags)
+
+        return kwargs
+
+    def create_line(self, *args, **kwargs) -> int:  # type: ignore
+        return self._create_pooled("line", super().create_line, args, self._add_creation_tags(kwargs))
+
+    def create_text(self, *args, **kwargs) -> int:  # type: ignore
+        return self._create_pooled("text", super().create_text, args, self._add_creation_tags(kwargs))
+
+    def create_image(self, *args, **kwargs) -> int:  # type: ignore
+        return self._create_pooled("image", super().create_image, args, self._add_creation_tags(kwargs))
+
+    def create_aa_circle(  # type: ignore[override]
+        self,
+        x_pos: int,
+        y_pos: int,
+        radius: int,
+        angle: int = 0,
+        fill: str = "white",
+        tags: t.Union[str, tuple[str, ...]] = "",
+        anchor: str = tk.CENTER
+    ) -> int:
+        kwargs = self._add_creation_tags({"angle": angle, "fill": fill, "tags": tags, "anchor": anchor})
+        return self._create_pooled("aa_circle", self._create_aa_circle, (x_pos, y_pos, radius), kwargs)
+
+    def _create_aa_circle(self, x_pos: int, y_pos: int, radius: int, *, tags: t.Any = (), **kwargs: t.Any) -> int:
+        # Tagged on creation instead of with an extra call, see CTkCanvas.create_aa_circle
+        tags = tags.split() if isinstance(tags, str) else tags
+        options = self._aa_circle_options(radius)
+        circle = super().create_text(
+            x_pos, y_pos, text=options[1], font=options[3], tags=(*tags, _AA_CIRCLE_TAG), **kwargs
+        )
+        self._aa_circle_canvas_ids.add(circle)
+        return circle
+
+    def _aa_circle_options(self, radius: int) -> tuple[str, t.Any, str, t.Any]:
+        """
+        The options that draw an antialiased circle of the given radius: the circle glyph and its font size
+        """
+        return "-text", self._get_char_from_radius(radius), "-font", (_AA_CIRCLE_FONT, -int(radius) * 2)
+
+    def photo_image(self, image: Image.Image) -> t.Any:
+        """
+        Convert a Pillow image to an image that can be drawn with `create_image`.
+        The returned image has to be referenced for as long as it is drawn.
+        """
+        if ImageTk is None:
+            raise RuntimeError("Converting images requires Pillow")
+
+        return ImageTk.PhotoImage(image, master=self)
+
+    def create_border_circle(self, pos: tuple[int, int], radius: int, width: int, *, bg: t.Optional[str] = None) -> CanvasObjectsLike:
         yield self.create_aa_circle(*pos, radius, fill="black")
-        yield self.create_aa_circle(*pos, radius-width, fill=self.cget("bg"))
+        yield self.create_aa_circle(*pos, radius-width, fill=bg if bg is not None else self.cget("bg"))
 
-    def create_double_circle(self, pos: tuple[int, int], space: int, radius: int) -> CanvasObjectsLike:
-        yield from self.create_border_circle(pos, radius, 2)
-        yield from self.create_border_circle(pos, radius-space, 2)
+    def create_double_circle(
+        self, pos: tuple[int, int], space: int, radius: int, *, detailed: bool = True
+    ) -> CanvasObjectsLike:
+        if not detailed:
+            # A single filled circle in place of four, e.g. when zoomed out
+            yield self.create_aa_circle(*pos, radius, fill="black")
+            return
+
+        bg = self.cget("bg")
+        yield from self.create_border_circle(pos, radius, 2, bg=bg)
+        yield from self.create_border_circle(pos, radius-space, 2, bg=bg)
+
+    def create_aa_line(self, *args, antialias: bool = True, **kwargs) -> CanvasObjectsLike:
+        # The wider, lighter line is created first so it lies below the actual line
+        width = kwargs["width"]
+        if antialias:
+            kwargs["fill"] = "#AAA"
+            kwargs["width"] = width + 0.5
+            yield self.create_line(*args, **kwargs)
 
-    def create_aa_line(self, *args, **kwargs) -> CanvasObjectsLike:
         kwargs["fill"] = "#000"
-        yield self.create_line(*args, **kwargs)
-        kwargs["fill"] = "#AAA"
-        kwargs["width"] += 0.5
+        kwargs["width"] = width
         yield self.create_line(*args, **kwargs)
 
     def _draw_dynamic_line(self, event: tk.Event) -> None:
         self._active_node = t.cast(_ActiveNode, self._active_node)
-        self._active_node.edge_container.coords(*self._active_node.node.get_center(), event.x, event.y)
+        self._active_node.edge_container.coords(
+            *self._active_node.node.get_center(), self.canvasx(event.x), self.canvasy(event.y)
+        )
 
     def start_dynamic_line(self, node: CanvasNode) -> None:
         node_center = node.get_center()
         obj_container = _ObjectContainer(self, disabled=True)
-        ids = self.create_aa_line(*node_center, *node_center, width=2)
-        objects = _convert_to_canvas_objects(self, ids)
-        obj_container.add(*objects)
+        obj_container.render(self.create_aa_line(*node_center, *node_center, width=2))
         obj_container.lower()
 
         self._active_node = _ActiveNode(node, obj_container)
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+# Copyright © YodaPY 2024-present
+#
+# This file is part of tk-netgraph.
+#
+# tk-netgraph is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# tk-netgraph is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with tk-netgraph. If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import contextlib
+import typing as t
+
+if t.TYPE_CHECKING:
+    import _tkinter
+
+_Command = tuple[t.Any, ...]
+
+_RUN_COMMANDS: t.Final[str] = "::netgraph_run_commands"
+_RUN_COMMANDS_PROC: t.Final[str] = f"proc {_RUN_COMMANDS} {{commands}} {{foreach command $commands {{{{*}}$command}}}}"
+"""Runs every command of a Tcl list of commands, so many commands cost a single call from python into Tcl"""
+
+def _define_run_commands(app: _tkinter.TkappType) -> None:
+    app.eval(_RUN_COMMANDS_PROC)
+
+def _run_commands(app: _tkinter.TkappType, commands: t.Sequence[_Command]) -> None:
+    """
+    Run the given commands, each a tuple of the command words, in one call. Arguments are passed as Tcl objects,
+    so they don't have to be quoted.
+    """
+    app.call(_RUN_COMMANDS, tuple(commands))
+
+class _CommandBuffer:
+    """
+    Collects canvas commands while it is open and sends them all at once when the outermost `collect` block is left.
+    Sending every command as its own call means converting the arguments and crossing from python into Tcl for
+    every single coordinate update.
+    """
+    __slots__: t.Sequence[str] = ("_send", "_commands", "_depth")
+
+    def __init__(self, send: t.Callable[[list[_Command]], None]) -> None:
+        self._send = send
+        self._commands: list[_Command] = []
+        self._depth = 0
+
+    def __len__(self) -> int:
+        return len(self._commands)
+
+    @contextlib.contextmanager
+    def collect(self) -> t.Iterator[None]:
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                self.flush()
+
+    def add(self, *command: t.Any) -> bool:
+        """
+        Add the command to the buffer. Returns False if the buffer isn't collecting, the command has to be run now then.
+        """
+        if self._depth == 0:
+            return False
+
+        self._commands.append(command)
+        return True
+
+    def flush(self) -> None:
+        """
+        Send the collected commands now, e.g. because the canvas is queried and has to be up to date
+        """
+        if not self._commands:
+            return
+
+        commands, self._commands = self._commands, []
+        # Commands run while sending must not end up in the buffer again
+        depth, self._depth = self._depth, 0
+        try:
+            self._send(commands)
+        finally:
+            self._depth = depth
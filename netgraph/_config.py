@@ -33,15 +33,17 @@ __all__: t.Sequence[str] = (
     "NetConfig",
     "EdgeConfig",
     "NodeConfig",
-    "EdgeTextConfig"
+    "EdgeTextConfig",
+    "LODConfig",
+    "RasterConfig"
 )
 
-@dataclass
+@dataclass(eq=False)
 class EdgeTextConfig(_config.EdgeTextConfig):
     gap: int = 0
     color: str = "black"
 
-@dataclass
+@dataclass(eq=False)
 class EdgeConfig(_config.EdgeConfig):
     factory: type[CanvasEdge] = CanvasEdgeImpl
     antialiased: bool = False
@@ -53,15 +55,37 @@ class EdgeConfig(_config.EdgeConfig):
     offset: int = -150
     line_segments: int = 30
 
-@dataclass
+@dataclass(eq=False)
 class NodeConfig(_config.NodeConfig):
     factory: type[CanvasNode] = CanvasNodeImpl
     antialiased: bool = True
     enable_dragging: bool = True
     label_color: str = "black"
+    sprite: bool = False
+
+@dataclass(eq=False)
+class LODConfig(_config.LODConfig):
+    text_zoom: float = 0.6
+    border_zoom: float = 0.5
+    antialias_zoom: float = 0.75
+    spline_zoom: float = 1.0
+    min_spline_steps: int = 4
+
+@dataclass(eq=False)
+class RasterConfig(_config.RasterConfig):
+    tile_size: int = 256
+    cache_size: int = 128
+    max_live: int = 2000
 
 @dataclass
 class NetConfig(_config.NetConfig):
     enable_zoom: bool = True
+    frame_rate: t.Optional[int] = None
+    item_pool_size: int = 4096
+    virtualize: bool = False
+    viewport_margin: float = 256
+    raster: bool = False
+    raster_config: RasterConfig = RasterConfig()
+    lod_config: LODConfig = LODConfig()
     edge_config: EdgeConfig = EdgeConfig()
     node_config: NodeConfig = NodeConfig()
\ No newline at end of file
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+# Copyright © YodaPY 2024-present
+#
+# This file is part of tk-netgraph.
+#
+# tk-netgraph is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# tk-netgraph is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with tk-netgraph. If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import functools
+import typing as t
+
+if t.TYPE_CHECKING:
+    import tkinter as tk
+
+    from netgraph import NetCanvas
+
+_Callback = t.Callable[["tk.Event"], t.Any]
+_HandlerTable = t.Mapping[str, t.Sequence[str]]
+"""The names of the methods of an owner that are called for each sequence, see `_EventDispatcher.attach`"""
+
+_PRESS: t.Final[str] = "<ButtonPress-1>"
+_MOTION: t.Final[str] = "<B1-Motion>"
+_RELEASE: t.Final[str] = "<ButtonRelease-1>"
+
+_ALIASES: t.Final[dict[str, str]] = {
+    "<Button-1>": _PRESS,
+    "<1>": _PRESS,
+    "<ButtonPress-1>": _PRESS,
+    "<B1-Motion>": _MOTION,
+    "<ButtonRelease-1>": _RELEASE,
+}
+"""The spellings of the sequences the dispatcher handles"""
+
+def _canonical_sequence(sequence: str) -> t.Optional[str]:
+    """
+    The sequence the dispatcher handles the given sequence as, None if it isn't handled by the dispatcher
+    """
+    return _ALIASES.get(sequence)
+
+class _EventDispatcher:
+    """
+    Delivers the mouse events of all object containers from one set of canvas bindings instead of
+    a few tag bindings per container, which tkinter has to create, keep and delete a command for each.
+    Handlers are registered per container tag. A press resolves the container of the item under the mouse
+    once, the motion and release events of the drag go to the same container with a dict lookup.
+    """
+    __slots__: t.Sequence[str] = ("_canvas", "_handlers", "_owners", "_target")
+
+    def __init__(self, canvas: NetCanvas) -> None:
+        self._canvas = canvas
+        self._handlers: dict[str, dict[str, list[_Callback]]] = {}
+        self._owners: dict[str, tuple[object, _HandlerTable]] = {}
+        self._target: t.Optional[str] = None
+
+        for sequence in (_PRESS, _MOTION, _RELEASE):
+            self._canvas.bind(sequence, functools.partial(self._dispatch, sequence), "+")
+
+    @property
+    def target(self) -> t.Optional[str]:
+        """
+        The tag of the container that receives the events of the current drag
+        """
+        return self._target
+
+    def bind(self, tag: str, sequence: str, callback: _Callback) -> None:
+        """
+        Call the callback when the event happens on an item of the container with the given tag.
+        Sequences other than pressing, dragging and releasing the left mouse button are bound as tag bindings.
+        """
+        canonical = _canonical_sequence(sequence)
+        if canonical is None:
+            self._canvas.tag_bind(tag, sequence, callback, "+")
+            return
+
+        self._handlers.setdefault(tag, {}).setdefault(canonical, []).append(callback)
+
+    def attach(self, tag: str, owner: object, table: _HandlerTable) -> None:
+        """
+        Call the methods the table names for a sequence on the owner when the event happens on an item of the
+        container with the given tag, before the callbacks registered with `bind`. The tables are shared by all
+        owners of a kind, so this costs one entry per container instead of a bound method and list per callback.
+        """
+        self._owners[tag] = (owner, table)
+
+    def forget(self, tag: str) -> None:
+        """
+        Remove all handlers of the container with the given tag
+        """
+        self._handlers.pop(tag, None)
+        self._owners.pop(tag, None)
+        if self._target == tag:
+            self._target = None
+
+    def _find_target(self) -> t.Optional[str]:
+        items = self._canvas.find_withtag("current")
+        if not items:
+            return None
+
+        for tag in self._canvas.gettags(items[0]):
+            if tag in self._owners or tag in self._handlers:
+                return tag
+
+        return None
+
+    def _dispatch(self, sequence: str, event: tk.Event) -> None:
+        if sequence == _PRESS:
+            self._target = self._find_target()
+
+        if self._target is None:
+            return
+
+        # The handlers might forget the target, e.g. if the object is removed
+        target = self._target
+        if sequence == _RELEASE:
+            self._target = None
+
+        if (entry := self._owners.get(target)) is not None:
+            owner, table = entry
+            for name in table.get(sequence, ()):
+                getattr(owner, name)(event)
+
+        for callback in list(self._handlers.get(target, {}).get(sequence, ())):
+            callback(event)
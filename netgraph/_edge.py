@@ -22,23 +22,44 @@ import tkinter as tk
 import typing as t
 
 from netgraph.api import _edge
-from netgraph._objects import _ObjectContainer,  CanvasEdgeTextObject, _convert_to_canvas_objects
+from netgraph._dispatch import _MOTION, _PRESS
+from netgraph._objects import _ObjectContainer,  CanvasEdgeTextObject
 from netgraph import _math
+from netgraph._lod import _spline_tag
 
 if t.TYPE_CHECKING:
     from netgraph import NetCanvas, NetManager, EdgeTextConfig
-    from netgraph.api._node import CanvasNode
     from netgraph.api import _config, _objects
+    from netgraph.api._node import CanvasNode
     from netgraph._types import CanvasObjectsLike
 
 __all__: t.Sequence[str] = (
     "CanvasEdge",
 )
 
+_VECTORIZE_THRESHOLD: t.Final[int] = 16
+"""Below this number of edges computing the geometry edge by edge is faster than building the arrays"""
+
+class _EdgeGeometry(t.NamedTuple):
+    """The canvas coordinates of an edge"""
+    points: tuple[float, ...]
+    anchor: tuple[float, float]
+    """The point the edge texts are placed around before their gap is applied"""
+    normal: tuple[float, float]
+    """The unit vector the gap of the edge texts is applied along"""
+    angle: t.Optional[float]
+    """The angle of the edge texts, None if the texts keep their angle"""
+
+    def text_position(self, gap: float) -> tuple[float, float]:
+        return self.anchor[0] + self.normal[0] * gap, self.anchor[1] + self.normal[1] * gap
+
+_SELFLOOP_NORMAL: t.Final[tuple[float, float]] = (0.0, -1.0)
+_HANDLERS: t.Final[dict[str, tuple[str, ...]]] = {_PRESS: ("_drag_start",), _MOTION: ("_drag",)}
+
 class CanvasEdge(_edge.CanvasEdge):
     __slots__: t.Sequence[str] = (
-        "_manager", "_canvas", "_nodes", "_label", "_weight", 
-        "_obj_container", "_config", "_pan_data", "_component_id", "_position"
+        "_manager", "_canvas", "_nodes", "_slot", "_label",
+        "_obj_container", "_config", "_pan_data", "_drag_tag", "_position", "_geometry"
     )
 
     def __init__(
@@ -55,8 +76,8 @@ class CanvasEdge(_edge.CanvasEdge):
         self._manager = manager
         self._canvas = canvas
         self._nodes = nodes
+        self._slot = manager.edge_store.add(weight)
         self._label = label
-        self._weight = weight
 
         self._config = config
 
@@ -64,52 +85,12 @@ class CanvasEdge(_edge.CanvasEdge):
 
         self._position = 0
 
-        self._component_id: t.Optional[str] = None
-
-        _node_comp_ids = [node.component_id for node in self._nodes]
-        _new_objects: list[t.Union[CanvasNode, _edge.CanvasEdge]] = [self]
-
-        # Logic to add edge and the given nodes to the graph component manager
-
-        # Both nodes are part of different graph components
-        # Choose one component and add the nodes and edges of the other component to the new one
-        if (new_id := _node_comp_ids[0]) != (old_id := _node_comp_ids[1]) and all(_node_comp_ids):
-            objs = self._manager.component_manager[old_id]
-            for obj in objs:
-                obj.obj_container.remove_tag(old_id)
-            _new_objects.extend(objs)
-            del self._manager.component_manager[old_id]
+        self._drag_tag: t.Optional[str] = None
+        self._geometry: t.Optional[_EdgeGeometry] = None
 
-        # The first node is part of a component, the second one is a node not connected to any other nodes
-        # Add the second node to the component of the first node
-        elif (new_id := _node_comp_ids[0]) is not None and _node_comp_ids[1] is None:
-            _new_objects.append(self._nodes[1])
+        self._manager.component_manager.add_edge(self)
 
-        # The second node is part of a component, the first one is a node not connected to any other nodes
-        # Add the first one to the component of the second node
-        elif (new_id := _node_comp_ids[1]) is not None and _node_comp_ids[0] is None:
-            _new_objects.append(self._nodes[0])
-
-        # Both nodes are part of the same component
-        elif any(_node_comp_ids):
-            new_id = _node_comp_ids[0]
-
-        # Neither of the nodes are part of a component
-        # Create a new component
-        else:
-            new_id = self._manager.component_manager.add_component()
-            _new_objects.extend(self._nodes)
-
-        
-        # Add all new objects to the component, the edge as well
-        for object in _new_objects:
-            object.component_id = new_id
-            object.obj_container.add_tag(new_id) # make sure the objects have an additional tag, the component id so you're able to select a specific component
-        
-        self._manager.component_manager[new_id].extend(_new_objects)
-
-        self._canvas.tag_bind(self.canvas_id, "<Button-1>", self._drag_start, "+")
-        self._canvas.tag_bind(self.canvas_id, "<B1-Motion>", self._drag, "+")
+        self._canvas.dispatcher.attach(self.canvas_id, self, _HANDLERS)
 
     @property
     def manager(self) -> NetManager:
@@ -117,24 +98,28 @@ class CanvasEdge(_edge.CanvasEdge):
 
     @property
     def component_id(self) -> t.Optional[str]:
-        return self._component_id
-    
-    @component_id.setter
-    def component_id(self, id_: t.Optional[str]) -> None:
-        self._component_id = id_
+        return self._manager.component_manager.get_tag(self)
 
     def _drag_start(self, event: tk.Event):
         self._pan_data = (event.x, event.y)
 
+        if self._config.drag_mode is _edge.DragMode.COMPONENT_ONLY:
+            self._drag_tag = self._manager.component_manager.materialize(self)
+        elif self._config.drag_mode is _edge.DragMode.ALL:
+            self._manager.start_pan(event)
+
     def _drag(self, event: tk.Event):
         delta_x = event.x - self._pan_data[0]
         delta_y = event.y - self._pan_data[1]
 
         if self._config.drag_mode is _edge.DragMode.COMPONENT_ONLY:
-            self._canvas.move(self._component_id, delta_x, delta_y)
+            self._canvas.scheduler.move(t.cast(str, self._drag_tag), delta_x, delta_y)
+            for node in self._manager.component_manager.nodes(self):
+                node.on_move(delta_x, delta_y)
 
         elif self._config.drag_mode is _edge.DragMode.ALL:
-            self._canvas.move(tk.ALL, delta_x, delta_y)
+            # Scrolling the view moves every object at once without touching a single one of them
+            self._manager.pan(event)
 
         self._pan_data = (event.x, event.y)
 
@@ -142,6 +127,23 @@ class CanvasEdge(_edge.CanvasEdge):
     def canvas(self) -> NetCanvas:
         return self._canvas
 
+    @property
+    def slot(self) -> int:
+        """
+        The slot of the edge in the edge store of its manager, raises RuntimeError once the edge was removed
+        """
+        if self._slot < 0:
+            raise RuntimeError("The edge was removed from its manager")
+
+        return self._slot
+
+    def release(self) -> None:
+        """
+        Give the slot of the edge in the edge store back, called by the manager once the edge was removed
+        """
+        self._manager.edge_store.release(self.slot)
+        self._slot = -1
+
     @property
     def endpoints(self) -> tuple[CanvasNode, CanvasNode]:
         return self._nodes
@@ -149,6 +151,11 @@ class CanvasEdge(_edge.CanvasEdge):
     @property
     def label(self) -> str:
         return self._label
+
+    @label.setter
+    def label(self, label: str) -> None:
+        self._label = label
+        self._configure_text(self._config.label_config, label)
     
     @property
     def canvas_id(self) -> str:
@@ -164,7 +171,17 @@ class CanvasEdge(_edge.CanvasEdge):
 
     @property
     def weight(self) -> t.Optional[int]:
-        return self._weight
+        return self._manager.edge_store.weight(self.slot)
+
+    @weight.setter
+    def weight(self, weight: t.Optional[int]) -> None:
+        self._manager.edge_store.set_weight(self.slot, weight)
+        self._configure_text(self._config.weight_config, str(weight) if weight else "")
+
+    def _configure_text(self, config: EdgeTextConfig, text: str) -> None:
+        for item, obj in self._obj_container.items():
+            if isinstance(obj, CanvasEdgeTextObject) and obj.config is config:
+                self._canvas.scheduler.configure(item, text=text)
     
     @property
     def position(self) -> int:
@@ -179,63 +196,132 @@ class CanvasEdge(_edge.CanvasEdge):
         return self._nodes[0] == self._nodes[1]
     
     def update(self) -> None:
-        if self.is_selfloop:
-            node = self._nodes[0]
-            box = self._canvas.bbox(node.canvas_id)
-            offset = abs(self._config.offset) / 2 * self._position
-            points = _math._calc_selfloop_points(box, offset)
-        
-        else:
-            node1_pos = self._nodes[0].get_center()
-            node2_pos = self._nodes[1].get_center()
-
-            distance = self._config.offset * self._position
-            center_point = _math._calc_curved_center(node1_pos, node2_pos, distance)
-            points = (*node1_pos, *center_point, *node2_pos)
-
-        self._obj_container.coords(*points)
+        self._apply_geometry(_compute_geometry(self))
+
+    def _apply_geometry(self, geometry: _EdgeGeometry) -> None:
+        for item, obj in self._obj_container.items():
+            if obj is None:
+                self._canvas.coords(item, *geometry.points)
+            elif isinstance(obj, CanvasEdgeTextObject):
+                obj.place(*geometry.text_position(obj.config.gap), angle=geometry.angle)
+            else:
+                obj.coords(*geometry.points)
     
     def draw(self) -> CanvasObjectsLike:
-        node1_pos = self._nodes[0].get_center()
-        node2_pos = self._nodes[1].get_center()
-
-        if self.is_selfloop:
-            node = self._nodes[0]
-            box = self._canvas.bbox(node.canvas_id)
-            offset = abs(self._config.offset) / 2 * self._position
-            points = _math._calc_selfloop_points(box, offset)
-            x, y = _math._calc_selfloop_text_pos(box, offset)
-            label_point = x, y - self._config.label_config.gap
-            weight_point = x, y - self._config.weight_config.gap
+        geometry, self._geometry = self._geometry or _compute_geometry(self), None
+        detail = self._manager.detail
+        segments = self._config.line_segments
 
-        else:
-            distance = self._config.offset * self._position
-            center_point = _math._calc_curved_center(node1_pos, node2_pos, distance)
-
-            # Smoothed out lines actually dont contain the given mid point
-            # this has to be reversed so the label and weight are centered around the line correctly
-            # calculate the mid point with 1/2 of the actual offset
-            label_point = weight_point = _math._calc_offset_point(center_point, node1_pos, node2_pos, distance / 2)
-            points = (*node1_pos, *center_point, *node2_pos)
-
-        yield from self._canvas.create_aa_line(*points, fill="#000", width=1.5, smooth=True, splinesteps=self._config.line_segments)
-        yield from self._draw_text(self._label, label_point, config=self._config.label_config)
-        yield from self._draw_text(str(self._weight) if self._weight else "", weight_point, config=self._config.weight_config)
-
-    def _draw_text(self, text: str, pos: tuple[float, float], *, config: EdgeTextConfig) -> CanvasObjectsLike:
-        node1_pos = self._nodes[0].get_center()
-        node2_pos = self._nodes[1].get_center()
-        x, y, angle = (
-            _math._calc_text_position(pos, node1_pos, node2_pos, config.gap)
-            if self.is_selfloop is False
-            else (*pos, 0)
+        yield from self._canvas.create_aa_line(
+            *geometry.points, fill="#000", width=1.5, smooth=True, splinesteps=detail.spline_steps(segments),
+            tags=_spline_tag(segments), antialias=detail.antialias
         )
+        if detail.text:
+            yield from self._draw_text(self._label, geometry, config=self._config.label_config)
+            yield from self._draw_text(str(weight) if (weight := self.weight) else "", geometry, config=self._config.weight_config)
+
+    def _draw_text(self, text: str, geometry: _EdgeGeometry, *, config: EdgeTextConfig) -> CanvasObjectsLike:
+        x, y = geometry.text_position(config.gap)
         yield CanvasEdgeTextObject(self._canvas.create_text(
-            x, y, text=text, angle=angle, fill=config.color
+            x, y, text=text, angle=geometry.angle or 0, fill=config.color
         ), self._canvas, edge=self, config=config)
 
     def render(self) -> None:
-        ids = self.draw()
-        objects = _convert_to_canvas_objects(self._canvas, ids)
-        self._obj_container.add(*objects)
-        self._obj_container.lower()
+        if self._manager.defer_render(self):
+            # A geometry prepared for this render is outdated by the time the edge is drawn
+            self._geometry = None
+            return
+
+        self._obj_container.render(self.draw())
+        self._manager.restack(self)
+
+def _compute_geometry(edge: CanvasEdge) -> _EdgeGeometry:
+    if edge.is_selfloop:
+        box = edge.endpoints[0].get_bbox()
+        offset = abs(edge.config.offset) / 2 * edge.position
+        return _EdgeGeometry(
+            _math._calc_selfloop_points(box, offset), _math._calc_selfloop_text_pos(box, offset), _SELFLOOP_NORMAL, None
+        )
+
+    node1_pos = edge.endpoints[0].get_center()
+    node2_pos = edge.endpoints[1].get_center()
+
+    distance = edge.config.offset * edge.position
+    center_x, center_y = _math._calc_curved_center(node1_pos, node2_pos, distance)
+    normal_x, normal_y = _math._calc_normal(node1_pos, node2_pos)
+
+    # Smoothed out lines actually dont contain the given mid point
+    # this has to be reversed so the label and weight are centered around the line correctly
+    # calculate the mid point with 1/2 of the actual offset
+    anchor = center_x + normal_x * distance / 2, center_y + normal_y * distance / 2
+    return _EdgeGeometry(
+        (*node1_pos, center_x, center_y, *node2_pos), anchor, (normal_x, normal_y),
+        _math._calc_text_angle(node1_pos, node2_pos)
+    )
+
+def _compute_geometries(edges: t.Sequence[CanvasEdge]) -> list[_EdgeGeometry]:
+    """
+    Compute the geometry of many edges at once. With numpy installed, the geometry of all edges is computed
+    with a few array operations instead of one function call per edge and text.
+    """
+    np = _math.np
+    if np is None or len(edges) < _VECTORIZE_THRESHOLD:
+        return [_compute_geometry(edge) for edge in edges]
+
+    geometries: list[t.Optional[_EdgeGeometry]] = [None] * len(edges)
+    lines = [index for index, edge in enumerate(edges) if not edge.is_selfloop]
+    loops = [index for index, edge in enumerate(edges) if edge.is_selfloop]
+
+    if lines:
+        node1_pos = np.array([edges[index].endpoints[0].get_center() for index in lines], dtype=float)
+        node2_pos = np.array([edges[index].endpoints[1].get_center() for index in lines], dtype=float)
+        distance = np.array([edges[index].config.offset * edges[index].position for index in lines], dtype=float)
+
+        center = _math._calc_curved_center_array(node1_pos, node2_pos, distance)
+        normal = _math._calc_normal_array(node1_pos, node2_pos)
+        anchor = center + normal * (distance / 2)[:, None]
+        angle = _math._calc_text_angle_array(node1_pos, node2_pos)
+        points = np.hstack((node1_pos, center, node2_pos))
+
+        # tolist converts to python floats which tkinter handles faster than numpy scalars
+        for index, line_points, line_anchor, line_normal, line_angle in zip(
+            lines, points.tolist(), anchor.tolist(), normal.tolist(), angle.tolist()
+        ):
+            geometries[index] = _EdgeGeometry(tuple(line_points), tuple(line_anchor), tuple(line_normal), line_angle)
+
+    if loops:
+        box = np.array([edges[index].endpoints[0].get_bbox() for index in loops], dtype=float)
+        offset = np.array([abs(edges[index].config.offset) / 2 * edges[index].position for index in loops], dtype=float)
+
+        points = _math._calc_selfloop_points_array(box, offset)
+        anchor = _math._calc_selfloop_text_pos_array(box, offset)
+        for index, loop_points, loop_anchor in zip(loops, points.tolist(), anchor.tolist()):
+            geometries[index] = _EdgeGeometry(tuple(loop_points), tuple(loop_anchor), _SELFLOOP_NORMAL, None)
+
+    return t.cast(list[_EdgeGeometry], geometries)
+
+def _uses_default_geometry(edge: _edge.CanvasEdge) -> bool:
+    return isinstance(edge, CanvasEdge) and type(edge).update is CanvasEdge.update
+
+def _update_edges(edges: t.Iterable[_edge.CanvasEdge]) -> None:
+    """
+    Update the canvas objects of all given edges, computing the geometry of the edges in one go.
+    Edges that override `update` are updated one by one.
+    """
+    batch: list[CanvasEdge] = []
+    for edge in edges:
+        if _uses_default_geometry(edge):
+            batch.append(t.cast(CanvasEdge, edge))
+        else:
+            edge.update()
+
+    for edge, geometry in zip(batch, _compute_geometries(batch)):
+        edge._apply_geometry(geometry)
+
+def _prepare_geometries(edges: t.Iterable[_edge.CanvasEdge]) -> None:
+    """
+    Compute the geometry of all given edges in one go before they are drawn one by one
+    """
+    batch = [t.cast(CanvasEdge, edge) for edge in edges if _uses_default_geometry(edge)]
+    for edge, geometry in zip(batch, _compute_geometries(batch)):
+        edge._geometry = geometry
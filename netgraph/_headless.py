@@ -0,0 +1,513 @@
+# -*- coding: utf-8 -*-
+# Copyright © YodaPY 2024-present
+#
+# This file is part of tk-netgraph.
+#
+# tk-netgraph is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# tk-netgraph is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with tk-netgraph. If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import collections
+import itertools
+import tkinter as tk
+import typing as t
+
+try:
+    from PIL import ImageColor
+except ImportError: # Pillow is optional, colors can only be resolved with it
+    ImageColor = None # type: ignore[assignment]
+
+from netgraph._canvas import NetCanvas, _AA_CIRCLE_TAG
+from netgraph._dispatch import _canonical_sequence
+
+__all__: t.Sequence[str] = (
+    "HeadlessCanvas",
+)
+
+_CHAR_WIDTH: t.Final[float] = 7.0 # Approximated width of a single character of the default font
+_LINE_HEIGHT: t.Final[float] = 15.0 # Approximated height of a single line of the default font
+
+
+class _HeadlessItem:
+    __slots__: t.Sequence[str] = ("kind", "coords", "tags", "options", "z")
+
+    def __init__(self, kind: str, coords: list[float], tags: list[str], options: dict[str, t.Any], z: float) -> None:
+        self.kind = kind
+        self.coords = coords
+        self.tags = tags
+        self.options = options
+        self.z = z
+
+    def bbox(self) -> tuple[float, float, float, float]:
+        if self.kind == "aa_circle":
+            x, y = self.coords
+            radius = self.options["radius"]
+            return x - radius, y - radius, x + radius, y + radius
+
+        if self.kind in ("text", "image"):
+            x, y = self.coords
+            if self.kind == "text":
+                lines = str(self.options.get("text", "")).split("\n")
+                half_width = max(len(line) for line in lines) * _CHAR_WIDTH / 2
+                half_height = len(lines) * _LINE_HEIGHT / 2
+            else:
+                half_width, half_height = self.options.get("size", (0, 0))
+                half_width, half_height = half_width / 2, half_height / 2
+            return x - half_width, y - half_height, x + half_width, y + half_height
+
+        xs = self.coords[0::2]
+        ys = self.coords[1::2]
+        pad = float(self.options.get("width", 1.0)) / 2
+        return min(xs) - pad, min(ys) - pad, max(xs) + pad, max(ys) + pad
+
+
+def _flatten(args: t.Iterable[t.Any]) -> list[float]:
+    coords: list[float] = []
+    for arg in args:
+        if isinstance(arg, (tuple, list)):
+            coords.extend(float(value) for value in arg)
+        else:
+            coords.append(float(arg))
+
+    return coords
+
+
+class HeadlessCanvas(NetCanvas):
+    """
+    An in-memory canvas backend that implements the subset of the tkinter canvas API used by netgraph.
+    Items, their geometry and their tags are kept in indexed Python structures so the graph engine can be
+    exercised and profiled without a display. Every canvas call is counted in `calls`.
+    """
+    __slots__: t.Sequence[str] = (
+        "_items", "_tag_index", "_item_ids", "_bottom", "_top", "_options",
+        "_tag_bindings", "_bindings", "_timers", "_timer_ids", "_calls", "_w", "_current", "_image_ids",
+        "_image_sizes"
+    )
+
+    def __init__(self, *, width: int = 800, height: int = 600, bg: str = "white") -> None:
+        self._items: dict[int, _HeadlessItem] = {}
+        self._tag_index: collections.defaultdict[str, set[int]] = collections.defaultdict(set)
+        self._item_ids = itertools.count(1)
+        self._bottom = 0.0
+        self._top = 0.0
+
+        self._options: dict[str, t.Any] = {"width": width, "height": height, "bg": bg, "cursor": ""}
+        self._tag_bindings: collections.defaultdict[tuple[str, str], list[t.Callable[..., t.Any]]] = collections.defaultdict(list)
+        self._bindings: collections.defaultdict[str, list[t.Callable[..., t.Any]]] = collections.defaultdict(list)
+        self._timers: dict[str, tuple[t.Callable[..., t.Any], tuple[t.Any, ...]]] = {}
+        self._timer_ids = itertools.count()
+        # The canvas coordinates of the top left corner of the window
+        self._view_origin = [0.0, 0.0]
+        self._scan_mark = (0, 0, 0.0, 0.0)
+
+        self._calls: collections.Counter[str] = collections.Counter()
+        # The item under the mouse, addressed by the "current" tag
+        self._current: t.Optional[int] = None
+        self._w = ".!headlesscanvas"
+        # Images only exist as names, the size is all that is needed for their bounding box
+        self._image_ids = itertools.count(1)
+        self._image_sizes: dict[str, tuple[int, int]] = {}
+        self._aa_circle_canvas_ids: set[int] = set()
+
+        self._init_net_canvas()
+
+    @property
+    def calls(self) -> collections.Counter[str]:
+        """
+        The number of calls made to each canvas method
+        """
+        return self._calls
+
+    @property
+    def item_count(self) -> int:
+        return len(self._items)
+
+    def _resolve(self, tag_or_id: t.Union[str, int], *, ordered: bool = True) -> list[int]:
+        """
+        Returns the IDs of all items matching the given tag or ID, in stacking order if `ordered` is True
+        """
+        if isinstance(tag_or_id, int) or (isinstance(tag_or_id, str) and tag_or_id.isdigit()):
+            id_ = int(tag_or_id)
+            return [id_] if id_ in self._items else []
+
+        if tag_or_id == "current":
+            return [self._current] if self._current in self._items else []
+
+        if tag_or_id == "all":
+            ids: t.Iterable[int] = self._items
+        else:
+            ids = self._tag_index.get(tag_or_id, ())
+
+        if not ordered:
+            return list(ids)
+
+        return sorted(ids, key=lambda id_: self._items[id_].z)
+
+    def _create(self, kind: str, coords: list[float], options: dict[str, t.Any]) -> int:
+        # The item keeps its own copy, which is memory of the canvas like the items of a real canvas living in Tk
+        options = dict(options)
+        tags = options.pop("tags", ())
+        if isinstance(tags, str):
+            tags = tags.split() if tags else []
+
+        tags = (*tags, *self._creation_tags)
+
+        id_ = next(self._item_ids)
+        self._top += 1
+        self._items[id_] = _HeadlessItem(kind, coords, list(dict.fromkeys(tags)), options, self._top)
+        for tag in self._items[id_].tags:
+            self._tag_index[tag].add(id_)
+
+        return id_
+
+    def create_line(self, *args: t.Any, **kwargs: t.Any) -> int:
+        return self._create_pooled("line", self._create_line, args, self._add_creation_tags(kwargs))
+
+    def _create_line(self, *args: t.Any, **kwargs: t.Any) -> int:
+        self._calls["create_line"] += 1
+        return self._create("line", _flatten(args), kwargs)
+
+    def create_text(self, *args: t.Any, **kwargs: t.Any) -> int:
+        return self._create_pooled("text", self._create_text, args, self._add_creation_tags(kwargs))
+
+    def _create_text(self, *args: t.Any, **kwargs: t.Any) -> int:
+        self._calls["create_text"] += 1
+        return self._create("text", _flatten(args), kwargs)
+
+    def create_image(self, *args: t.Any, **kwargs: t.Any) -> int:
+        return self._create_pooled("image", self._create_image, args, self._add_creation_tags(kwargs))
+
+    def _create_image(self, *args: t.Any, **kwargs: t.Any) -> int:
+        self._calls["create_image"] += 1
+        if "image" in kwargs and "size" not in kwargs:
+            kwargs["size"] = self._image_sizes.get(kwargs["image"], (0, 0))
+
+        return self._create("image", _flatten(args), kwargs)
+
+    def photo_image(self, image: t.Any) -> str:
+        self._calls["photo_image"] += 1
+        name = f"pyimage{next(self._image_ids)}"
+        self._image_sizes[name] = image.size
+        return name
+
+    def _create_aa_circle(self, x_pos: int, y_pos: int, radius: int, *, tags: t.Any = (), **kwargs: t.Any) -> int:
+        self._calls["create_aa_circle"] += 1
+        tags = tags.split() if isinstance(tags, str) else tags
+        id_ = self._create(
+            "aa_circle", [float(x_pos), float(y_pos)], {"radius": radius, "tags": (*tags, _AA_CIRCLE_TAG), **kwargs}
+        )
+        self._aa_circle_canvas_ids.add(id_)
+        return id_
+
+    def _send_commands(self, commands: list[tuple[t.Any, ...]]) -> None:
+        # One call for all commands, like NetCanvas which sends them as a single Tcl script
+        self._calls["run_commands"] += 1
+        calls, self._calls = self._calls, collections.Counter()
+        try:
+            for name, tag_or_id, *args in commands:
+                if name == "itemconfigure":
+                    self.itemconfig(tag_or_id, **{option[1:]: value for option, value in zip(args[0::2], args[1::2])})
+                else:
+                    getattr(self, name)(tag_or_id, *args)
+        finally:
+            self._calls = calls
+
+    def coords(self, tag_or_id: t.Union[str, int], *args: t.Any) -> list[float]:
+        if args and self._commands.add("coords", tag_or_id, *args):
+            return []
+
+        self._commands.flush()
+        self._calls["coords"] += 1
+        ids = self._resolve(tag_or_id)
+        if not ids:
+            return []
+
+        item = self._items[ids[0]]
+        if args:
+            positions = _flatten(args)
+            if item.kind == "aa_circle" and len(positions) == 3:
+                item.options["radius"] = positions.pop()
+
+            item.coords = positions
+
+        return list(item.coords)
+
+    def bbox(self, *args: t.Union[str, int]) -> t.Optional[tuple[int, int, int, int]]:
+        self._commands.flush()
+        self._calls["bbox"] += 1
+        # Like tkinter, hidden items have no bounding box
+        boxes = [
+            item.bbox() for tag in args for id_ in self._resolve(tag, ordered=False)
+            if (item := self._items[id_]).options.get("state") != "hidden"
+        ]
+        if not boxes:
+            return None
+
+        return (
+            int(min(box[0] for box in boxes)),
+            int(min(box[1] for box in boxes)),
+            int(max(box[2] for box in boxes)) + 1,
+            int(max(box[3] for box in boxes)) + 1
+        )
+
+    def move(self, tag_or_id: t.Union[str, int], x_amount: float, y_amount: float) -> None:
+        if self._commands.add("move", tag_or_id, x_amount, y_amount):
+            return
+
+        self._calls["move"] += 1
+        for id_ in self._resolve(tag_or_id, ordered=False):
+            coords = self._items[id_].coords
+            coords[0::2] = [x + x_amount for x in coords[0::2]]
+            coords[1::2] = [y + y_amount for y in coords[1::2]]
+
+    def scale(self, tag_or_id: t.Union[str, int], x_origin: float, y_origin: float, x_scale: float, y_scale: float) -> None:
+        self._calls["scale"] += 1
+        for id_ in self._resolve(tag_or_id, ordered=False):
+            coords = self._items[id_].coords
+            coords[0::2] = [x_origin + (x - x_origin) * x_scale for x in coords[0::2]]
+            coords[1::2] = [y_origin + (y - y_origin) * y_scale for y in coords[1::2]]
+
+    def addtag_withtag(self, new_tag: str, tag_or_id: t.Union[str, int]) -> None:
+        self._commands.flush()
+        self._calls["addtag_withtag"] += 1
+        for id_ in self._resolve(tag_or_id, ordered=False):
+            item = self._items[id_]
+            if id_ not in self._tag_index[new_tag]:
+                item.tags.append(new_tag)
+                self._tag_index[new_tag].add(id_)
+
+    def dtag(self, tag_or_id: t.Union[str, int], tag_to_delete: t.Optional[str] = None) -> None:
+        self._commands.flush()
+        self._calls["dtag"] += 1
+        if tag_to_delete is None:
+            tag_to_delete = t.cast(str, tag_or_id)
+
+        for id_ in self._resolve(tag_or_id, ordered=False):
+            item = self._items[id_]
+            if tag_to_delete in item.tags:
+                item.tags.remove(tag_to_delete)
+                self._tag_index[tag_to_delete].discard(id_)
+
+    def find_withtag(self, tag_or_id: t.Union[str, int]) -> tuple[int, ...]:
+        self._calls["find_withtag"] += 1
+        return tuple(self._resolve(tag_or_id))
+
+    def gettags(self, tag_or_id: t.Union[str, int]) -> tuple[str, ...]:
+        self._calls["gettags"] += 1
+        ids = self._resolve(tag_or_id)
+        return tuple(self._items[ids[0]].tags) if ids else ()
+
+    def type(self, tag_or_id: t.Union[str, int]) -> t.Optional[str]:
+        self._calls["type"] += 1
+        ids = self._resolve(tag_or_id)
+        if not ids:
+            return None
+
+        kind = self._items[ids[0]].kind
+        return "text" if kind == "aa_circle" else kind
+
+    def tag_bind(self, tag_or_id: t.Union[str, int], sequence: str, func: t.Callable[..., t.Any], add: t.Optional[str] = None) -> str:
+        self._calls["tag_bind"] += 1
+        callbacks = self._tag_bindings[(str(tag_or_id), sequence)]
+        if not add:
+            callbacks.clear()
+
+        callbacks.append(func)
+        return f"{id(func)}"
+
+    def tag_unbind(self, tag_or_id: t.Union[str, int], sequence: str, funcid: t.Optional[str] = None) -> None:
+        self._calls["tag_unbind"] += 1
+        self._tag_bindings.pop((str(tag_or_id), sequence), None)
+
+    def tag_lower(self, tag_or_id: t.Union[str, int], below: t.Optional[t.Union[str, int]] = None) -> None:
+        if self._commands.add("tag_lower", tag_or_id, below):
+            return
+
+        self._calls["tag_lower"] += 1
+        ids = self._resolve(tag_or_id)
+        if below is None:
+            # Keep the relative order of the lowered items, below every other item
+            for id_ in reversed(ids):
+                self._bottom -= 1
+                self._items[id_].z = self._bottom
+
+            return
+
+        anchor = self._resolve(below)
+        if not anchor:
+            return
+
+        anchor_z = self._items[anchor[0]].z
+        lower_z = max((item.z for item in self._items.values() if item.z < anchor_z), default=anchor_z - 1)
+        step = (anchor_z - lower_z) / (len(ids) + 1)
+        for index, id_ in enumerate(ids, start=1):
+            self._items[id_].z = lower_z + step * index
+
+    def tag_raise(self, tag_or_id: t.Union[str, int], above: t.Optional[t.Union[str, int]] = None) -> None:
+        if self._commands.add("tag_raise", tag_or_id, above):
+            return
+
+        self._calls["tag_raise"] += 1
+        for id_ in self._resolve(tag_or_id):
+            self._top += 1
+            self._items[id_].z = self._top
+
+    def delete(self, *args: t.Union[str, int]) -> None:
+        self._commands.flush()
+        self._calls["delete"] += 1
+        self._forget_items(args)
+        for tag in args:
+            for id_ in self._resolve(tag, ordered=False):
+                item = self._items.pop(id_)
+                for item_tag in item.tags:
+                    self._tag_index[item_tag].discard(id_)
+
+    def itemconfig(self, tag_or_id: t.Union[str, int], **kwargs: t.Any) -> None:
+        options = [word for name, value in kwargs.items() for word in (f"-{name}", value)]
+        if self._commands.add("itemconfigure", tag_or_id, *options):
+            return
+
+        self._commands.flush()
+        self._calls["itemconfig"] += 1
+        tags = kwargs.pop("tags", None)
+        if "image" in kwargs:
+            kwargs["size"] = self._image_sizes.get(kwargs["image"], (0, 0))
+
+        for id_ in self._resolve(tag_or_id, ordered=False):
+            item = self._items[id_]
+            item.options.update(kwargs)
+            if tags is not None:
+                # Like tkinter, the given tags replace the tags of the item
+                for tag in item.tags:
+                    self._tag_index[tag].discard(id_)
+
+                item.tags = list(dict.fromkeys(tags.split() if isinstance(tags, str) else tags))
+                for tag in item.tags:
+                    self._tag_index[tag].add(id_)
+
+    itemconfigure = itemconfig
+
+    def itemcget(self, tag_or_id: t.Union[str, int], option: str) -> t.Any:
+        self._calls["itemcget"] += 1
+        ids = self._resolve(tag_or_id)
+        return self._items[ids[0]].options.get(option, "") if ids else ""
+
+    def cget(self, key: str) -> t.Any:
+        self._calls["cget"] += 1
+        return self._options.get(key, "")
+
+    def config(self, **kwargs: t.Any) -> None:  # type: ignore[override]
+        self._calls["config"] += 1
+        self._options.update(kwargs)
+
+    configure = config
+
+    def bind(self, sequence: str, func: t.Callable[..., t.Any], add: t.Optional[str] = None) -> str:  # type: ignore[override]
+        self._calls["bind"] += 1
+        if not add:
+            self._bindings[sequence].clear()
+
+        self._bindings[sequence].append(func)
+        return f"{id(func)}"
+
+    def unbind(self, sequence: str, funcid: t.Optional[str] = None) -> None:
+        self._calls["unbind"] += 1
+        self._bindings.pop(sequence, None)
+
+    def event_generate(self, sequence: str, **kw: t.Any) -> None:
+        """
+        Deliver an event with the given attributes (e.g. x and y in window coordinates) to the canvas bindings.
+        Like tkinter, pressing the mouse button or moving it without a pressed button makes the topmost item under
+        the mouse the "current" item. Tag bindings are not called.
+        """
+        self._calls["event_generate"] += 1
+        event = tk.Event()
+        event.x, event.y = kw.pop("x", 0), kw.pop("y", 0)
+        for name, value in kw.items():
+            setattr(event, name, value)
+
+        if sequence == "<Motion>" or _canonical_sequence(sequence) == "<ButtonPress-1>":
+            self._current = self._find_current(self.canvasx(event.x), self.canvasy(event.y))
+
+        sequences = {sequence, _canonical_sequence(sequence) or sequence}
+        for name in sequences:
+            for func in list(self._bindings.get(name, ())):
+                func(event)
+
+    def _find_current(self, x: float, y: float) -> t.Optional[int]:
+        under = [
+            id_ for id_, item in self._items.items()
+            if item.options.get("state") != "hidden"
+            and (box := item.bbox())[0] <= x <= box[2] and box[1] <= y <= box[3]
+        ]
+        return max(under, key=lambda id_: self._items[id_].z, default=None)
+
+    def canvasx(self, screenx: float, gridspacing: t.Optional[float] = None) -> float:
+        self._calls["canvasx"] += 1
+        return screenx + self._view_origin[0]
+
+    def canvasy(self, screeny: float, gridspacing: t.Optional[float] = None) -> float:
+        self._calls["canvasy"] += 1
+        return screeny + self._view_origin[1]
+
+    def scan_mark(self, x: int, y: int) -> None:
+        self._calls["scan_mark"] += 1
+        self._scan_mark = (x, y, *self._view_origin)
+
+    def scan_dragto(self, x: int, y: int, gain: int = 10) -> None:
+        # Like tkinter, the view only moves by whole pixels
+        self._calls["scan_dragto"] += 1
+        mark_x, mark_y, origin_x, origin_y = self._scan_mark
+        self._view_origin = [origin_x - gain * (int(x) - mark_x), origin_y - gain * (int(y) - mark_y)]
+
+    def winfo_rgb(self, color: str) -> tuple[int, int, int]:
+        # Only the colors Pillow knows, which covers the names and hex colors netgraph uses
+        if ImageColor is None:
+            raise RuntimeError("Resolving colors on a HeadlessCanvas requires Pillow")
+
+        red, green, blue = ImageColor.getrgb(color)[:3]
+        return red * 257, green * 257, blue * 257
+
+    def winfo_width(self) -> int:
+        return int(self._options["width"])
+
+    def winfo_height(self) -> int:
+        return int(self._options["height"])
+
+    def after(self, ms: t.Union[int, str], func: t.Optional[t.Callable[..., t.Any]] = None, *args: t.Any) -> str:
+        self._calls["after"] += 1
+        id_ = f"after#{next(self._timer_ids)}"
+        if func is not None:
+            self._timers[id_] = (func, args)
+
+        return id_
+
+    def after_idle(self, func: t.Callable[..., t.Any], *args: t.Any) -> str:
+        return self.after("idle", func, *args)
+
+    def after_cancel(self, id_: str) -> None:
+        self._calls["after_cancel"] += 1
+        self._timers.pop(id_, None)
+
+    def update_idletasks(self) -> None:
+        self.update()
+
+    def update(self) -> None:
+        """
+        Runs every callback that is pending at the time of the call.
+        Callbacks scheduled by those callbacks are run on the next call.
+        """
+        timers, self._timers = self._timers, {}
+        for func, args in timers.values():
+            func(*args)
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+# Copyright © YodaPY 2024-present
+#
+# This file is part of tk-netgraph.
+#
+# tk-netgraph is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# tk-netgraph is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with tk-netgraph. If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import math
+import typing as t
+
+if t.TYPE_CHECKING:
+    from netgraph.api._config import LODConfig
+
+class _DetailLevel(t.NamedTuple):
+    """What is drawn at the current zoom factor"""
+    text: bool
+    """Whether node labels, edge labels and weights are drawn"""
+    borders: bool
+    """Whether nodes are drawn with their double border or as a single circle"""
+    antialias: bool
+    """Whether edges are drawn with the lighter line below them"""
+    spline_divisor: int
+    """The number of line segments of smooth edges is divided by this number"""
+    min_spline_steps: int
+
+    @property
+    def structure(self) -> tuple[bool, bool, bool]:
+        """
+        The part of the detail level that decides which canvas objects exist.
+        If it changes, the objects have to be drawn again.
+        """
+        return self.text, self.borders, self.antialias
+
+    def spline_steps(self, segments: int) -> int:
+        return min(segments, max(self.min_spline_steps, segments // self.spline_divisor))
+
+def _detail_level(zoom: float, config: LODConfig) -> _DetailLevel:
+    divisor = 1
+    if 0 < zoom < config.spline_zoom:
+        # Halve the segments for every halving of the zoom factor
+        divisor = 2 ** math.ceil(math.log2(config.spline_zoom / zoom))
+
+    return _DetailLevel(
+        zoom >= config.text_zoom, zoom >= config.border_zoom, zoom >= config.antialias_zoom,
+        divisor, config.min_spline_steps
+    )
+
+def _spline_tag(segments: int) -> str:
+    """
+    The tag of all smooth edge lines drawn with the given number of segments,
+    used to change their spline steps with a single call
+    """
+    return f"splinesteps{segments}"
@@ -0,0 +1,463 @@
+# -*- coding: utf-8 -*-
+# Copyright © YodaPY 2024-present
+#
+# This file is part of tk-netgraph.
+#
+# tk-netgraph is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# tk-netgraph is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with tk-netgraph. If not, see <https://www.gnu.org/licenses/>.
+from __future__ import annotations
+
+import math
+import os
+import time
+import typing as t
+
+try:
+    import numpy as np
+except ImportError: # numpy is optional, mapped graphs can only be used with it
+    np = None # type: ignore[assignment]
+
+from netgraph._persist import _pack_strings
+
+if t.TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
+
+    from netgraph import NetManager
+    from netgraph.api._config import EdgeConfig, NodeConfig
+    from netgraph.api._edge import CanvasEdge
+    from netgraph.api._node import CanvasNode
+
+__all__: t.Sequence[str] = (
+    "MappedGraph",
+)
+
+_Box = tuple[float, float, float, float]
+
+_FORMAT_VERSION: t.Final[int] = 1
+_CELL_OFFSET: t.Final[int] = 2 ** 31
+"""Added to cell columns and rows so they are positive and fit into the lower and upper half of a cell key"""
+_UPDATE_INTERVAL: t.Final[int] = 100
+"""The minimum number of milliseconds between two updates of a `_MappedWindow` while the view keeps changing"""
+
+_ARRAYS: t.Final[tuple[str, ...]] = (
+    "meta", "node_positions", "node_labels", "node_label_offsets", "node_order", "cell_keys", "cell_starts",
+    "edge_endpoints", "edge_weights", "edge_weighted", "edge_positions", "edge_labels", "edge_label_offsets",
+    "adjacency", "adjacency_starts",
+)
+
+def _require_numpy() -> None:
+    if np is None:
+        raise RuntimeError("Mapped graphs require numpy")
+
+def _cell_keys(columns: NDArray, rows: NDArray) -> NDArray:
+    columns = np.asarray(columns + _CELL_OFFSET, dtype=np.uint64)
+    rows = np.asarray(rows + _CELL_OFFSET, dtype=np.uint64)
+    return (columns << np.uint64(32)) | rows
+
+def _cell(value: float, size: float) -> int:
+    return min(max(math.floor(value / size), -_CELL_OFFSET), _CELL_OFFSET - 1)
+
+def _gather(starts: NDArray, stops: NDArray) -> NDArray:
+    """
+    The indexes of all the given ranges, concatenated
+    """
+    counts = stops - starts
+    total = int(counts.sum())
+    if not total:
+        return np.empty(0, dtype=np.int64)
+
+    return np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(total)
+
+class MappedGraph:
+    """
+    A graph stored as .npy files in a directory and opened as memory-mapped arrays, so only the pages of the
+    nodes and edges that are looked at are read. Nodes are sorted into a grid of cells by their position and
+    every node knows its edges, so the nodes in an area and their edges are found without reading the whole graph.
+
+    Write a graph with `MappedGraph.create` and show it with `NetManager.attach`, which only creates
+    `CanvasNode` and `CanvasEdge` instances for the part of the graph in view. Requires numpy.
+    """
+    __slots__: t.Sequence[str] = ("_directory", "_arrays", "_cell_size")
+
+    def __init__(self, directory: t.Union[str, os.PathLike[str]]) -> None:
+        _require_numpy()
+        self._directory = os.fspath(directory)
+        self._arrays: dict[str, NDArray] = {
+            name: np.load(os.path.join(self._directory, f"{name}.npy"), mmap_mode="r", allow_pickle=False)
+            for name in _ARRAYS
+        }
+
+        version, self._cell_size = self._arrays["meta"].tolist()
+        if int(version) != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported mapped graph version {int(version)}")
+
+    @classmethod
+    def create(
+        cls,
+        directory: t.Union[str, os.PathLike[str]],
+        labels: t.Sequence[str],
+        positions: ArrayLike,
+        edges: ArrayLike,
+        *,
+        weights: t.Optional[t.Sequence[t.Optional[int]]] = None,
+        edge_labels: t.Optional[t.Sequence[str]] = None,
+        cell_size: float = 512
+    ) -> MappedGraph:
+        """
+        Write a graph into the directory and open it. Positions are the world coordinates of the nodes,
+        edges are pairs of node indexes. The position of an edge among the edges with the same endpoints
+        follows the order of the edges.
+        """
+        _require_numpy()
+        os.makedirs(directory, exist_ok=True)
+
+        node_positions = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+        endpoints = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+        node_count, edge_count = len(node_positions), len(endpoints)
+        if len(labels) != node_count:
+            raise ValueError(f"Got {len(labels)} labels for {node_count} node positions")
+        if edge_count and (endpoints.min() < 0 or endpoints.max() >= node_count):
+            raise ValueError("An edge references a node that doesn't exist")
+
+        # Nodes sorted by cell, each cell is a range of this order
+        keys = _cell_keys(
+            np.floor(node_positions[:, 0] / cell_size).astype(np.int64),
+            np.floor(node_positions[:, 1] / cell_size).astype(np.int64)
+        )
+        order = np.argsort(keys, kind="stable")
+        cell_keys, cell_starts = np.unique(keys[order], return_index=True)
+
+        # Edge ids sorted by endpoint, each node's edges are a range of this order. Self-loops appear once.
+        loops = endpoints[:, 0] == endpoints[:, 1]
+        edge_ids = np.arange(edge_count, dtype=np.int64)
+        incident_nodes = np.concatenate((endpoints[:, 0], endpoints[~loops, 1]))
+        incident_edges = np.concatenate((edge_ids, edge_ids[~loops]))
+        by_node = np.argsort(incident_nodes, kind="stable")
+
+        # Positions count the edges with the same ordered endpoints from 1, like `NetManager.create_edge` does
+        by_pair = np.lexsort((edge_ids, endpoints[:, 1], endpoints[:, 0]))
+        pairs = endpoints[by_pair]
+        first_of_pair = np.ones(edge_count, dtype=bool)
+        first_of_pair[1:] = np.any(pairs[1:] != pairs[:-1], axis=1)
+        pair_starts = np.maximum.accumulate(np.where(first_of_pair, np.arange(edge_count), 0)) if edge_count else edge_ids
+        edge_positions = np.empty(edge_count, dtype=np.int32)
+        edge_positions[by_pair] = np.arange(edge_count) - pair_starts + 1
+
+        if weights is None:
+            weights = [None] * edge_count
+        node_labels, node_label_offsets = _pack_strings(labels)
+        packed_edge_labels, edge_label_offsets = _pack_strings(edge_labels if edge_labels is not None else [""] * edge_count)
+
+        arrays: dict[str, NDArray] = {
+            "meta": np.array([_FORMAT_VERSION, cell_size], dtype=np.float64),
+            "node_positions": node_positions,
+            "node_labels": node_labels,
+            "node_label_offsets": node_label_offsets,
+            "node_order": order.astype(np.int64),
+            "cell_keys": cell_keys,
+            "cell_starts": np.append(cell_starts, node_count).astype(np.int64),
+            "edge_endpoints": endpoints,
+            "edge_weights": np.array([weight if weight is not None else 0 for weight in weights], dtype=np.int64),
+            "edge_weighted": np.array([weight is not None for weight in weights], dtype=bool),
+            "edge_positions": edge_positions,
+            "edge_labels": packed_edge_labels,
+            "edge_label_offsets": edge_label_offsets,
+            "adjacency": incident_edges[by_node],
+            "adjacency_starts": np.searchsorted(incident_nodes[by_node], np.arange(node_count + 1)).astype(np.int64),
+        }
+        for name, array in arrays.items():
+            np.save(os.path.join(directory, f"{name}.npy"), array, allow_pickle=False)
+
+        return cls(directory)
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    @property
+    def node_count(self) -> int:
+        return len(self._arrays["node_positions"])
+
+    @property
+    def edge_count(self) -> int:
+        return len(self._arrays["edge_endpoints"])
+
+    @property
+    def positions(self) -> NDArray:
+        """
+        The world coordinates of all nodes as a memory-mapped (n, 2) array
+        """
+        return self._arrays["node_positions"]
+
+    @property
+    def endpoints(self) -> NDArray:
+        """
+        The node indexes of the endpoints of all edges as a memory-mapped (m, 2) array
+        """
+        return self._arrays["edge_endpoints"]
+
+    def _string(self, name: str, index: int) -> str:
+        data, offsets = self._arrays[f"{name}s"], self._arrays[f"{name}_offsets"]
+        start = int(offsets[index - 1]) if index else 0
+        return data[start:int(offsets[index])].tobytes().decode()
+
+    def label(self, node: int) -> str:
+        return self._string("node_label", node)
+
+    def edge_label(self, edge: int) -> str:
+        return self._string("edge_label", edge)
+
+    def weight(self, edge: int) -> t.Optional[int]:
+        return int(self._arrays["edge_weights"][edge]) if self._arrays["edge_weighted"][edge] else None
+
+    def edge_position(self, edge: int) -> int:
+        return int(self._arrays["edge_positions"][edge])
+
+    def nodes_in(self, box: _Box) -> NDArray:
+        """
+        The indexes of the nodes whose position is inside the given rectangle in world coordinates
+        """
+        cell_keys = self._arrays["cell_keys"]
+        if not len(cell_keys):
+            return np.empty(0, dtype=np.int64)
+
+        x0, y0, x1, y1 = box
+        # Cells are sorted by column and then by row, so the cells of one column in the box are a single range
+        first_column = (int(cell_keys[0]) >> 32) - _CELL_OFFSET
+        last_column = (int(cell_keys[-1]) >> 32) - _CELL_OFFSET
+        columns = np.arange(
+            max(_cell(x0, self._cell_size), first_column), min(_cell(x1, self._cell_size), last_column) + 1,
+            dtype=np.int64
+        )
+        first = np.searchsorted(cell_keys, _cell_keys(columns, np.int64(_cell(y0, self._cell_size))))
+        last = np.searchsorted(cell_keys, _cell_keys(columns, np.int64(_cell(y1, self._cell_size))), side="right")
+        cell_starts = self._arrays["cell_starts"]
+        found = first < last
+        candidates = self._arrays["node_order"][_gather(cell_starts[first[found]], cell_starts[last[found]])]
+
+        positions = self._arrays["node_positions"][candidates]
+        inside = (
+            (positions[:, 0] >= x0) & (positions[:, 0] <= x1) & (positions[:, 1] >= y0) & (positions[:, 1] <= y1)
+        )
+        return np.sort(candidates[inside])
+
+    def edges_of(self, nodes: ArrayLike) -> NDArray:
+        """
+        The sorted indexes of the edges with at least one of the given nodes as endpoint
+        """
+        nodes = np.asarray(nodes, dtype=np.int64)
+        starts = self._arrays["adjacency_starts"]
+        return np.unique(self._arrays["adjacency"][_gather(starts[nodes], starts[nodes + 1])])
+
+    def neighborhood(self, node: int, depth: int = 1) -> NDArray:
+        """
+        The sorted indexes of the nodes at most depth edges away from the given node, including the node
+        """
+        nodes = np.array([node], dtype=np.int64)
+        for _ in range(depth):
+            nodes = np.union1d(nodes, self._arrays["edge_endpoints"][self.edges_of(nodes)].ravel())
+
+        return nodes
+
+
+class _MappedWindow:
+    """
+    Creates `CanvasNode` and `CanvasEdge` instances for the nodes of a `MappedGraph` in and around the visible
+    part of the canvas and for their edges, with the other endpoint of each edge, and removes them from the
+    manager once they are more than twice the margin out of view. Nodes moved on the canvas keep their new
+    position after they were removed, it is held in memory, the files are never written to.
+
+    At most `max_nodes` nodes in view are created; when zoomed out so far that more are in view, the rest stays
+    empty, and edges are only created between nodes in view.
+    """
+    __slots__: t.Sequence[str] = (
+        "_manager", "_canvas", "_graph", "_node_config", "_edge_config", "_max_nodes", "_margin",
+        "_nodes", "_ids", "_edges", "_moved", "_focus", "_pending", "_last_update", "_update_cost"
+    )
+
+    def __init__(
+        self,
+        manager: NetManager,
+        graph: MappedGraph,
+        *,
+        node_config: t.Optional[NodeConfig] = None,
+        edge_config: t.Optional[EdgeConfig] = None,
+        max_nodes: int = 20_000
+    ) -> None:
+        self._manager = manager
+        self._canvas = manager.canvas
+        self._graph = graph
+        self._node_config = node_config
+        self._edge_config = edge_config
+        self._max_nodes = max_nodes
+        self._margin = manager.config.viewport_margin
+
+        self._nodes: dict[int, CanvasNode] = {}
+        self._ids: dict[CanvasNode, int] = {}
+        self._edges: dict[int, CanvasEdge] = {}
+        self._moved: dict[int, tuple[float, float]] = {} # world positions of nodes moved on the canvas
+        self._focus = np.empty(0, dtype=np.int64)
+        self._pending: t.Optional[str] = None
+        self._last_update = 0.0
+        self._update_cost = 0.0
+
+        self._canvas.bind("<Configure>", lambda _: self.schedule_update(), "+")
+
+    @property
+    def graph(self) -> MappedGraph:
+        return self._graph
+
+    @property
+    def nodes(self) -> t.Mapping[int, CanvasNode]:
+        """
+        The nodes that currently have an instance, by their index in the graph
+        """
+        return self._nodes
+
+    @property
+    def edges(self) -> t.Mapping[int, CanvasEdge]:
+        """
+        The edges that currently have an instance, by their index in the graph
+        """
+        return self._edges
+
+    def index_of(self, node: CanvasNode) -> t.Optional[int]:
+        """
+        The index of the node in the graph, None if it isn't part of the graph
+        """
+        return self._ids.get(node)
+
+    def focus(self, node: int, depth: int = 1) -> None:
+        """
+        Keep the nodes at most depth edges away from the given node, and their edges, whether they are in view or not
+        """
+        self._focus = self._graph.neighborhood(node, depth)
+        self.update()
+
+    def clear_focus(self) -> None:
+        self._focus = np.empty(0, dtype=np.int64)
+        self.schedule_update()
+
+    def schedule_update(self) -> None:
+        """
+        Update soon, but not more often than every few milliseconds
+        """
+        if self._pending is not None:
+            return
+
+        elapsed = (time.perf_counter() - self._last_update) * 1000
+        interval = max(_UPDATE_INTERVAL, 2000 * self._update_cost)
+        self._pending = self._canvas.after(max(0, int(interval - elapsed)), self.update)
+
+    def update(self) -> None:
+        """
+        Create the nodes and edges that came into view and remove those far out of view
+        """
+        if self._pending is not None:
+            self._canvas.after_cancel(self._pending)
+            self._pending = None
+
+        start = time.perf_counter()
+        try:
+            self._update()
+        finally:
+            self._last_update = time.perf_counter()
+            self._update_cost = self._last_update - start
+
+    def _world_box(self, margin: float) -> _Box:
+        view = self._manager.view
+        x0, y0, x1, y1 = self._manager.viewport.visible_area(margin)
+        return (*view.to_world(x0, y0), *view.to_world(x1, y1))
+
+    def _record_moves(self) -> None:
+        if not self._nodes:
+            return
+
+        ids = np.fromiter(self._nodes, dtype=np.int64, count=len(self._nodes))
+        current = np.array([node.get_position() for node in self._nodes.values()], dtype=np.float64)
+        moved = np.flatnonzero(np.any(current != self._graph.positions[ids], axis=1))
+        for index in moved.tolist():
+            self._moved[int(ids[index])] = tuple(current[index].tolist())
+
+    def _nodes_in(self, box: _Box) -> NDArray:
+        nodes = self._graph.nodes_in(box)
+        if self._moved:
+            x0, y0, x1, y1 = box
+            moved = np.fromiter(self._moved, dtype=np.int64, count=len(self._moved))
+            inside = [node for node, (x, y) in self._moved.items() if x0 <= x <= x1 and y0 <= y <= y1]
+            nodes = np.union1d(np.setdiff1d(nodes, moved, assume_unique=True), np.array(inside, dtype=np.int64))
+
+        return np.union1d(nodes[:self._max_nodes], self._focus)
+
+    def _closure(self, box: _Box) -> tuple[NDArray, NDArray]:
+        """
+        The nodes in the box with their edges and the other endpoints of those edges
+        """
+        nodes = self._nodes_in(box)
+        edges = self._graph.edges_of(nodes)
+        endpoints = self._graph.endpoints[edges]
+        closure = np.union1d(nodes, endpoints.ravel())
+        if len(closure) > self._max_nodes:
+            edges = edges[np.isin(endpoints, nodes).all(axis=1)]
+            closure = nodes
+
+        return closure, edges
+
+    def _position(self, node: int) -> tuple[float, float]:
+        if (position := self._moved.get(node)) is not None:
+            return position
+
+        x, y = self._graph.positions[node].tolist()
+        return x, y
+
+    def _update(self) -> None:
+        self._record_moves()
+
+        keep_nodes, keep_edges = self._closure(self._world_box(2 * self._margin))
+        keep_node_set, keep_edge_set = set(keep_nodes.tolist()), set(keep_edges.tolist())
+        for edge_id in [edge_id for edge_id in self._edges if edge_id not in keep_edge_set]:
+            self._manager.remove_edge(self._edges.pop(edge_id))
+
+        released = [self._nodes.pop(node_id) for node_id in list(self._nodes) if node_id not in keep_node_set]
+        for node in released:
+            del self._ids[node]
+        self._manager.remove_nodes(released)
+
+        nodes, edges = self._closure(self._world_box(self._margin))
+        new_nodes = [node_id for node_id in nodes.tolist() if node_id not in self._nodes]
+        new_edges = [edge_id for edge_id in edges.tolist() if edge_id not in self._edges]
+        if not new_nodes and not new_edges:
+            return
+
+        graph = self._graph
+        view = self._manager.view
+        with self._manager.batch():
+            created = self._manager.add_nodes_from(
+                (graph.label(node_id) for node_id in new_nodes),
+                (view.to_canvas(*self._position(node_id)) for node_id in new_nodes),
+                self._node_config
+            )
+            for node_id, node in zip(new_nodes, created):
+                self._nodes[node_id] = node
+                self._ids[node] = node_id
+
+            endpoints = graph.endpoints[new_edges].tolist()
+            created_edges = self._manager.add_edges_from(
+                (
+                    (self._nodes[first], self._nodes[second], graph.edge_label(edge_id), graph.weight(edge_id))
+                    for edge_id, (first, second) in zip(new_edges, endpoints)
+                ),
+                self._edge_config,
+                positions=(graph.edge_position(edge_id) for edge_id in new_edges)
+            )
+            self._edges.update(zip(new_edges, created_edges))
@@ -16,12 +16,27 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with tk-netgraph. If not, see <https://www.gnu.org/licenses/>.
 
+from __future__ import annotations
+
 import math
 import typing as t
 
+try:
+    import numpy as np
+except ImportError: # numpy is optional, the *_array functions are not available without it
+    np = None # type: ignore[assignment]
+
+if t.TYPE_CHECKING:
+    from numpy.typing import NDArray
+
 SELFLOOP_CENTER_Y_APPROX: t.Final[float] = 0.9375 # Factor to approximate the actual y coordinate of the center top point of the line
 
 def _calc_text_position(text_pos, node1_pos: tuple[float, float], node2_pos: tuple[float, float], offset: float) -> tuple[float, float, float]:
+    point = _calc_offset_point(text_pos, node1_pos, node2_pos, offset)
+
+    return *point, _calc_text_angle(node1_pos, node2_pos)
+
+def _calc_text_angle(node1_pos: tuple[float, float], node2_pos: tuple[float, float]) -> float:
     x0, y0 = node1_pos
     x1, y1 = node2_pos
 
@@ -32,22 +47,22 @@ def _calc_text_position(text_pos, node1_pos: tuple[float, float], node2_pos: tup
     if abs(angle) > 90:
         angle = math.degrees(math.atan2(-yside, xside))
 
-    point = _calc_offset_point(text_pos, node1_pos, node2_pos, offset)
-
-    return *point, angle
+    return angle
 
-def _calc_offset_point(pos: tuple[float, float], node1_pos: tuple[float, float], node2_pos: tuple[float, float], offset: float) -> tuple[float, float]:
+def _calc_normal(node1_pos: tuple[float, float], node2_pos: tuple[float, float]) -> tuple[float, float]:
     x0, y0 = node1_pos
     x1, y1 = node2_pos
 
     xside = x1 - x0
     yside = y1 - y0
 
-    norm = math.hypot(xside, yside)
-    ux, uy = xside / norm, yside / norm
-    off_x, off_y = uy * offset, -ux * offset
+    norm = math.hypot(xside, yside) or 1 # nodes on top of each other don't have a direction, the offset is 0
+    return yside / norm, -xside / norm
+
+def _calc_offset_point(pos: tuple[float, float], node1_pos: tuple[float, float], node2_pos: tuple[float, float], offset: float) -> tuple[float, float]:
+    normal_x, normal_y = _calc_normal(node1_pos, node2_pos)
 
-    return pos[0] + off_x, pos[1] + off_y
+    return pos[0] + normal_x * offset, pos[1] + normal_y * offset
 
 def _calc_curved_center(node1_pos: tuple[float, float], node2_pos: tuple[float, float], offset: float):
     x0, y0 = node1_pos
@@ -80,4 +95,81 @@ def _calc_selfloop_text_pos(bbox: tuple[int, int, int, int], offset: float) -> t
     center_y = (bbox[1] + bbox[3]) / 2
 
     point = center_x, center_y - offset - height * 0.25 * SELFLOOP_CENTER_Y_APPROX
-    return point
\ No newline at end of file
+    return point
+
+def _calc_smooth_points(points: t.Sequence[float], steps: int) -> list[float]:
+    """
+    The polyline a smoothed canvas line with the given control points and spline steps is drawn as.
+    Like Tk, every inner point is the control point of a bezier segment between the midpoints of its
+    neighbouring segments, the first and last segment start and end at the first and last point.
+    """
+    xs, ys = points[0::2], points[1::2]
+    count = len(xs)
+    if count < 3:
+        return list(points)
+
+    smoothed = [xs[0], ys[0]]
+    for i in range(count - 2):
+        if i == 0:
+            x0, y0 = xs[0], ys[0]
+            x1, y1 = 0.333 * xs[0] + 0.667 * xs[1], 0.333 * ys[0] + 0.667 * ys[1]
+        else:
+            x0, y0 = 0.5 * xs[i] + 0.5 * xs[i + 1], 0.5 * ys[i] + 0.5 * ys[i + 1]
+            x1, y1 = 0.167 * xs[i] + 0.833 * xs[i + 1], 0.167 * ys[i] + 0.833 * ys[i + 1]
+
+        if i == count - 3:
+            x3, y3 = xs[i + 2], ys[i + 2]
+            x2, y2 = 0.333 * xs[i + 2] + 0.667 * xs[i + 1], 0.333 * ys[i + 2] + 0.667 * ys[i + 1]
+        else:
+            x3, y3 = 0.5 * xs[i + 1] + 0.5 * xs[i + 2], 0.5 * ys[i + 1] + 0.5 * ys[i + 2]
+            x2, y2 = 0.833 * xs[i + 1] + 0.167 * xs[i + 2], 0.833 * ys[i + 1] + 0.167 * ys[i + 2]
+
+        for step in range(1, steps + 1):
+            u = step / steps
+            v = 1 - u
+            a, b, c, d = v * v * v, 3 * u * v * v, 3 * u * u * v, u * u * u
+            smoothed += (a * x0 + b * x1 + c * x2 + d * x3, a * y0 + b * y1 + c * y2 + d * y3)
+
+    return smoothed
+
+
+# Vectorized versions of the functions above, operating on arrays with one row per edge
+
+def _calc_text_angle_array(node1_pos: NDArray, node2_pos: NDArray) -> NDArray:
+    side = node2_pos - node1_pos
+    angle = np.degrees(np.arctan2(side[:, 1], -side[:, 0]))
+    return np.where(np.abs(angle) > 90, np.degrees(np.arctan2(-side[:, 1], side[:, 0])), angle)
+
+def _calc_normal_array(node1_pos: NDArray, node2_pos: NDArray) -> NDArray:
+    """
+    The unit vectors perpendicular to the lines between the nodes, in the direction `_calc_offset_point` offsets to
+    """
+    side = node2_pos - node1_pos
+    norm = np.hypot(side[:, 0], side[:, 1])
+    norm[norm == 0] = 1 # nodes on top of each other don't have a direction, the offset is 0
+    return np.column_stack((side[:, 1] / norm, -side[:, 0] / norm))
+
+def _calc_curved_center_array(node1_pos: NDArray, node2_pos: NDArray, offset: NDArray) -> NDArray:
+    middle = (node1_pos + node2_pos) / 2
+    side = node2_pos - node1_pos
+    beta = (math.pi/2) - np.arctan2(side[:, 1], side[:, 0])
+    return np.column_stack((middle[:, 0] - offset * np.cos(beta), middle[:, 1] + offset * np.sin(beta)))
+
+def _calc_selfloop_points_array(bbox: NDArray, offset: NDArray) -> NDArray:
+    center_x = (bbox[:, 0] + bbox[:, 2]) / 2
+    center_y = (bbox[:, 1] + bbox[:, 3]) / 2
+    height = bbox[:, 3] - bbox[:, 1]
+    x_offset = 30
+    return np.column_stack((
+        center_x - x_offset, center_y,
+        center_x - offset, center_y - offset,
+        center_x, center_y - offset - height * 0.25,
+        center_x + offset, center_y - offset,
+        center_x + x_offset, center_y
+    ))
+
+def _calc_selfloop_text_pos_array(bbox: NDArray, offset: NDArray) -> NDArray:
+    height = bbox[:, 3] - bbox[:, 1]
+    center_x = (bbox[:, 0] + bbox[:, 2]) / 2
+    center_y = (bbox[:, 1] + bbox[:, 3]) / 2
+    return np.column_stack((center_x, center_y - offset - height * 0.25 * SELFLOOP_CENTER_Y_APPROX))
@@ -18,11 +18,24 @@
 
 from __future__ import annotations
 
+import contextlib
+import itertools
 import tkinter as tk
 import typing as t
 
 from netgraph import NetConfig
 from netgraph.api import _node, _edge, _config
+from netgraph._edge import CanvasEdge, _prepare_geometries
+from netgraph._node import CanvasNode
+from netgraph._lod import _DetailLevel, _detail_level, _spline_tag
+from netgraph._mapped import MappedGraph, _MappedWindow
+from netgraph._persist import _File, _load_graph, _save_graph
+from netgraph._spatial import _SpatialIndex
+from netgraph._sprites import _SpriteCache
+from netgraph._store import _EdgeStore, _NodeStore
+from netgraph._tiles import _TileLayer
+from netgraph._view import _PendingZoom, _ViewTransform
+from netgraph._viewport import _Viewport
 
 if t.TYPE_CHECKING:
     from netgraph  import NetCanvas
@@ -31,30 +44,381 @@ __all__: t.Sequence[str] = (
     "NetManager",
 )
 
-class _ComponentManager(dict[str, list[t.Union[_node.CanvasNode, _edge.CanvasEdge]]]):
-    __slots__: t.Sequence[str] = ("_component_id")
-    def __init__(self, *args, **kwargs) -> None:
-        super().__init__(*args, **kwargs)
+_GraphObject = t.Union[_node.CanvasNode, _edge.CanvasEdge]
 
+_ZOOM_DELAY: t.Final[int] = 50
+"""The number of milliseconds without a wheel step after which the zoom is applied"""
+
+def _component_tag(component: int) -> str:
+    return f"component{component}"
+
+class _ComponentManager:
+    """
+    Keeps track of the connected components of the graph with a union-find structure (union by size, path compression).
+    Merging two components is nearly O(1); the component tag is only added to the canvas objects of a component
+    once it is needed, when the component is dragged (see `materialize`).
+    """
+    __slots__: t.Sequence[str] = (
+        "_component_id", "_parent", "_size", "_tags", "_nodes", "_edges", "_pending", "_applied", "_removed",
+        "_edge_store"
+    )
+
+    def __init__(self, edge_store: _EdgeStore) -> None:
         self._component_id = 0
+        self._edge_store = edge_store
+
+        self._parent: dict[_GraphObject, _GraphObject] = {}
+        # The following are only kept for the root of each component
+        self._size: dict[_GraphObject, int] = {}
+        self._tags: dict[_GraphObject, int] = {} # the id of the component tag, see `_component_tag`
+        self._nodes: dict[_GraphObject, list[_node.CanvasNode]] = {}
+        self._edges: dict[_GraphObject, list[_edge.CanvasEdge]] = {}
+        self._pending: dict[_GraphObject, list[_GraphObject]] = {} # members that don't carry the component tag yet
+
+        # The id of the component tag each object currently carries on the canvas, the edge store keeps it for its edges
+        self._applied: dict[_GraphObject, int] = {}
+        self._removed: set[_edge.CanvasEdge] = set()
+
+    def __len__(self) -> int:
+        self._rebuild_if_removed()
+        return len(self._size)
+
+    def __contains__(self, obj: object) -> bool:
+        self._rebuild_if_removed()
+        return obj in self._parent
+
+    def _rebuild_if_removed(self) -> None:
+        """
+        A union-find structure can't split components, so the components that lost an edge are rebuilt from their
+        remaining edges the next time they're needed. Other components are left untouched.
+        Nodes without any remaining edge are no longer part of a component.
+        """
+        if not self._removed:
+            return
+
+        removed, self._removed = self._removed, set()
+        roots = {self._find(edge) for edge in removed if edge in self._parent}
+        remaining: list[_edge.CanvasEdge] = []
+        for root in roots:
+            edges = self._edges.pop(root)
+            for member in (*self._nodes.pop(root), *edges):
+                del self._parent[member]
+
+            for structure in (self._size, self._tags, self._pending):
+                structure.pop(root, None)
+
+            remaining.extend(edge for edge in edges if edge not in removed)
+
+        for edge in remaining:
+            self.add_edge(edge)
+
+    def remove_edge(self, edge: _edge.CanvasEdge) -> None:
+        """
+        Remove the edge from its component. The components are updated lazily.
+        """
+        self._removed.add(edge)
+        self._applied.pop(edge, None)
+
+    def remove_node(self, node: _node.CanvasNode) -> None:
+        """
+        Forget a node whose edges were all removed
+        """
+        self._applied.pop(node, None)
+
+    def _find(self, obj: _GraphObject) -> _GraphObject:
+        root = obj
+        while (parent := self._parent[root]) is not root:
+            root = parent
+
+        # Path compression
+        while obj is not root:
+            self._parent[obj], obj = root, self._parent[obj]
+
+        return root
+
+    def _add_root(self, node: _node.CanvasNode) -> None:
+        self._parent[node] = node
+        self._size[node] = 1
+        self._nodes[node] = [node]
+        self._edges[node] = []
+        self._pending[node] = [node]
 
-    def add_component(self) -> str:
-        tag = f"component{self._component_id}"
-        self._component_id += 1
+    def _union(self, first: _GraphObject, second: _GraphObject) -> _GraphObject:
+        root, other = self._find(first), self._find(second)
+        if root is other:
+            return root
 
-        self[tag] = []
+        if self._size[root] < self._size[other]:
+            root, other = other, root
+
+        self._parent[other] = root
+        self._size[root] += self._size.pop(other)
+
+        other_nodes = self._nodes.pop(other)
+        other_edges = self._edges.pop(other)
+        self._nodes[root].extend(other_nodes)
+        self._edges[root].extend(other_edges)
+
+        other_pending = self._pending.pop(other)
+        other_tag = self._tags.pop(other, None)
+        if root not in self._tags and other_tag is not None:
+            # The members of the other component already carry its tag, keep using it
+            self._tags[root] = other_tag
+            self._pending[root].extend(other_pending)
+        elif other_tag is not None:
+            self._pending[root].extend(other_nodes)
+            self._pending[root].extend(other_edges)
+        else:
+            self._pending[root].extend(other_pending)
+
+        return root
+
+    def add_edge(self, edge: _edge.CanvasEdge) -> None:
+        """
+        Add the edge and its endpoints to the graph components, merging the components of the endpoints if necessary
+        """
+        self._rebuild_if_removed()
+        for node in edge.endpoints:
+            if node not in self._parent:
+                self._add_root(node)
+
+        root = self._union(*edge.endpoints)
+        self._parent[edge] = root
+        self._size[root] += 1
+        self._edges[root].append(edge)
+        self._pending[root].append(edge)
+
+    def get_tag(self, obj: _GraphObject) -> t.Optional[str]:
+        """
+        The tag of the component that the given object is part of or None if it isn't part of any component
+        """
+        self._rebuild_if_removed()
+        if obj not in self._parent:
+            return None
+
+        root = self._find(obj)
+        if (component := self._tags.get(root)) is None:
+            component = self._tags[root] = self._component_id
+            self._component_id += 1
+
+        return _component_tag(component)
+
+    def nodes(self, obj: _GraphObject) -> list[_node.CanvasNode]:
+        """
+        The nodes of the component that the given object is part of
+        """
+        self._rebuild_if_removed()
+        return self._nodes[self._find(obj)] if obj in self._parent else []
+
+    def edges(self, obj: _GraphObject) -> list[_edge.CanvasEdge]:
+        """
+        The edges of the component that the given object is part of
+        """
+        self._rebuild_if_removed()
+        return self._edges[self._find(obj)] if obj in self._parent else []
+
+    def materialize(self, obj: _GraphObject) -> t.Optional[str]:
+        """
+        Make sure that the canvas objects of every member of the given object's component carry the component tag
+        and return the tag. Should be called before the component tag is used on the canvas.
+        """
+        tag = self.get_tag(obj)
+        if tag is None:
+            return None
+
+        root = self._find(obj)
+        component = self._tags[root]
+        pending, self._pending[root] = self._pending[root], []
+        for member in pending:
+            if (old_component := self._get_applied(member)) == component:
+                continue
+
+            if old_component >= 0:
+                member.obj_container.remove_tag(_component_tag(old_component))
+
+            member.obj_container.add_tag(tag)
+            self._set_applied(member, component)
 
         return tag
 
+    def _get_applied(self, member: _GraphObject) -> int:
+        if isinstance(member, CanvasEdge):
+            return self._edge_store.component(member.slot)
+
+        return self._applied.get(member, -1)
+
+    def _set_applied(self, member: _GraphObject, component: int) -> None:
+        if isinstance(member, CanvasEdge):
+            self._edge_store.set_component(member.slot, component)
+        else:
+            self._applied[member] = component
+
+_Members = t.Union[_edge.CanvasEdge, dict[_edge.CanvasEdge, None]]
+"""The edges between a pair of nodes: the edge itself if it is the only one, otherwise an ordered set"""
+
+def _add_member(index: dict[t.Any, _Members], key: t.Any, edge: _edge.CanvasEdge) -> None:
+    members = index.get(key)
+    if members is None:
+        index[key] = edge
+    elif isinstance(members, dict):
+        members[edge] = None
+    else:
+        index[key] = {members: None, edge: None}
+
+def _remove_member(index: dict[t.Any, _Members], key: t.Any, edge: _edge.CanvasEdge) -> None:
+    members = index[key]
+    if not isinstance(members, dict):
+        del index[key]
+        return
+
+    del members[edge]
+    if len(members) == 1:
+        index[key] = next(iter(members))
+
+def _member_list(members: t.Optional[_Members]) -> list[_edge.CanvasEdge]:
+    if members is None:
+        return []
+
+    return list(members) if isinstance(members, dict) else [members]
+
+def _member_count(members: t.Optional[_Members]) -> int:
+    if members is None:
+        return 0
+
+    return len(members) if isinstance(members, dict) else 1
+
+class _EdgeIndex:
+    """
+    Indexes the edges by their ordered pair of endpoints, so parallel edges, neighbors and the position of
+    a new edge are looked up in constant time. The edges between two nodes in either direction are found with
+    two lookups, the ordered pair is the tuple the edge keeps anyway, so the index adds no tuple per edge.
+    Most pairs of nodes are connected by a single edge, which is kept without a set of its own.
+    """
+    __slots__: t.Sequence[str] = ("_edges", "_ordered", "_neighbors", "_next_position", "_free_positions")
+
+    def __init__(self) -> None:
+        self._edges: dict[_edge.CanvasEdge, None] = {} # used as an ordered set
+        self._ordered: dict[tuple[_node.CanvasNode, _node.CanvasNode], _Members] = {}
+        self._neighbors: dict[_node.CanvasNode, dict[_node.CanvasNode, int]] = {} # neighbor -> number of edges
+        # Only kept once it is above 1, a pair with edges and no entry has given out position 1
+        self._next_position: dict[tuple[_node.CanvasNode, _node.CanvasNode], int] = {}
+        self._free_positions: dict[tuple[_node.CanvasNode, _node.CanvasNode], list[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._edges)
+
+    def __iter__(self) -> t.Iterator[_edge.CanvasEdge]:
+        return iter(self._edges)
+
+    def __contains__(self, edge: object) -> bool:
+        return edge in self._edges
+
+    def add(self, edge: _edge.CanvasEdge, position: t.Optional[int] = None) -> int:
+        """
+        Add the edge to the index and return its position among the edges with the same (ordered) endpoints.
+        Positions start at 1, positions of removed edges are reused. If a position is given, e.g. of a loaded edge,
+        it is used instead and later edges are placed after it.
+        """
+        first, second = key = edge.endpoints
+        next_position = self._next_position.get(key, 1 if key in self._ordered else 0)
+        self._edges[edge] = None
+        _add_member(self._ordered, key, edge)
+
+        for node, neighbor in ((first, second), (second, first)):
+            neighbors = self._neighbors.setdefault(node, {})
+            neighbors[neighbor] = neighbors.get(neighbor, 0) + 1
+            if first is second:
+                break
+
+        if position is None:
+            if free := self._free_positions.get(key):
+                return free.pop()
+
+            position = next_position + 1
+
+        if position > max(next_position, 1):
+            self._next_position[key] = position
+
+        return position
+
+    def remove(self, edge: _edge.CanvasEdge) -> None:
+        first, second = key = edge.endpoints
+        del self._edges[edge]
+
+        _remove_member(self._ordered, key, edge)
+
+        for node, neighbor in ((first, second), (second, first)):
+            neighbors = self._neighbors[node]
+            neighbors[neighbor] -= 1
+            if neighbors[neighbor] == 0:
+                del neighbors[neighbor]
+            if first is second:
+                break
+
+        if key in self._ordered:
+            self._free_positions.setdefault(key, []).append(edge.position)
+        else:
+            # No edges left between the endpoints, start counting from the beginning again
+            self._next_position.pop(key, None)
+            self._free_positions.pop(key, None)
+
+    def edges_between(self, first: _node.CanvasNode, second: _node.CanvasNode, *, directed: bool = False) -> list[_edge.CanvasEdge]:
+        edges = _member_list(self._ordered.get((first, second)))
+        if not directed and first is not second:
+            edges.extend(_member_list(self._ordered.get((second, first))))
+
+        return edges
+
+    def count(self, first: _node.CanvasNode, second: _node.CanvasNode, *, directed: bool = False) -> int:
+        count = _member_count(self._ordered.get((first, second)))
+        if not directed and first is not second:
+            count += _member_count(self._ordered.get((second, first)))
+
+        return count
+
+    def neighbors(self, node: _node.CanvasNode) -> list[_node.CanvasNode]:
+        return list(self._neighbors.get(node, ()))
+
+EdgeSpec = t.Union[
+    tuple[_node.CanvasNode, _node.CanvasNode],
+    tuple[_node.CanvasNode, _node.CanvasNode, str],
+    tuple[_node.CanvasNode, _node.CanvasNode, str, t.Optional[int]],
+]
+"""An edge given to `NetManager.add_edges_from`: the two endpoints and optionally the label and the weight"""
+
 class NetManager:
-    __slots__: t.Sequence[str] = ("_canvas", "_config", "_component_manager", "_nodes")
+    __slots__: t.Sequence[str] = (
+        "_canvas", "_config", "_component_manager", "_edge_index", "_nodes", "_restack", "_batch_depth",
+        "_deferred_edges", "_spatial_index", "_viewport", "_view", "_pending_zoom", "_zoom_timer", "_detail",
+        "_sprites", "_tiles", "_window", "_node_store", "_edge_store"
+    )
 
     def __init__(self, canvas: NetCanvas, config: t.Optional[_config.NetConfig] = None) -> None:
         self._canvas = canvas
 
         self._config = config if config is not None else NetConfig()
         
-        self._component_manager = _ComponentManager()
+        self._node_store = _NodeStore()
+        self._edge_store = _EdgeStore()
+        self._component_manager = _ComponentManager(self._edge_store)
+        self._edge_index = _EdgeIndex()
+        self._spatial_index = _SpatialIndex()
+        self._nodes: dict[_node.CanvasNode, None] = {} # used as an ordered set, so removing a node is O(1)
+        # If not None, edges are not lowered when they are rendered, the nodes collected here are raised instead
+        self._restack: t.Optional[dict[_node.CanvasNode, None]] = None
+        self._batch_depth = 0
+        self._deferred_edges: dict[_edge.CanvasEdge, None] = {}
+        self._view = _ViewTransform()
+        self._pending_zoom: t.Optional[_PendingZoom] = None
+        self._zoom_timer: t.Optional[str] = None
+        self._detail = _detail_level(self._view.scale, self._config.lod_config)
+        self._sprites = _SpriteCache(self._canvas)
+
+        self._canvas.scheduler.frame_rate = self._config.frame_rate
+        self._canvas.item_pool.max_size = self._config.item_pool_size
+        self._viewport = _Viewport(self)
+        self._tiles = _TileLayer(self) if self._config.raster else None
+        self._window: t.Optional[_MappedWindow] = None
 
         self._canvas.bind("<MouseWheel>", self.zoom)
 
@@ -63,23 +427,259 @@ class NetManager:
             return
         
         if (event.delta > 0):
-            self._canvas.scale(tk.ALL, event.x, event.y, 1.1, 1.1)
+            factor = 1.1
         elif (event.delta < 0):
-            self._canvas.scale(tk.ALL, event.x, event.y, 0.9, 0.9)
+            factor = 0.9
+        else:
+            return
+
+        # Wheel steps come in bursts, only the combined zoom is drawn once the burst is over
+        if self._pending_zoom is None:
+            self._pending_zoom = _PendingZoom()
+        else:
+            self._canvas.after_cancel(t.cast(str, self._zoom_timer))
+
+        self._pending_zoom.add(event.x, event.y, factor)
+        self._zoom_timer = self._canvas.after(_ZOOM_DELAY, self.apply_zoom)
+
+    def apply_zoom(self) -> None:
+        """
+        Apply the wheel steps received since the last zoom now instead of once the mouse wheel stopped.
+        Only the nodes and edges in view are moved to their new position, the others are moved once they come into view.
+        """
+        if self._pending_zoom is None:
+            return
+
+        self._canvas.after_cancel(t.cast(str, self._zoom_timer))
+        pending, self._pending_zoom, self._zoom_timer = self._pending_zoom, None, None
+
+        # Pending moves were made with the old scale
+        self._canvas.scheduler.flush()
+
+        # Scroll the view so the points under the mouse stay where they were, see `_PendingZoom`
+        origin_x, origin_y = self._canvas.canvasx(0), self._canvas.canvasy(0)
+        self._canvas.scan_mark(0, 0)
+        self._canvas.scan_dragto(
+            round(origin_x - (origin_x * pending.factor - pending.offset_x)),
+            round(origin_y - (origin_y * pending.factor - pending.offset_y)),
+            gain=1
+        )
+        self._view.zoom(pending.factor)
+
+        rendered = [node for node in self._nodes if node.is_rendered]
+        self._spatial_index.reproject(rendered)
+
+        self._viewport.mark_stale(obj for obj in (*rendered, *self._edge_index) if len(obj.obj_container))
+        self._update_detail()
+        self._viewport.update()
+        self._canvas.scheduler.flush()
+        if self._tiles is not None:
+            self._tiles.update()
+        if self._window is not None:
+            self._window.update()
+
+    def start_pan(self, event: tk.Event) -> None:
+        """
+        Start scrolling the canvas with the mouse, see `pan`
+        """
+        self._canvas.scan_mark(event.x, event.y)
+
+    def pan(self, event: tk.Event) -> None:
+        """
+        Scroll the canvas so the point that was under the mouse when `start_pan` was called follows the mouse.
+        No canvas object is touched, so this costs the same however large the graph is.
+        """
+        self._canvas.scan_dragto(event.x, event.y, gain=1)
+        self._viewport.view_changed()
+        if self._tiles is not None:
+            self._tiles.schedule_update()
+        if self._window is not None:
+            self._window.schedule_update()
+
+    @property
+    def view(self) -> _ViewTransform:
+        return self._view
+
+    @property
+    def zoom_factor(self) -> float:
+        """
+        The product of all zoom steps applied to the canvas, 1.0 if the canvas was never zoomed
+        """
+        return self._view.scale
+
+    @property
+    def detail(self) -> _DetailLevel:
+        """
+        What nodes and edges draw at the current zoom factor, see `NetConfig.lod_config`
+        """
+        return self._detail
+
+    def _update_detail(self) -> None:
+        previous, self._detail = self._detail, _detail_level(self._view.scale, self._config.lod_config)
+        if self._detail.structure != previous.structure:
+            self.redraw()
+        elif self._detail.spline_divisor != previous.spline_divisor:
+            # Only the smoothing changed, which the canvas can change for all lines with the same segments at once
+            for segments in {edge.config.line_segments for edge in self._edge_index}:
+                self._canvas.itemconfigure(_spline_tag(segments), splinesteps=self._detail.spline_steps(segments))
+
+    @property
+    def sprites(self) -> _SpriteCache:
+        """
+        The images of nodes drawn as sprites, see `NodeConfig.sprite`
+        """
+        return self._sprites
+
+    @property
+    def tiles(self) -> t.Optional[_TileLayer]:
+        """
+        The tiles the graph is drawn into, None unless `NetConfig.raster` is enabled
+        """
+        return self._tiles
+
+    @property
+    def window(self) -> t.Optional[_MappedWindow]:
+        """
+        The part of the attached `MappedGraph` that has nodes and edges, None if no graph was attached
+        """
+        return self._window
+
+    def attach(
+        self,
+        graph: MappedGraph,
+        *,
+        node_config: t.Optional[_config.NodeConfig] = None,
+        edge_config: t.Optional[_config.EdgeConfig] = None,
+        max_nodes: int = 20_000
+    ) -> _MappedWindow:
+        """
+        Show a graph that is too large to keep a node and edge instance for each of its elements. Only the nodes
+        in and around the visible part of the canvas, their edges and the other endpoints of those edges are added
+        to the manager, and removed again once they are far out of view.
+        """
+        if self._window is not None:
+            raise RuntimeError("A mapped graph is already attached")
+
+        self._window = _MappedWindow(self, graph, node_config=node_config, edge_config=edge_config, max_nodes=max_nodes)
+        self._window.update()
+        return self._window
+
+    def redraw(self) -> None:
+        """
+        Delete and draw the canvas objects of every drawn node and edge again in one batch,
+        e.g. because the detail level or the background of the canvas changed
+        """
+        self._canvas.scheduler.flush()
+        nodes = [node for node in self._nodes if len(node.obj_container)]
+        edges = [edge for edge in self._edge_index if len(edge.obj_container)]
+        with self.batch(), self._canvas.buffering():
+            for obj in (*nodes, *edges):
+                obj.obj_container.remove_all()
+                self._viewport.discard(obj)
+
+            # No object shows the sprites anymore, they are drawn again for the new detail level and background
+            self._sprites.clear()
+            if self._tiles is not None:
+                # Tiles are kept per zoom level, they are only drawn again if the background changed
+                self._tiles.schedule_update()
+
+            for node in nodes:
+                node.render(node.get_center())
+            for edge in edges:
+                edge.render()
+
+    @property
+    def canvas(self) -> NetCanvas:
+        return self._canvas
 
     @property
     def component_manager(self) -> _ComponentManager:
         return self._component_manager
 
+    @property
+    def node_store(self) -> _NodeStore:
+        """
+        The geometry of the nodes, see `_NodeStore`
+        """
+        return self._node_store
+
+    @property
+    def edge_store(self) -> _EdgeStore:
+        """
+        The weights and component ids of the edges, see `_EdgeStore`
+        """
+        return self._edge_store
+
+    @property
+    def spatial_index(self) -> _SpatialIndex:
+        return self._spatial_index
+
+    @property
+    def viewport(self) -> _Viewport:
+        return self._viewport
+
     @property
     def config(self) -> NetConfig:
         return self._config
 
+    @property
+    def nodes(self) -> list[_node.CanvasNode]:
+        return list(self._nodes)
+
+    @property
+    def edges(self) -> list[_edge.CanvasEdge]:
+        return list(self._edge_index)
+
+    def edges_between(
+        self, first: _node.CanvasNode, second: _node.CanvasNode, *, directed: bool = False
+    ) -> list[_edge.CanvasEdge]:
+        """
+        The edges connecting the given nodes. If directed is True, only edges from the first to the second node are returned.
+        """
+        return self._edge_index.edges_between(first, second, directed=directed)
+
+    def edge_count(self, first: _node.CanvasNode, second: _node.CanvasNode, *, directed: bool = False) -> int:
+        """
+        The number of edges connecting the given nodes. If directed is True, only edges from the first to the second node are counted.
+        """
+        return self._edge_index.count(first, second, directed=directed)
+
+    def neighbors(self, node: _node.CanvasNode) -> list[_node.CanvasNode]:
+        """
+        The nodes connected to the given node by at least one edge. Contains the node itself if it has a self-loop.
+        """
+        return self._edge_index.neighbors(node)
+
+    def nodes_in(self, x0: float, y0: float, x1: float, y1: float) -> list[_node.CanvasNode]:
+        """
+        The rendered nodes whose bounding box overlaps the given rectangle in canvas coordinates
+        """
+        return self._spatial_index.nodes_in((min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1)))
+
+    def edges_in(self, x0: float, y0: float, x1: float, y1: float) -> list[_edge.CanvasEdge]:
+        """
+        The rendered edges whose control polyline crosses the given rectangle in canvas coordinates
+        """
+        return self._spatial_index.edges_in((min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1)))
+
+    def nearest_node(self, x: float, y: float, max_distance: t.Optional[float] = None) -> t.Optional[_node.CanvasNode]:
+        """
+        The rendered node whose bounding box is closest to the given point, None if there is none within max_distance
+        """
+        return self._spatial_index.nearest_node(x, y, max_distance)
+
+    def nearest_edge(self, x: float, y: float, max_distance: t.Optional[float] = None) -> t.Optional[_edge.CanvasEdge]:
+        """
+        The rendered edge whose control polyline is closest to the given point, None if there is none within max_distance
+        """
+        return self._spatial_index.nearest_edge(x, y, max_distance)
+
     def create_node(self, label: str, config: t.Optional[_config.NodeConfig] = None) -> _node.CanvasNode:
         if config is None:
             config = self._config.node_config
             
         node = self._config.node_config.factory(self, self._canvas, label, config=config)
+        self._nodes[node] = None
         return node
     
     def create_edge(
@@ -92,14 +692,237 @@ class NetManager:
         if config is None:
             config = self._config.edge_config
             
+        return self._add_edge(nodes, label, weight, config)
+
+    def _add_edge(
+        self,
+        nodes: tuple[_node.CanvasNode, _node.CanvasNode],
+        label: str,
+        weight: t.Optional[int],
+        config: _config.EdgeConfig,
+        position: t.Optional[int] = None
+    ) -> _edge.CanvasEdge:
+        """
+        Create the edge and add it to the graph, shared by `create_edge` and `add_edges_from`
+        """
         edge = self._config.edge_config.factory(self, self._canvas, nodes, label, weight, config=config)
 
         for node in nodes:
             node.edges.add(edge)
 
-        existing_edges = nodes[0].edges.intersection(nodes[1].edges)
-        edge.position = sum(1 for e in existing_edges if e.endpoints == nodes)
+        edge.position = self._edge_index.add(edge, position)
+        self._spatial_index.invalidate(edge)
 
         return edge
+
+    def remove_edge(self, edge: _edge.CanvasEdge) -> None:
+        """
+        Remove the edge from the graph and delete its canvas objects
+        """
+        self._edge_index.remove(edge)
+        for node in edge.endpoints:
+            node.edges.discard(edge)
+
+        self._component_manager.remove_edge(edge)
+        self._spatial_index.remove(edge)
+        self._viewport.discard(edge)
+        self._canvas.scheduler.discard(edge)
+        self._deferred_edges.pop(edge, None)
+        self._canvas.dispatcher.forget(edge.canvas_id)
+        edge.obj_container.remove_all()
+        if isinstance(edge, CanvasEdge):
+            edge.release()
+
+    def remove_node(self, node: _node.CanvasNode) -> None:
+        """
+        Remove the node and its edges from the graph and delete their canvas objects
+        """
+        self.remove_nodes((node,))
+
+    def remove_nodes(self, nodes: t.Iterable[_node.CanvasNode]) -> None:
+        """
+        Remove the nodes and their edges from the graph and delete their canvas objects
+        """
+        for node in nodes:
+            # A node that was removed before is skipped, releasing its slot again would hand it to two nodes
+            if self._nodes.pop(node, False) is not None:
+                continue
+
+            for edge in list(node.edges):
+                self.remove_edge(edge)
+
+            self._component_manager.remove_node(node)
+            self._spatial_index.remove(node)
+            self._viewport.discard(node)
+            self._canvas.dispatcher.forget(node.canvas_id)
+            node.obj_container.remove_all()
+            if isinstance(node, CanvasNode):
+                node.release()
+
+    @property
+    def is_batching(self) -> bool:
+        return self._batch_depth > 0
+
+    @contextlib.contextmanager
+    def batch(self) -> t.Iterator[None]:
+        """
+        Defer canvas work until the with-block is left. Edges rendered inside the block are drawn once
+        with the final node positions, node moves, edge updates and text changes are merged per canvas object,
+        and the stacking order is fixed once at the end instead of for every edge.
+        Batches can be nested, the work is applied when the outermost batch is left.
+        """
+        self._batch_depth += 1
+        if self._batch_depth == 1:
+            self._canvas.scheduler.suspend()
+
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._apply_batch()
+
+    def _apply_batch(self) -> None:
+        edges, self._deferred_edges = self._deferred_edges, {}
+        for edge in edges:
+            # The edge is drawn with the current node positions anyway
+            self._canvas.scheduler.discard(edge)
+
+        # Move the existing objects before drawing new ones, which might already carry a moved tag
+        self._canvas.scheduler.resume()
+
+        _prepare_geometries(edges)
+        self._restack = {}
+        try:
+            for edge in edges:
+                edge.render()
+        finally:
+            restack, self._restack = self._restack, None
+
+        for node in restack:
+            node.obj_container.lift()
+
+    def defer_render(self, obj: _GraphObject) -> bool:
+        """
+        Returns False if the node or edge should be drawn right away. Otherwise an edge is remembered to be drawn
+        when the current batch is applied, and nodes and edges out of view are drawn once they come into view.
+        With `NetConfig.raster`, only the component under the mouse is drawn, everything else is in the tiles.
+        """
+        if isinstance(obj, _edge.CanvasEdge) and self._batch_depth > 0:
+            self._deferred_edges[obj] = None
+            return True
+
+        if self._tiles is not None:
+            return not self._tiles.is_live(obj)
+
+        return not self._viewport.should_render(obj)
+
+    def restack(self, edge: _edge.CanvasEdge) -> None:
+        """
+        Move the canvas objects of a rendered edge below the nodes
+        """
+        if self._restack is None:
+            edge.obj_container.lower()
+        else:
+            self._restack.update(dict.fromkeys(edge.endpoints))
+
+    def set_positions(self, positions: t.Mapping[_node.CanvasNode, tuple[float, float]]) -> None:
+        """
+        Move every given node to its new position in one batch, so each edge is updated only once.
+        Nodes that were not rendered yet are rendered at their position.
+        """
+        with self.batch():
+            for node, (x, y) in positions.items():
+                if node.is_rendered:
+                    center_x, center_y = node.get_center()
+                    if x != center_x or y != center_y:
+                        node.move(x - center_x, y - center_y)
+                else:
+                    node.render((x, y))
+
+    def add_nodes_from(
+        self,
+        labels: t.Iterable[str],
+        positions: t.Optional[t.Iterable[tuple[int, int]]] = None,
+        config: t.Optional[_config.NodeConfig] = None
+    ) -> list[_node.CanvasNode]:
+        """
+        Create a node for every label. If positions are given, the nodes are rendered at the position
+        with the same index.
+        """
+        nodes = [self.create_node(label, config) for label in labels]
+        if positions is not None:
+            for node, pos in zip(nodes, positions):
+                node.render(pos)
+
+        return nodes
+
+    def add_edges_from(
+        self,
+        edges: t.Iterable[EdgeSpec],
+        config: t.Optional[_config.EdgeConfig] = None,
+        *,
+        render: bool = True,
+        positions: t.Optional[t.Iterable[int]] = None
+    ) -> list[_edge.CanvasEdge]:
+        """
+        Create an edge for every given tuple of endpoints, label and weight.
+        Unlike calling `create_edge` for every edge, the edges are rendered in a single batch.
+        If positions are given, each edge gets the position among the edges with the same endpoints with
+        the same index, e.g. to restore saved edges, instead of the next free one. Raises ValueError if there
+        are more or fewer positions than edges, before any edge is created.
+        """
+        if config is None:
+            config = self._config.edge_config
+
+        position_iter: t.Iterable[t.Optional[int]]
+        if positions is None:
+            position_iter = itertools.repeat(None)
+        else:
+            edges, position_iter = list(edges), list(positions)
+            if len(edges) != len(position_iter):
+                raise ValueError(f"Got {len(position_iter)} positions for {len(edges)} edges")
+
+        created: list[_edge.CanvasEdge] = []
+        for spec, position in zip(edges, position_iter):
+            label = spec[2] if len(spec) > 2 else ""
+            weight = spec[3] if len(spec) > 3 else None
+            created.append(self._add_edge((spec[0], spec[1]), label, weight, config, position))
+
+        if render:
+            with self.batch():
+                for edge in created:
+                    edge.render()
+
+        return created
         
-    
\ No newline at end of file
+    
+    def save(
+        self,
+        file: _File,
+        *,
+        node_configs: t.Sequence[_config.NodeConfig] = (),
+        edge_configs: t.Sequence[_config.EdgeConfig] = (),
+        compress: bool = False
+    ) -> None:
+        """
+        Save all nodes and edges with their labels, weights, positions among parallel edges, components and
+        node positions in world coordinates as columns of a NumPy .npz file. Configs aren't stored, only a
+        reference to the manager's default config or the index of the config in `node_configs` or
+        `edge_configs`, which have to be passed to `load` again. Requires numpy.
+        """
+        _save_graph(self, file, node_configs=node_configs, edge_configs=edge_configs, compress=compress)
+
+    def load(
+        self,
+        file: _File,
+        *,
+        node_configs: t.Sequence[_config.NodeConfig] = (),
+        edge_configs: t.Sequence[_config.EdgeConfig] = (),
+        render: bool = True
+    ) -> tuple[list[_node.CanvasNode], list[_edge.CanvasEdge]]:
+        """
+        Add the nodes and edges of a file written by `save` in a single batch and return them.
+        Nodes that had a position are rendered at it in the current view. Requires numpy.
+        """
+        return _load_graph(self, file, node_configs=node_configs, edge_configs=edge_configs, render=render)
@@ -21,7 +21,8 @@ from __future__ import annotations
 import typing as t
 
 from netgraph.api import _node, _objects, _config
-from netgraph._objects import _ObjectContainer, _convert_to_canvas_objects
+from netgraph._dispatch import _MOTION, _PRESS
+from netgraph._objects import _ObjectContainer
 
 if t.TYPE_CHECKING:
     import tkinter as tk
@@ -33,9 +34,25 @@ if t.TYPE_CHECKING:
 __all__: t.Sequence[str] = (
     "CanvasNode",
 )
+
+_RADIUS: t.Final[int] = 50
+_SPACE: t.Final[int] = 10
+"""The space between the outer and the inner circle"""
+_BORDER: t.Final[int] = 2
+"""The width of both circles, see `NetCanvas.create_border_circle`"""
+_EXTENT: t.Final[tuple[float, float, float, float]] = (-_RADIUS, -_RADIUS, _RADIUS, _RADIUS)
+"""The extent of a node until it is drawn: the box of its circles"""
+
+_DRAGGABLE_HANDLERS: t.Final[dict[str, tuple[str, ...]]] = {
+    _PRESS: ("_drag_start", "_create_edge"),
+    _MOTION: ("_update_edges",),
+}
+_STATIC_HANDLERS: t.Final[dict[str, tuple[str, ...]]] = {_PRESS: ("_create_edge",)}
     
 class CanvasNode(_node.CanvasNode):
-    __slots__: t.Sequence[str] = ("_manager", "_canvas", "_label", "_component_id", "_obj_container", "_config", "_edges")
+    __slots__: t.Sequence[str] = (
+        "_manager", "_canvas", "_label", "_obj_container", "_config", "_edges", "_store", "_slot", "_drag_offset"
+    )
 
     def __init__(
         self, 
@@ -50,15 +67,22 @@ class CanvasNode(_node.CanvasNode):
         self._canvas = canvas
         self._label = label
 
-        self._component_id: t.Optional[str] = None
         self._config = config
         self._edges: set[CanvasEdge] = set()
 
-        self._obj_container = obj_container(self._canvas, disabled=not self._config.enable_dragging)
-        if self._config.enable_dragging:
-            self._obj_container.bind("<B1-Motion>", self._update_edges)
-            
-        self._obj_container.bind("<Button-1>", self._create_edge)
+        # The position of the node is kept in world coordinates so geometry queries never have to go through
+        # the canvas, the canvas objects are at the canvas position they were last drawn or projected at.
+        # The extent is the bounding box of the node relative to its center in canvas coordinates.
+        # All three live in the node store of the manager.
+        self._store = manager.node_store
+        self._slot = self._store.add(_EXTENT)
+        self._drag_offset: tuple[float, float] = (0, 0)
+
+        # The node drags its container itself, see `_drag_start` and `_update_edges`
+        self._obj_container = obj_container(self._canvas, disabled=True)
+        self._canvas.dispatcher.attach(
+            self.canvas_id, self, _DRAGGABLE_HANDLERS if self._config.enable_dragging else _STATIC_HANDLERS
+        )
 
     @property
     def manager(self) -> NetManager:
@@ -66,11 +90,7 @@ class CanvasNode(_node.CanvasNode):
 
     @property
     def component_id(self) -> t.Optional[str]:
-        return self._component_id
-    
-    @component_id.setter
-    def component_id(self, id_: t.Optional[str]) -> None:
-        self._component_id = id_
+        return self._manager.component_manager.get_tag(self)
 
     @property
     def label(self) -> str:
@@ -93,12 +113,65 @@ class CanvasNode(_node.CanvasNode):
         return self._config
     
     @property
-    def edges(self) -> list[CanvasEdge]:
+    def edges(self) -> set[CanvasEdge]:
         return self._edges
     
+    @property
+    def slot(self) -> int:
+        """
+        The offset of the node in the node store of its manager, raises RuntimeError once the node was removed
+        """
+        if self._slot < 0:
+            raise RuntimeError("The node was removed from its manager")
+
+        return self._slot
+
+    @property
+    def is_rendered(self) -> bool:
+        return self._store.position(self.slot) is not None
+
+    def get_position(self) -> tuple[float, float]:
+        position = self._store.position(self.slot)
+        if position is None:
+            raise RuntimeError("The node has to be rendered before its position is known")
+
+        return position
+
     def get_center(self) -> tuple[float, float]:
-        box = self._canvas.bbox(self.canvas_id)
-        return (box[0] + box[2]) / 2, (box[1] + box[3]) / 2
+        x, y = self.get_position()
+        return self._manager.view.to_canvas(x, y)
+
+    def get_bbox(self) -> tuple[float, float, float, float]:
+        x, y = self.get_center()
+        left, top, right, bottom = self._store.extent(self.slot)
+        return x + left, y + top, x + right, y + bottom
+
+    def move(self, delta_x: float, delta_y: float) -> None:
+        # The store raises for a removed node before anything is queued on the canvas
+        self.on_move(delta_x, delta_y)
+        self._canvas.scheduler.move(self.canvas_id, delta_x, delta_y)
+        self._canvas.scheduler.update_edges(self._edges)
+
+    def on_move(self, delta_x: float, delta_y: float) -> None:
+        # Called for every node of a dragged component on every frame, the store moves the node in one call
+        self._store.move(self.slot, delta_x, delta_y, self._manager.view.scale)
+        self._manager.spatial_index.invalidate(self)
+
+    def release(self) -> None:
+        """
+        Give the slot of the node in the node store back, called by the manager once the node was removed
+        """
+        self._store.release(self.slot)
+        self._slot = -1
+
+    def project(self) -> None:
+        # Only the objects are moved, the size of the node stays the same at every zoom level
+        x, y = self.get_center()
+        drawn_x, drawn_y = self._store.drawn_at(self.slot)
+        delta_x, delta_y = x - drawn_x, y - drawn_y
+        if delta_x or delta_y:
+            self._canvas.scheduler.move(self.canvas_id, delta_x, delta_y)
+            self._store.set_drawn_at(self.slot, x, y)
     
     def _create_edge(self, event: tk.Event) -> None:
         if self._canvas.active_node is not None:
@@ -110,16 +183,44 @@ class CanvasNode(_node.CanvasNode):
             self._canvas.start_dynamic_line(self)
             
     
+    def _drag_start(self, event: tk.Event) -> None:
+        self._obj_container.on_click(event)
+        x, y = self.get_center()
+        self._drag_offset = (x - event.x, y - event.y)
+
     def _update_edges(self, event: tk.Event) -> None:
-        for edge in self._edges:
-            edge.update()
+        # The object container moves the canvas objects by the same amount
+        self._obj_container.on_drag(event)
+        x, y = self.get_center()
+        self.on_move(event.x + self._drag_offset[0] - x, event.y + self._drag_offset[1] - y)
+        self._canvas.scheduler.update_edges(self._edges)
 
     def render(self, pos: tuple[int, int])  -> None:
-        ids = self.draw(pos)
-        objects = _convert_to_canvas_objects(self._canvas, ids)
-        self._obj_container.add(*objects)
+        if not self.is_rendered or (pos[0], pos[1]) != self.get_center():
+            # Drawing a node again at its own center mustn't move it by a rounding error
+            self._store.set_position(self.slot, *self._manager.view.to_world(pos[0], pos[1]))
+
+        self._store.set_drawn_at(self.slot, pos[0], pos[1])
+        self._manager.spatial_index.invalidate(self)
+        if self._manager.defer_render(self):
+            return
+
+        self._obj_container.render(self.draw(pos))
+
+        box = self._canvas.bbox(self.canvas_id)
+        if box is not None:
+            self._store.set_extent(self.slot, (box[0] - pos[0], box[1] - pos[1], box[2] - pos[0], box[3] - pos[1]))
     
     def draw(self, pos: tuple[int, int]) -> CanvasObjectsLike:
-        yield from self._canvas.create_double_circle(pos, 10, 50)
-        yield self._canvas.create_text(pos, text=self._label, fill=self._config.label_color)
+        detail = self._manager.detail
+        if self._config.sprite:
+            image = self._manager.sprites.get(
+                _RADIUS, _SPACE, _BORDER, "black", antialiased=self._config.antialiased, detailed=detail.borders
+            )
+            yield self._canvas.create_image(pos, image=image)
+        else:
+            yield from self._canvas.create_double_circle(pos, _SPACE, _RADIUS, detailed=detail.borders)
+
+        if detail.text:
+            yield self._canvas.create_text(pos, text=self._label, fill=self._config.label_color)
     
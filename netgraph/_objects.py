@@ -23,6 +23,7 @@ import typing as t
 
 from netgraph.api import _objects
 from netgraph import _math
+from netgraph._dispatch import _MOTION, _PRESS
 
 if t.TYPE_CHECKING:
     import tkinter as tk
@@ -61,14 +62,17 @@ class CanvasEdgeTextObject(CanvasObject):
         self._config = config
 
         super().__init__(*args, **kwargs)
+
+    @property
+    def config(self) -> EdgeTextConfig:
+        return self._config
     
     def coords(self, *positions: float) -> None:
         if self._edge.is_selfloop:
-            node = self._edge.endpoints[0]
-            box = self._canvas.bbox(node.canvas_id)
-            offset = abs(self._edge._config.offset) / 2 * self._edge._position
+            box = self._edge.endpoints[0].get_bbox()
+            offset = abs(self._edge.config.offset) / 2 * self._edge.position
             x, y = _math._calc_selfloop_text_pos(box, offset)
-            y -= self._config.gap
+            self.place(x, y - self._config.gap)
 
         else:
             pos1 = t.cast(tuple[float, float], positions[:2])
@@ -77,12 +81,25 @@ class CanvasEdgeTextObject(CanvasObject):
             distance = self._edge.config.offset * self._edge.position
             point = _math._calc_offset_point(pos2, pos1, pos3, distance / 2)
             x, y, angle = _math._calc_text_position(point, pos1, pos3, self._config.gap)
+            self.place(x, y, angle=angle)
+
+    def place(self, x: float, y: float, *, angle: t.Optional[float] = None) -> None:
+        """
+        Move the text to the given position and rotate it to the given angle, if any
+        """
+        if angle is not None:
             self.canvas.itemconfig(self.canvas_id, angle=angle)
 
         self.canvas.coords(self.canvas_id, x, y)
 
+_DRAG_HANDLERS: t.Final[dict[str, tuple[str, ...]]] = {_PRESS: ("on_click",), _MOTION: ("on_drag",)}
+
 class _ObjectContainer(_objects.ObjectContainer):
-    """A container class that manages tkinter canvas objects using their object ID"""
+    """
+    A container class that manages tkinter canvas objects using their object ID.
+    Plain canvas items are kept as their ID, only objects with behaviour of their own (e.g. edge texts)
+    are kept as `CanvasObject`, the wrappers of plain items are created when `objects` is read.
+    """
     _id_iter = itertools.count()
 
     __slots__: t.Sequence[str] = ("_disabled", "_canvas", "_id", "_drag_x", "_drag_y", "_tags", "_objects")
@@ -92,20 +109,25 @@ class _ObjectContainer(_objects.ObjectContainer):
         self._id = f"tag{next(self._id_iter)}"
 
         self._disabled = disabled
-        self._tags: list[str] = [self._id]
+        # The tags besides the container tag, most containers never get one
+        self._tags: t.Optional[list[str]] = None
 
         if self._disabled is False:
             self._create_drag_binds()
 
-        self._objects: list[_objects.CanvasObject] = []
+        # A tuple, containers without objects share the empty one
+        self._objects: tuple[t.Union[int, _objects.CanvasObject], ...] = ()
+
+    def __len__(self) -> int:
+        return len(self._objects)
 
     @property
     def objects(self) -> list[_objects.CanvasObject]:
-        return self._objects
+        return [CanvasObject(obj, self._canvas) if type(obj) is int else obj for obj in self._objects]  # type: ignore[misc]
 
     @property
     def tags(self) -> list[str]:
-        return self._tags
+        return [self._id, *(self._tags or ())]
 
     @property
     def canvas(self) -> NetCanvas:
@@ -116,48 +138,78 @@ class _ObjectContainer(_objects.ObjectContainer):
         return self._id
     
     def _create_drag_binds(self) -> None:
-        self._canvas.tag_bind(self._id, "<ButtonPress-1>", self.on_click)
-        self._canvas.tag_bind(self._id, "<B1-Motion>", self.on_drag)
+        self._canvas.dispatcher.attach(self._id, self, _DRAG_HANDLERS)
     
-    def _get_object_ids(self) -> tuple[int, ...]:
-        return t.cast(tuple[int, ...], self._canvas.find_withtag(self._id))
-
     def add(self, *objects: _objects.CanvasObject) -> None:
+        tags = self.tags
         for obj in objects:
-            for tag in self._tags:
+            for tag in tags:
                 self._canvas.addtag_withtag(tag, obj.canvas_id)
 
-        self._objects.extend(objects)
+        self._objects += tuple(_unwrap(obj) for obj in objects)
+
+    def render(self, ids: CanvasObjectsLike) -> None:
+        # The generator creates the objects, tag them while they are created.
+        # Reused items are configured with buffered commands, sent together once all objects are drawn.
+        with self._canvas.tagging(self.tags), self._canvas.buffering():
+            self._objects += tuple(_convert_to_canvas_objects(self._canvas, ids))
 
     def add_tag(self, tag: str) -> None:
+        if self._tags is None:
+            self._tags = []
+
         self._tags.append(tag)
-        for object in self._get_object_ids():
-            self._canvas.addtag_withtag(tag, object)
+        # the container tag addresses all objects at once
+        self._canvas.addtag_withtag(tag, self._id)
 
     def remove_tag(self, tag: str) -> None:
+        if self._tags is None:
+            raise ValueError(f"The container doesn't have the tag {tag}")
+
         self._tags.remove(tag)
-        for object in self._get_object_ids():
-            self._canvas.dtag(tag, object)
+        self._canvas.dtag(self._id, tag)
 
     def remove(self, *objects: _objects.CanvasObject) -> None:
+        removed = [_unwrap(obj) for obj in objects]
         for obj in objects:
             self._canvas.dtag(obj.canvas_id, self._id)
-            self._objects.remove(obj)
+
+        remaining = list(self._objects)
+        for obj in removed:
+            remaining.remove(obj)
+        self._objects = tuple(remaining)
 
     def remove_all(self) -> None:
-        self._canvas.delete(self._id)
-        self._objects = []
+        # Pooled items are hidden to be reused by the next objects drawn, instead of being deleted
+        self._canvas.release_items(self._id, [item for item, _ in self.items()])
+        self._objects = ()
 
     def coords(self, *positions: float) -> None:
         for obj in self._objects:
-            obj.coords(*positions)
+            if type(obj) is int:
+                self._canvas.coords(obj, *positions)
+            else:
+                obj.coords(*positions)  # type: ignore[union-attr]
+
+    def items(self) -> t.Iterator[tuple[int, t.Optional[_objects.CanvasObject]]]:
+        """
+        The canvas ID of every object with the object itself, or None for plain canvas items
+        """
+        for obj in self._objects:
+            if type(obj) is int:
+                yield obj, None  # type: ignore[misc]
+            else:
+                yield obj.canvas_id, obj  # type: ignore[union-attr]
 
     def lower(self) -> None:
-        for object in self._get_object_ids():
-            self._canvas.tag_lower(object)
+        # Keeps the relative order of the objects
+        self._canvas.tag_lower(self._id)
+
+    def lift(self) -> None:
+        self._canvas.tag_raise(self._id)
 
     def bind(self, event: str, callback: t.Callable[[tk.Event], None]) -> None:
-        self._canvas.tag_bind(self._id, event, callback, "+")
+        self._canvas.dispatcher.bind(self._id, event, callback)
 
     @property
     def drag_data(self) -> tuple[int, int]:
@@ -170,7 +222,7 @@ class _ObjectContainer(_objects.ObjectContainer):
     def on_drag(self, event: tk.Event) -> None:
         delta_x = event.x - self._drag_x
         delta_y = event.y - self._drag_y
-        self._canvas.move(self._id, delta_x, delta_y)
+        self._canvas.scheduler.move(self._id, delta_x, delta_y)
 
         self._drag_x = event.x
         self._drag_y = event.y
@@ -178,18 +230,25 @@ class _ObjectContainer(_objects.ObjectContainer):
         if self._canvas.active_node is not None:
             self._canvas.stop_dynamic_line()
 
-def _convert_to_canvas_objects(canvas: NetCanvas, ids: CanvasObjectsLike) -> list[_objects.CanvasObject]:
+def _unwrap(obj: _objects.CanvasObject) -> t.Union[int, _objects.CanvasObject]:
     """
-    Converts the given canvas IDs or objects to a CanvasObject instance 
+    The canvas ID of a plain `CanvasObject`, which the container keeps instead of the wrapper
     """
-    objects: list[_objects.CanvasObject] = []
+    return obj.canvas_id if type(obj) is CanvasObject else obj
 
-    for obj in ids:
-        if isinstance(obj, _objects.CanvasObject):
+def _convert_to_canvas_objects(canvas: NetCanvas, ids: CanvasObjectsLike) -> list[t.Union[int, _objects.CanvasObject]]:
+    """
+    Converts the given canvas IDs or objects to what a container keeps: the ID of plain canvas items and
+    the `CanvasObject` of everything else
+    """
+    objects: list[t.Union[int, _objects.CanvasObject]] = []
 
+    for obj in ids:
+        # Checked first, the protocol check of CanvasObject is slow
+        if type(obj) is int:
             objects.append(obj)
 
-        if isinstance(obj, int):
-            objects.append(CanvasObject(obj, canvas))
+        elif isinstance(obj, _objects.CanvasObject):
+            objects.append(_unwrap(obj))
 
     return objects
\ No newline at end of file
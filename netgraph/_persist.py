@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+# Copyright © YodaPY 2024-present
+#
+# This file is part of tk-netgraph.
+#
+# tk-netgraph is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# tk-netgraph is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with tk-netgraph. If not, see <https://www.gnu.org/licenses/>.
+from __future__ import annotations
+
+import math
+import os
+import typing as t
+
+try:
+    import numpy as np
+except ImportError: # numpy is optional, graphs can only be saved and loaded with it
+    np = None # type: ignore[assignment]
+
+if t.TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from netgraph import NetManager
+    from netgraph.api._config import EdgeConfig, NodeConfig
+    from netgraph.api._edge import CanvasEdge
+    from netgraph.api._node import CanvasNode
+
+_File = t.Union[str, "os.PathLike[str]", t.BinaryIO]
+_C = t.TypeVar("_C")
+
+_FORMAT_VERSION: t.Final[int] = 1
+_DEFAULT_CONFIG: t.Final[int] = -1
+"""The config reference of nodes and edges that use the config of the `NetManager`"""
+
+def _require_numpy() -> None:
+    if np is None:
+        raise RuntimeError("Saving and loading graphs requires numpy")
+
+def _pack_strings(strings: t.Sequence[str]) -> tuple[NDArray, NDArray]:
+    """
+    Store strings as one UTF-8 buffer and the offset at which each string ends
+    """
+    encoded = [string.encode() for string in strings]
+    offsets = np.cumsum([len(data) for data in encoded], dtype=np.int64)
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+def _unpack_strings(data: NDArray, offsets: NDArray) -> list[str]:
+    buffer = data.tobytes()
+    ends = offsets.tolist()
+    return [buffer[start:end].decode() for start, end in zip([0, *ends], ends)]
+
+def _config_references(configs: t.Iterable[_C], default: _C, known: t.Sequence[_C], kind: str) -> NDArray:
+    indexes = {id(config): index for index, config in enumerate(known)}
+    references: list[int] = []
+    for config in configs:
+        if config is default:
+            references.append(_DEFAULT_CONFIG)
+        elif (index := indexes.get(id(config))) is not None:
+            references.append(index)
+        else:
+            raise ValueError(f"A {kind} uses a config that is neither the default one nor in {kind}_configs")
+
+    return np.array(references, dtype=np.int32)
+
+def _runs(references: NDArray) -> t.Iterator[tuple[int, int, int]]:
+    """
+    The start, stop and config reference of every run of equal config references
+    """
+    if not len(references):
+        return
+
+    starts = [0, *(np.flatnonzero(np.diff(references)) + 1).tolist()]
+    for start, stop in zip(starts, [*starts[1:], len(references)]):
+        yield start, stop, int(references[start])
+
+def _save_graph(
+    manager: NetManager,
+    file: _File,
+    *,
+    node_configs: t.Sequence[NodeConfig],
+    edge_configs: t.Sequence[EdgeConfig],
+    compress: bool
+) -> None:
+    _require_numpy()
+    nodes = manager.nodes
+    edges = manager.edges
+    node_ids = {node: index for index, node in enumerate(nodes)}
+
+    positions = np.full((len(nodes), 2), np.nan)
+    for index, node in enumerate(nodes):
+        if node.is_rendered:
+            positions[index] = node.get_position()
+
+    roots: dict[str, int] = {}
+    components = np.array([
+        roots.setdefault(tag, len(roots)) if (tag := manager.component_manager.get_tag(node)) is not None else -1
+        for node in nodes
+    ], dtype=np.int64)
+
+    node_labels, node_label_offsets = _pack_strings([node.label for node in nodes])
+    edge_labels, edge_label_offsets = _pack_strings([edge.label for edge in edges])
+    weights = [edge.weight for edge in edges]
+
+    columns: dict[str, NDArray] = {
+        "version": np.array(_FORMAT_VERSION),
+        "node_labels": node_labels,
+        "node_label_offsets": node_label_offsets,
+        "node_positions": positions,
+        "node_components": components,
+        "node_configs": _config_references(
+            (node.config for node in nodes), manager.config.node_config, node_configs, "node"
+        ),
+        "edge_endpoints": np.array(
+            [(node_ids[edge.endpoints[0]], node_ids[edge.endpoints[1]]) for edge in edges], dtype=np.int64
+        ).reshape(-1, 2),
+        "edge_labels": edge_labels,
+        "edge_label_offsets": edge_label_offsets,
+        "edge_weights": np.array([weight if weight is not None else 0 for weight in weights], dtype=np.int64),
+        "edge_weighted": np.array([weight is not None for weight in weights], dtype=bool),
+        "edge_positions": np.array([edge.position for edge in edges], dtype=np.int32),
+        "edge_configs": _config_references(
+            (edge.config for edge in edges), manager.config.edge_config, edge_configs, "edge"
+        ),
+    }
+    (np.savez_compressed if compress else np.savez)(file, **columns)
+
+def _resolve_config(reference: int, configs: t.Sequence[_C], kind: str) -> t.Optional[_C]:
+    if reference == _DEFAULT_CONFIG:
+        return None
+
+    if not 0 <= reference < len(configs):
+        raise ValueError(f"The file references {kind} config {reference}, but only {len(configs)} {kind}_configs were given")
+
+    return configs[reference]
+
+def _load_graph(
+    manager: NetManager,
+    file: _File,
+    *,
+    node_configs: t.Sequence[NodeConfig],
+    edge_configs: t.Sequence[EdgeConfig],
+    render: bool
+) -> tuple[list[CanvasNode], list[CanvasEdge]]:
+    _require_numpy()
+    with np.load(file, allow_pickle=False) as data:
+        if int(data["version"]) != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported graph file version {int(data['version'])}")
+
+        columns = {name: data[name] for name in data.files}
+
+    node_labels = _unpack_strings(columns["node_labels"], columns["node_label_offsets"])
+    edge_labels = _unpack_strings(columns["edge_labels"], columns["edge_label_offsets"])
+
+    with manager.batch():
+        nodes: list[CanvasNode] = []
+        for start, stop, reference in _runs(columns["node_configs"]):
+            nodes += manager.add_nodes_from(
+                node_labels[start:stop], config=_resolve_config(reference, node_configs, "node")
+            )
+
+        # Positions are stored in world coordinates, nodes are rendered at their place in the current view
+        view = manager.view
+        manager.set_positions({
+            node: view.to_canvas(x, y)
+            for node, (x, y) in zip(nodes, columns["node_positions"].tolist())
+            if not math.isnan(x)
+        })
+
+        endpoints = columns["edge_endpoints"].tolist()
+        weights = [
+            weight if weighted else None
+            for weight, weighted in zip(columns["edge_weights"].tolist(), columns["edge_weighted"].tolist())
+        ]
+        positions = columns["edge_positions"].tolist()
+        edges: list[CanvasEdge] = []
+        for start, stop, reference in _runs(columns["edge_configs"]):
+            edges += manager.add_edges_from(
+                (
+                    (nodes[first], nodes[second], label, weight)
+                    for (first, second), label, weight in zip(
+                        endpoints[start:stop], edge_labels[start:stop], weights[start:stop]
+                    )
+                ),
+                _resolve_config(reference, edge_configs, "edge"),
+                render=render,
+                positions=positions[start:stop]
+            )
+
+    return nodes, edges
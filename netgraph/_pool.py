@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+# Copyright © YodaPY 2024-present
+#
+# This file is part of tk-netgraph.
+#
+# tk-netgraph is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# tk-netgraph is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with tk-netgraph. If not, see <https://www.gnu.org/licenses/>.
+from __future__ import annotations
+
+import typing as t
+
+_PoolKey = tuple[str, ...]
+"""The kind of a canvas item followed by the sorted names of the options it was created with"""
+
+_MAX_KEYS: t.Final[int] = 255
+"""The number of different keys an item can be tracked with, a key is stored as one byte per item"""
+
+class _ItemPool:
+    """
+    Keeps hidden canvas items of removed nodes and edges to draw new ones with, instead of deleting items
+    and creating new ones. An item is only handed out for an item of the same kind created with the same options,
+    so every option the item was created with is set again when it is reused.
+    Only the items created for object containers are tracked, see `NetCanvas.release_items`.
+    """
+    __slots__: t.Sequence[str] = (
+        "_keys", "_key_list", "_key_indices", "_free", "_free_count", "_max_size", "_hits", "_misses"
+    )
+
+    def __init__(self, max_size: int) -> None:
+        # The index of the key of every item in use by its canvas ID, 0 for items that are not tracked.
+        # Canvas IDs are small consecutive numbers, so one byte per item is all the pool keeps of the items in use.
+        self._keys = bytearray()
+        self._key_list: list[_PoolKey] = [()]
+        self._key_indices: dict[_PoolKey, int] = {}
+        self._free: dict[_PoolKey, dict[int, None]] = {} # the hidden items of every key as an ordered set
+        self._free_count = 0
+        self._max_size = max_size
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        """
+        The number of hidden items waiting to be reused
+        """
+        return self._free_count
+
+    @property
+    def max_size(self) -> int:
+        """
+        The maximum number of hidden items, released items beyond it are deleted. 0 disables the pool.
+        """
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, max_size: int) -> None:
+        self._max_size = max_size
+
+    @property
+    def hits(self) -> int:
+        """
+        The number of items that were drawn by reusing a hidden item
+        """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """
+        The number of pooled items that had to be created because no hidden item of their kind was left
+        """
+        return self._misses
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_size > 0
+
+    def acquire(self, key: _PoolKey) -> t.Optional[int]:
+        """
+        A hidden item for the given key, None if there is none and the item has to be created
+        """
+        if free := self._free.get(key):
+            self._hits += 1
+            self._free_count -= 1
+            item, _ = free.popitem()
+            self._keys[item] = self._key_indices[key]
+            return item
+
+        self._misses += 1
+        return None
+
+    def track(self, item: int, key: _PoolKey) -> None:
+        """
+        Remember the key of a newly created item, so it can be reused once it is released
+        """
+        index = self._key_indices.get(key)
+        if index is None:
+            if len(self._key_list) > _MAX_KEYS:
+                return
+
+            index = self._key_indices[key] = len(self._key_list)
+            self._key_list.append(key)
+
+        if item >= len(self._keys):
+            self._keys.extend(bytes(item + 1 - len(self._keys)))
+
+        self._keys[item] = index
+
+    def release(self, items: t.Iterable[int]) -> list[int]:
+        """
+        Take back the given items and return those that have to be hidden.
+        Items the pool doesn't know or has no room for are left to be deleted.
+        """
+        hidden: list[int] = []
+        keys = self._keys
+        for item in items:
+            if item >= len(keys) or not keys[item] or self._free_count >= self._max_size:
+                continue
+
+            self._free.setdefault(self._key_list[keys[item]], {})[item] = None
+            self._free_count += 1
+            keys[item] = 0
+            hidden.append(item)
+
+        return hidden
+
+    def forget(self, items: t.Iterable[int]) -> None:
+        """
+        Forget items that were deleted, both items in use and hidden items, which must not be handed out anymore
+        """
+        keys = self._keys
+        for item in items:
+            if item < len(keys) and keys[item]:
+                keys[item] = 0
+                continue
+
+            if not self._free_count:
+                continue
+
+            # A hidden item doesn't keep its key, there are only a few keys to look through
+            for free in self._free.values():
+                if item in free:
+                    del free[item]
+                    self._free_count -= 1
+                    break
+
+    def clear(self) -> None:
+        """
+        Forget all items, e.g. because every item of the canvas was deleted
+        """
+        self._keys = bytearray()
+        self._free.clear()
+        self._free_count = 0
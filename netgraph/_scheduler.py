@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+# Copyright © YodaPY 2024-present
+#
+# This file is part of tk-netgraph.
+#
+# tk-netgraph is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# tk-netgraph is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with tk-netgraph. If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import time
+import typing as t
+
+from netgraph._edge import _update_edges
+
+if t.TYPE_CHECKING:
+    from netgraph import NetCanvas
+    from netgraph.api._edge import CanvasEdge
+
+
+class _RenderScheduler:
+    """
+    Collects canvas moves and edges that need to be updated and applies them at most once per frame.
+    Several motion events between two frames collapse into a single move per tag and a single update per edge.
+    """
+    __slots__: t.Sequence[str] = (
+        "_canvas", "_moves", "_edges", "_options", "_pending", "_frame_rate", "_last_flush", "_suspended",
+        "_move_callbacks"
+    )
+
+    def __init__(self, canvas: NetCanvas, *, frame_rate: t.Optional[int] = None) -> None:
+        self._canvas = canvas
+        self._moves: dict[str, tuple[float, float]] = {}
+        self._edges: dict[CanvasEdge, None] = {} # used as an ordered set
+        self._options: dict[int, dict[str, t.Any]] = {}
+        self._pending: t.Optional[str] = None
+        self._frame_rate = frame_rate
+        self._last_flush = 0.0
+        self._suspended = 0
+        self._move_callbacks: list[t.Callable[[], None]] = []
+
+    @property
+    def frame_rate(self) -> t.Optional[int]:
+        """
+        The maximum number of flushes per second.
+        If None, pending work is flushed as soon as tkinter is idle, after all queued events were handled.
+        """
+        return self._frame_rate
+
+    @frame_rate.setter
+    def frame_rate(self, frame_rate: t.Optional[int]) -> None:
+        self._frame_rate = frame_rate
+
+    @property
+    def is_pending(self) -> bool:
+        return self._pending is not None
+
+    def move(self, tag: str, delta_x: float, delta_y: float) -> None:
+        """
+        Move all canvas objects with the given tag by the given amount with the next flush
+        """
+        x, y = self._moves.get(tag, (0, 0))
+        self._moves[tag] = (x + delta_x, y + delta_y)
+        self._schedule()
+
+    def update_edges(self, edges: t.Iterable[CanvasEdge]) -> None:
+        """
+        Update the coordinates of the given edges with the next flush
+        """
+        self._edges.update(dict.fromkeys(edges))
+        self._schedule()
+
+    def configure(self, object_id: int, **options: t.Any) -> None:
+        """
+        Configure the canvas object with the given ID with the next flush.
+        Options given for the same object before the flush are merged into one call.
+        """
+        self._options.setdefault(object_id, {}).update(options)
+        self._schedule()
+
+    def add_move_callback(self, callback: t.Callable[[], None]) -> None:
+        """
+        Call the callback at the end of every flush that moved canvas objects
+        """
+        self._move_callbacks.append(callback)
+
+    def suspend(self) -> None:
+        """
+        Stop flushing at idle time until `resume` is called as often as `suspend`
+        """
+        self._suspended += 1
+
+    def resume(self) -> None:
+        """
+        Undo one call to `suspend`. Pending work is flushed once the scheduler isn't suspended anymore.
+        """
+        self._suspended -= 1
+        if self._suspended == 0 and (self._moves or self._edges or self._options):
+            self.flush()
+
+    def discard(self, edge: CanvasEdge) -> None:
+        """
+        Forget a pending update of the given edge, e.g. because it was removed
+        """
+        self._edges.pop(edge, None)
+
+    def forget(self, tag: str, items: t.Iterable[int]) -> None:
+        """
+        Forget pending moves and options of the objects with the given tag, whose canvas items are the given items,
+        e.g. because the items are hidden to be reused for other objects
+        """
+        self._moves.pop(tag, None)
+        for item in items:
+            self._options.pop(item, None)
+
+    def _schedule(self) -> None:
+        if self._pending is not None or self._suspended:
+            return
+
+        if self._frame_rate is None:
+            self._pending = self._canvas.after_idle(self._on_frame)
+            return
+
+        elapsed_ms = (time.perf_counter() - self._last_flush) * 1000
+        delay = max(0, int(1000 / self._frame_rate - elapsed_ms))
+        self._pending = self._canvas.after(delay, self._on_frame)
+
+    def _on_frame(self) -> None:
+        self._pending = None
+        self.flush()
+
+    def flush(self) -> None:
+        """
+        Apply all pending moves and edge updates now
+        """
+        if self._pending is not None:
+            self._canvas.after_cancel(self._pending)
+            self._pending = None
+
+        # All updates of a frame reach Tcl in one call
+        with self._canvas.buffering():
+            moves, self._moves = self._moves, {}
+            for tag, (delta_x, delta_y) in moves.items():
+                if delta_x or delta_y:
+                    self._canvas.move(tag, delta_x, delta_y)
+
+            edges, self._edges = self._edges, {}
+            if edges:
+                _update_edges(edges)
+
+            options, self._options = self._options, {}
+            for object_id, object_options in options.items():
+                self._canvas.itemconfig(object_id, **object_options)
+
+        self._last_flush = time.perf_counter()
+        if moves:
+            for callback in self._move_callbacks:
+                callback()
@@ -0,0 +1,378 @@
+# -*- coding: utf-8 -*-
+# Copyright © YodaPY 2024-present
+#
+# This file is part of tk-netgraph.
+#
+# tk-netgraph is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# tk-netgraph is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with tk-netgraph. If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import math
+import typing as t
+
+from netgraph.api import _node, _edge
+from netgraph._edge import _compute_geometry
+
+if t.TYPE_CHECKING:
+    from netgraph.api._edge import CanvasEdge
+    from netgraph.api._node import CanvasNode
+
+_Cell = tuple[int, int]
+_Box = tuple[float, float, float, float]
+_Points = tuple[tuple[float, float], ...]
+_T = t.TypeVar("_T")
+
+def _segment_cells(x0: float, y0: float, x1: float, y1: float, size: float) -> t.Iterator[_Cell]:
+    """
+    The grid cells a line segment passes through, in order (Amanatides & Woo)
+    """
+    cell_x, cell_y = math.floor(x0 / size), math.floor(y0 / size)
+    end_x, end_y = math.floor(x1 / size), math.floor(y1 / size)
+    delta_x, delta_y = x1 - x0, y1 - y0
+    step_x = 1 if delta_x > 0 else -1
+    step_y = 1 if delta_y > 0 else -1
+
+    # The distance along the segment (0 to 1) to the next vertical and horizontal cell border
+    next_x = ((cell_x + (step_x > 0)) * size - x0) / delta_x if delta_x else math.inf
+    next_y = ((cell_y + (step_y > 0)) * size - y0) / delta_y if delta_y else math.inf
+    step_along_x = size / abs(delta_x) if delta_x else math.inf
+    step_along_y = size / abs(delta_y) if delta_y else math.inf
+
+    yield cell_x, cell_y
+    for _ in range(abs(end_x - cell_x) + abs(end_y - cell_y)):
+        if next_x < next_y:
+            cell_x += step_x
+            next_x += step_along_x
+        else:
+            cell_y += step_y
+            next_y += step_along_y
+
+        yield cell_x, cell_y
+
+def _segment_intersects_box(x0: float, y0: float, x1: float, y1: float, box: _Box) -> bool:
+    # Liang-Barsky clipping, the segment intersects if a part of it is left after clipping
+    start, end = 0.0, 1.0
+    delta_x, delta_y = x1 - x0, y1 - y0
+    for p, q in ((-delta_x, x0 - box[0]), (delta_x, box[2] - x0), (-delta_y, y0 - box[1]), (delta_y, box[3] - y0)):
+        if p == 0:
+            if q < 0:
+                return False
+            continue
+
+        ratio = q / p
+        if p < 0:
+            start = max(start, ratio)
+        else:
+            end = min(end, ratio)
+
+        if start > end:
+            return False
+
+    return True
+
+def _segment_distance(x: float, y: float, x0: float, y0: float, x1: float, y1: float) -> float:
+    delta_x, delta_y = x1 - x0, y1 - y0
+    length_sq = delta_x * delta_x + delta_y * delta_y
+    ratio = 0.0 if length_sq == 0 else max(0.0, min(1.0, ((x - x0) * delta_x + (y - y0) * delta_y) / length_sq))
+    return math.hypot(x - (x0 + ratio * delta_x), y - (y0 + ratio * delta_y))
+
+def _box_distance(x: float, y: float, box: _Box) -> float:
+    return math.hypot(max(box[0] - x, 0, x - box[2]), max(box[1] - y, 0, y - box[3]))
+
+def _boxes_intersect(first: _Box, second: _Box) -> bool:
+    return first[0] <= second[2] and second[0] <= first[2] and first[1] <= second[3] and second[1] <= first[3]
+
+class _Grid(t.Generic[_T]):
+    """
+    A uniform grid that maps each cell to the objects overlapping it. Objects are boxes or polylines.
+    """
+    __slots__: t.Sequence[str] = ("_size", "_cells", "_objects", "_bounds")
+
+    def __init__(self, size: float) -> None:
+        self._size = size
+        self._cells: dict[_Cell, set[_T]] = {}
+        # The shape and the cells of every object
+        self._objects: dict[_T, tuple[t.Union[_Box, _Points], list[_Cell]]] = {}
+        self._bounds: t.Optional[tuple[int, int, int, int]] = None
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def __contains__(self, obj: object) -> bool:
+        return obj in self._objects
+
+    def _box_cells(self, box: _Box) -> list[_Cell]:
+        x0, y0 = math.floor(box[0] / self._size), math.floor(box[1] / self._size)
+        x1, y1 = math.floor(box[2] / self._size), math.floor(box[3] / self._size)
+        return [(x, y) for x in range(x0, x1 + 1) for y in range(y0, y1 + 1)]
+
+    def _polyline_cells(self, points: _Points) -> list[_Cell]:
+        if len(points) == 2:
+            return list(_segment_cells(*points[0], *points[1], self._size))
+
+        cells: dict[_Cell, None] = {}
+        for (x0, y0), (x1, y1) in zip(points, points[1:]):
+            for cell in _segment_cells(x0, y0, x1, y1, self._size):
+                cells[cell] = None
+
+        return list(cells)
+
+    def insert(self, obj: _T, shape: t.Union[_Box, _Points]) -> None:
+        """
+        Add the object or move it to its new shape, a box (x0, y0, x1, y1) or a polyline of points
+        """
+        cells = self._polyline_cells(shape) if isinstance(shape[0], tuple) else self._box_cells(t.cast(_Box, shape))
+        entry = self._objects.get(obj)
+        if entry is not None and entry[1] == cells:
+            # Most moves stay within the same cells, only the shape changes
+            self._objects[obj] = (shape, entry[1])
+            return
+
+        self.remove(obj)
+        for cell in cells:
+            self._cells.setdefault(cell, set()).add(obj)
+
+        self._objects[obj] = (shape, cells)
+
+        x0, y0 = min(cell[0] for cell in cells), min(cell[1] for cell in cells)
+        x1, y1 = max(cell[0] for cell in cells), max(cell[1] for cell in cells)
+        if self._bounds is not None:
+            x0, y0 = min(x0, self._bounds[0]), min(y0, self._bounds[1])
+            x1, y1 = max(x1, self._bounds[2]), max(y1, self._bounds[3])
+        self._bounds = (x0, y0, x1, y1)
+
+    def remove(self, obj: _T) -> None:
+        entry = self._objects.pop(obj, None)
+        if entry is None:
+            return
+
+        for cell in entry[1]:
+            objects = self._cells[cell]
+            objects.discard(obj)
+            if not objects:
+                del self._cells[cell]
+
+        # The bounds only ever grow, they limit how far the nearest neighbour search looks
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._objects.clear()
+        self._bounds = None
+
+    def shape(self, obj: _T) -> t.Union[_Box, _Points]:
+        return self._objects[obj][0]
+
+    def candidates(self, box: _Box) -> set[_T]:
+        """
+        The objects in the cells the box overlaps, a superset of the objects overlapping the box
+        """
+        found: set[_T] = set()
+        for cell in self._box_cells(box):
+            found.update(self._cells.get(cell, ()))
+
+        return found
+
+    def ring(self, x: float, y: float, radius: int) -> set[_T]:
+        """
+        The objects in the cells at the given Chebyshev distance (in cells) from the cell that contains the point
+        """
+        center_x, center_y = math.floor(x / self._size), math.floor(y / self._size)
+        if radius == 0:
+            return set(self._cells.get((center_x, center_y), ()))
+
+        found: set[_T] = set()
+        for offset in range(-radius, radius + 1):
+            for cell in (
+                (center_x + offset, center_y - radius), (center_x + offset, center_y + radius),
+                (center_x - radius, center_y + offset), (center_x + radius, center_y + offset)
+            ):
+                found.update(self._cells.get(cell, ()))
+
+        return found
+
+    def max_radius(self, x: float, y: float) -> int:
+        """
+        The ring radius after which no cell of the grid is left
+        """
+        if self._bounds is None:
+            return -1
+
+        center_x, center_y = math.floor(x / self._size), math.floor(y / self._size)
+        return max(
+            abs(center_x - self._bounds[0]), abs(center_x - self._bounds[2]),
+            abs(center_y - self._bounds[1]), abs(center_y - self._bounds[3])
+        )
+
+    @property
+    def cell_size(self) -> float:
+        return self._size
+
+class _SpatialIndex:
+    """
+    Indexes the bounding boxes of the rendered nodes and the control polylines of the edges on a uniform grid,
+    for range and nearest neighbour queries. Moving, scaling or rendering a node only marks it as changed,
+    the node and its edges are indexed again by the next query.
+    """
+    __slots__: t.Sequence[str] = ("_nodes", "_edges", "_dirty_nodes", "_dirty_edges", "_change_callbacks")
+
+    def __init__(self, cell_size: float = 256) -> None:
+        self._nodes: _Grid[_node.CanvasNode] = _Grid(cell_size)
+        self._edges: _Grid[_edge.CanvasEdge] = _Grid(cell_size)
+        self._dirty_nodes: dict[_node.CanvasNode, None] = {}
+        self._dirty_edges: dict[_edge.CanvasEdge, None] = {}
+        self._change_callbacks: list[t.Callable[[t.Union[CanvasNode, CanvasEdge]], None]] = []
+
+    def add_change_callback(self, callback: t.Callable[[t.Union[CanvasNode, CanvasEdge]], None]) -> None:
+        """
+        Call the callback with every node or edge that is added, moved or removed
+        """
+        self._change_callbacks.append(callback)
+
+    def invalidate(self, obj: t.Union[CanvasNode, CanvasEdge]) -> None:
+        """
+        Mark a node (and with it its edges) or an edge as changed
+        """
+        if isinstance(obj, _node.CanvasNode):
+            self._dirty_nodes[obj] = None
+        else:
+            self._dirty_edges[obj] = None
+
+        if self._change_callbacks:
+            for callback in self._change_callbacks:
+                callback(obj)
+
+    def reproject(self, nodes: t.Iterable[CanvasNode]) -> None:
+        """
+        Mark nodes as changed because the view scale changed. Their world positions are the same,
+        so unlike `invalidate` this is not reported as a change.
+        """
+        self._dirty_nodes.update(dict.fromkeys(nodes))
+
+    def remove(self, obj: t.Union[CanvasNode, CanvasEdge]) -> None:
+        for callback in self._change_callbacks:
+            callback(obj)
+
+        if isinstance(obj, _node.CanvasNode):
+            self._dirty_nodes.pop(obj, None)
+            self._nodes.remove(obj)
+        else:
+            self._dirty_edges.pop(obj, None)
+            self._edges.remove(obj)
+
+    def _refresh(self) -> None:
+        if not self._dirty_nodes and not self._dirty_edges:
+            return
+
+        nodes, self._dirty_nodes = self._dirty_nodes, {}
+        edges, self._dirty_edges = self._dirty_edges, {}
+        for node in nodes:
+            if node.is_rendered:
+                self._nodes.insert(node, node.get_bbox())
+            else:
+                self._nodes.remove(node)
+
+            edges.update(dict.fromkeys(node.edges))
+
+        for edge in edges:
+            if all(node.is_rendered for node in edge.endpoints):
+                points = _compute_geometry(edge).points
+                self._edges.insert(edge, tuple(zip(points[0::2], points[1::2])))
+            else:
+                self._edges.remove(edge)
+
+    def indexed_bounds(self, obj: t.Union[CanvasNode, CanvasEdge]) -> t.Optional[_Box]:
+        """
+        The bounding box the node or edge was last indexed with, None if it isn't indexed.
+        Unlike `bounds`, a changed object's box is the one from before the change.
+        """
+        grid: _Grid[t.Any] = self._nodes if isinstance(obj, _node.CanvasNode) else self._edges
+        if obj not in grid:
+            return None
+
+        shape = grid.shape(obj)
+        if isinstance(obj, _node.CanvasNode):
+            return t.cast(_Box, shape)
+
+        xs = [point[0] for point in t.cast(_Points, shape)]
+        ys = [point[1] for point in t.cast(_Points, shape)]
+        return min(xs), min(ys), max(xs), max(ys)
+
+    def bounds(self, obj: t.Union[CanvasNode, CanvasEdge]) -> t.Optional[_Box]:
+        """
+        The current bounding box of the node or the control polyline of the edge, None if it isn't rendered
+        """
+        self._refresh()
+        return self.indexed_bounds(obj)
+
+    def intersects(self, obj: t.Union[CanvasNode, CanvasEdge], box: _Box) -> bool:
+        """
+        Whether the indexed node or edge overlaps the box, False if it isn't indexed
+        """
+        self._refresh()
+        if isinstance(obj, _node.CanvasNode):
+            return obj in self._nodes and _boxes_intersect(t.cast(_Box, self._nodes.shape(obj)), box)
+
+        if obj not in self._edges:
+            return False
+
+        points = t.cast(_Points, self._edges.shape(obj))
+        return any(_segment_intersects_box(*start, *end, box) for start, end in zip(points, points[1:]))
+
+    def nodes_in(self, box: _Box) -> list[CanvasNode]:
+        self._refresh()
+        return [node for node in self._nodes.candidates(box) if _boxes_intersect(t.cast(_Box, self._nodes.shape(node)), box)]
+
+    def edges_in(self, box: _Box) -> list[CanvasEdge]:
+        self._refresh()
+        return [edge for edge in self._edges.candidates(box) if self.intersects(edge, box)]
+
+    def _nearest(
+        self, grid: _Grid[_T], x: float, y: float, distance: t.Callable[[_T], float], max_distance: t.Optional[float]
+    ) -> t.Optional[tuple[_T, float]]:
+        best: t.Optional[tuple[_T, float]] = None
+        limit = grid.max_radius(x, y)
+        if max_distance is not None:
+            limit = min(limit, math.ceil(max_distance / grid.cell_size))
+
+        radius = 0
+        while radius <= limit:
+            for obj in grid.ring(x, y, radius):
+                current = distance(obj)
+                if (max_distance is None or current <= max_distance) and (best is None or current < best[1]):
+                    best = (obj, current)
+
+            # Everything closer than the inner border of the next ring has been seen
+            if best is not None and best[1] <= radius * grid.cell_size:
+                break
+
+            radius += 1
+
+        return best
+
+    def nearest_node(self, x: float, y: float, max_distance: t.Optional[float] = None) -> t.Optional[CanvasNode]:
+        self._refresh()
+        found = self._nearest(
+            self._nodes, x, y, lambda node: _box_distance(x, y, t.cast(_Box, self._nodes.shape(node))), max_distance
+        )
+        return found[0] if found is not None else None
+
+    def nearest_edge(self, x: float, y: float, max_distance: t.Optional[float] = None) -> t.Optional[CanvasEdge]:
+        self._refresh()
+
+        def distance(edge: CanvasEdge) -> float:
+            points = t.cast(_Points, self._edges.shape(edge))
+            return min(_segment_distance(x, y, *start, *end) for start, end in zip(points, points[1:]))
+
+        found = self._nearest(self._edges, x, y, distance, max_distance)
+        return found[0] if found is not None else None
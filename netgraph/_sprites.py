@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+# Copyright © YodaPY 2024-present
+#
+# This file is part of tk-netgraph.
+#
+# tk-netgraph is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# tk-netgraph is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with tk-netgraph. If not, see <https://www.gnu.org/licenses/>.
+from __future__ import annotations
+
+import typing as t
+
+try:
+    from PIL import Image, ImageDraw
+except ImportError: # Pillow is optional, nodes can only be drawn as sprites with it
+    Image = ImageDraw = None # type: ignore[assignment]
+
+if t.TYPE_CHECKING:
+    from netgraph import NetCanvas
+
+_SUPERSAMPLING: t.Final[int] = 4
+"""Antialiased sprites are drawn this many times larger and scaled down"""
+
+class _SpriteKey(t.NamedTuple):
+    """Everything that decides how a node sprite looks. Nodes with equal keys share one image."""
+    radius: int
+    space: int
+    """The space between the outer and the inner circle"""
+    border: int
+    color: str
+    background: str
+    antialiased: bool
+    detailed: bool
+    """Whether the node has its two border circles or is a single filled circle"""
+
+def _render_sprite(canvas: NetCanvas, key: _SpriteKey) -> Image.Image:
+    """
+    Draw the circles of `NetCanvas.create_double_circle` into a transparent image of the same size
+    """
+    scale = _SUPERSAMPLING if key.antialiased else 1
+    size = 2 * key.radius
+    # Tk knows more color names than Pillow, e.g. the system colors
+    color, background = ((*(value >> 8 for value in canvas.winfo_rgb(c)), 255) for c in (key.color, key.background))
+
+    image = Image.new("RGBA", (size * scale, size * scale), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    center = key.radius * scale
+
+    def disc(radius: int, fill: tuple[int, ...]) -> None:
+        draw.ellipse(
+            (center - radius * scale, center - radius * scale, center + radius * scale - 1, center + radius * scale - 1),
+            fill=fill
+        )
+
+    if key.detailed:
+        for radius in (key.radius, key.radius - key.space):
+            disc(radius, color)
+            disc(radius - key.border, background)
+    else:
+        disc(key.radius, color)
+
+    if scale > 1:
+        image = image.resize((size, size), Image.LANCZOS)
+
+    return image
+
+class _SpriteCache:
+    """
+    Pre-rendered node images, one per distinct look. Every node with the same look is a single image item
+    that shows the same image instead of four circles.
+
+    The images are bound to the background of the canvas and the detail level they were drawn for. The cache
+    is cleared by `NetManager.redraw`, which draws all nodes again, e.g. when the detail level changed.
+    """
+    __slots__: t.Sequence[str] = ("_canvas", "_images", "_background")
+
+    def __init__(self, canvas: NetCanvas) -> None:
+        self._canvas = canvas
+        # The images have to be referenced for as long as they are drawn, Tk deletes them otherwise
+        self._images: dict[_SpriteKey, t.Any] = {}
+        self._background: t.Optional[str] = None
+
+    def __len__(self) -> int:
+        return len(self._images)
+
+    @property
+    def background(self) -> str:
+        """
+        The background color of the canvas when the cache was last cleared
+        """
+        if self._background is None:
+            self._background = t.cast(str, self._canvas.cget("bg"))
+
+        return self._background
+
+    def get(self, radius: int, space: int, border: int, color: str, *, antialiased: bool, detailed: bool) -> t.Any:
+        """
+        Returns the image of a node with the given look, drawing it if it is not cached yet
+        """
+        key = _SpriteKey(radius, space, border, color, self.background, antialiased, detailed)
+        image = self._images.get(key)
+        if image is None:
+            if Image is None:
+                raise RuntimeError("Drawing nodes as sprites requires Pillow")
+
+            image = self._images[key] = self._canvas.photo_image(_render_sprite(self._canvas, key))
+
+        return image
+
+    def clear(self) -> None:
+        """
+        Forget all images. Must only be called once no canvas object shows them anymore.
+        """
+        self._images.clear()
+        self._background = None
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+# Copyright © YodaPY 2024-present
+#
+# This file is part of tk-netgraph.
+#
+# tk-netgraph is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# tk-netgraph is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with tk-netgraph. If not, see <https://www.gnu.org/licenses/>.
+from __future__ import annotations
+
+import array
+import math
+import typing as t
+
+_NAN: t.Final[float] = math.nan
+_FIELDS: t.Final[int] = 8
+"""The number of floats kept per node: the position, the drawn position and the extent"""
+_NO_WEIGHT: t.Final[int] = -2 ** 63
+"""Marks an edge without a weight in the weight column of `_EdgeStore`"""
+_OTHER_WEIGHT: t.Final[int] = -2 ** 63 + 1
+"""Marks a weight that isn't an int of the weight column, it's kept in `_EdgeStore._other_weights`"""
+_MAX_WEIGHT: t.Final[int] = 2 ** 63 - 1
+
+class _NodeStore:
+    """
+    Keeps the geometry of the nodes of a manager in one flat array of floats instead of tuples on every node,
+    which cost a tuple and a float object per value. Every node owns a slot of `_FIELDS` floats:
+    its position in world coordinates (NaN until the node is rendered), the canvas position its objects were
+    drawn or projected at, and its extent relative to that position. Slots of removed nodes are reused.
+    """
+    __slots__: t.Sequence[str] = ("_values", "_free")
+
+    def __init__(self) -> None:
+        self._values = array.array("d")
+        self._free: dict[int, None] = {} # used as an ordered set, the last freed slot is reused first
+
+    def __len__(self) -> int:
+        return len(self._values) // _FIELDS - len(self._free)
+
+    @property
+    def nbytes(self) -> int:
+        return self._values.itemsize * len(self._values)
+
+    def add(self, extent: tuple[float, float, float, float]) -> int:
+        """
+        Reserve a slot for a new node with the given extent and return its offset
+        """
+        values = (_NAN, _NAN, 0.0, 0.0, *extent)
+        if self._free:
+            offset, _ = self._free.popitem()
+            self._values[offset:offset + _FIELDS] = array.array("d", values)
+            return offset
+
+        offset = len(self._values)
+        self._values.extend(values)
+        return offset
+
+    def release(self, offset: int) -> None:
+        """
+        Give the slot at the given offset back to be reused. Raises ValueError if it is already free,
+        two nodes would share it otherwise.
+        """
+        if offset in self._free or not 0 <= offset < len(self._values):
+            raise ValueError(f"The slot at offset {offset} is not in use")
+
+        self._free[offset] = None
+
+    def position(self, offset: int) -> t.Optional[tuple[float, float]]:
+        x = self._values[offset]
+        if x != x: # NaN, the node wasn't rendered yet
+            return None
+
+        return x, self._values[offset + 1]
+
+    def set_position(self, offset: int, x: float, y: float) -> None:
+        self._values[offset] = x
+        self._values[offset + 1] = y
+
+    def move(self, offset: int, delta_x: float, delta_y: float, scale: float) -> None:
+        """
+        Move a node by the given amount in canvas coordinates, both its position and where its objects are drawn
+        """
+        values = self._values
+        values[offset] += delta_x / scale
+        values[offset + 1] += delta_y / scale
+        values[offset + 2] += delta_x
+        values[offset + 3] += delta_y
+
+    def drawn_at(self, offset: int) -> tuple[float, float]:
+        return self._values[offset + 2], self._values[offset + 3]
+
+    def set_drawn_at(self, offset: int, x: float, y: float) -> None:
+        self._values[offset + 2] = x
+        self._values[offset + 3] = y
+
+    def extent(self, offset: int) -> tuple[float, float, float, float]:
+        values = self._values
+        return values[offset + 4], values[offset + 5], values[offset + 6], values[offset + 7]
+
+    def set_extent(self, offset: int, extent: tuple[float, float, float, float]) -> None:
+        self._values[offset + 4:offset + 8] = array.array("d", extent)
+
+class _EdgeStore:
+    """
+    Keeps the data of the edges of a manager in columns indexed by the slot of an edge instead of attributes on
+    every edge: the weight and the id of the component tag the canvas objects of the edge carry (-1 for none).
+    Slots of removed edges are reused. The endpoints stay on the edges, the edge index shares their tuple as its key.
+    Weights are ints in the column, any other weight (a float, a string, an int beyond 64 bits) is kept as it is
+    in a dict, so every weight is given back unchanged.
+    """
+    __slots__: t.Sequence[str] = ("_weights", "_other_weights", "_components", "_free")
+
+    def __init__(self) -> None:
+        self._weights = array.array("q")
+        self._other_weights: dict[int, t.Any] = {}
+        self._components = array.array("i") # component ids are counted up from 0 and stay far below 2**31
+        self._free: dict[int, None] = {}
+
+    def __len__(self) -> int:
+        return len(self._weights) - len(self._free)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(column.itemsize * len(column) for column in (self._weights, self._components))
+
+    def add(self, weight: t.Any) -> int:
+        """
+        Reserve a slot for a new edge with the given weight and return it
+        """
+        if self._free:
+            slot, _ = self._free.popitem()
+            self._components[slot] = -1
+        else:
+            slot = len(self._weights)
+            self._weights.append(_NO_WEIGHT)
+            self._components.append(-1)
+
+        self.set_weight(slot, weight)
+        return slot
+
+    def release(self, slot: int) -> None:
+        """
+        Give the given slot back to be reused. Raises ValueError if it is already free.
+        """
+        if slot in self._free or not 0 <= slot < len(self._weights):
+            raise ValueError(f"The edge slot {slot} is not in use")
+
+        self._free[slot] = None
+        self._other_weights.pop(slot, None)
+
+    def weight(self, slot: int) -> t.Any:
+        value = self._weights[slot]
+        if value == _NO_WEIGHT:
+            return None
+        if value == _OTHER_WEIGHT:
+            return self._other_weights[slot]
+
+        return value
+
+    def set_weight(self, slot: int, weight: t.Any) -> None:
+        self._other_weights.pop(slot, None)
+        if weight is None:
+            self._weights[slot] = _NO_WEIGHT
+        elif type(weight) is int and _OTHER_WEIGHT < weight <= _MAX_WEIGHT:
+            self._weights[slot] = weight
+        else:
+            self._weights[slot] = _OTHER_WEIGHT
+            self._other_weights[slot] = weight
+
+    def component(self, slot: int) -> int:
+        return self._components[slot]
+
+    def set_component(self, slot: int, component: int) -> None:
+        self._components[slot] = component
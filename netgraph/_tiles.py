@@ -0,0 +1,387 @@
+# -*- coding: utf-8 -*-
+# Copyright © YodaPY 2024-present
+#
+# This file is part of tk-netgraph.
+#
+# tk-netgraph is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# tk-netgraph is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with tk-netgraph. If not, see <https://www.gnu.org/licenses/>.
+from __future__ import annotations
+
+import collections
+import functools
+import math
+import typing as t
+
+try:
+    from PIL import Image, ImageDraw, ImageFont
+except ImportError: # Pillow is optional, graphs can only be rastered with it
+    Image = ImageDraw = ImageFont = None # type: ignore[assignment]
+
+from netgraph.api import _node
+from netgraph import _math
+from netgraph._edge import _compute_geometries
+from netgraph._node import _BORDER, _RADIUS, _SPACE
+from netgraph._sprites import _SpriteKey, _render_sprite
+
+if t.TYPE_CHECKING:
+    import tkinter as tk
+
+    from netgraph import NetManager
+    from netgraph.api._edge import CanvasEdge
+    from netgraph.api._node import CanvasNode
+    from netgraph._lod import _DetailLevel
+
+_GraphObject = t.Union["CanvasNode", "CanvasEdge"]
+_Box = tuple[float, float, float, float]
+
+_TileKey = tuple[float, int, int]
+"""The view scale a tile was drawn at and its column and row"""
+
+_TILE_TAG: t.Final[str] = "netgraph_tile"
+_PADDING: t.Final[float] = 128
+"""
+How far the drawing of a node or edge may reach beyond the box it is indexed with: labels wider than their node,
+edge texts and the curve of an edge, which is indexed by its control points
+"""
+_HOVER_DISTANCE: t.Final[float] = 4
+"""How close the mouse has to be to an edge for its component to be drawn with canvas objects"""
+_MAX_INVALIDATIONS: t.Final[int] = 256
+"""If more nodes and edges changed since the last update, all tiles are drawn again instead"""
+_TEXT_REACH: t.Final[float] = 64
+"""How far a label reaches from its position, texts further away from a tile are not drawn into it"""
+
+class _TileCache:
+    """
+    The most recently shown tiles, keyed by view scale and tile coordinates
+    """
+    __slots__: t.Sequence[str] = ("_capacity", "_tiles", "_hits", "_misses")
+
+    def __init__(self, capacity: int) -> None:
+        self._capacity = capacity
+        self._tiles: collections.OrderedDict[_TileKey, t.Any] = collections.OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._tiles)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._tiles
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def get(self, key: _TileKey) -> t.Any:
+        """
+        Returns the image of the tile or None if it has to be drawn
+        """
+        image = self._tiles.get(key)
+        if image is None:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        self._tiles.move_to_end(key)
+        return image
+
+    def put(self, key: _TileKey, image: t.Any) -> None:
+        self._tiles[key] = image
+        self._tiles.move_to_end(key)
+        while len(self._tiles) > self._capacity:
+            self._tiles.popitem(last=False)
+
+    def invalidate(self, box: _Box, scale: float, size: int) -> None:
+        """
+        Drop the tiles of every view scale that overlap the box, given in canvas coordinates at the given scale
+        """
+        for key in [key for key in self._tiles if _overlaps(key, box, scale, size)]:
+            del self._tiles[key]
+
+    def clear(self) -> None:
+        self._tiles.clear()
+
+def _overlaps(key: _TileKey, box: _Box, scale: float, size: int) -> bool:
+    # Canvas coordinates are world coordinates times the scale
+    factor = key[0] / scale
+    x0, y0, x1, y1 = (value * factor for value in box)
+    left, top = key[1] * size, key[2] * size
+    return x0 < left + size and left < x1 and y0 < top + size and top < y1
+
+class _TileLayer:
+    """
+    Draws the nodes and edges of a `NetManager` into image tiles instead of canvas objects.
+    Only the tiles in view are on the canvas, tiles that are drawn once are cached for when they come into
+    view again, also at other zoom levels.
+
+    The component under the mouse is drawn with canvas objects instead, so it behaves like in a graph without
+    tiles. It stays that way until the mouse is over another component. Changes of other nodes and edges, e.g. by
+    a layout, are picked up from the spatial index and only the tiles they touch are drawn again.
+    """
+    __slots__: t.Sequence[str] = (
+        "_manager", "_canvas", "_index", "_config", "_cache", "_shown", "_live", "_changed", "_pending", "_sprites",
+        "_background"
+    )
+
+    def __init__(self, manager: NetManager) -> None:
+        if Image is None:
+            raise RuntimeError("Drawing a graph into tiles requires Pillow")
+
+        self._manager = manager
+        self._canvas = manager.canvas
+        self._index = manager.spatial_index
+        self._config = manager.config.raster_config
+        self._cache = _TileCache(self._config.cache_size)
+        # The canvas image and the Tk image of every tile on the canvas, Tk deletes images that aren't referenced
+        self._shown: dict[_TileKey, tuple[int, t.Any]] = {}
+        self._live: dict[_GraphObject, None] = {}
+        # The boxes changed nodes and edges were indexed with before they changed
+        self._changed: dict[_GraphObject, t.Optional[_Box]] = {}
+        self._pending: t.Optional[str] = None
+        self._sprites: dict[_SpriteKey, Image.Image] = {}
+        self._background: t.Optional[str] = None
+
+        self._index.add_change_callback(self._on_change)
+        self._canvas.bind("<Configure>", lambda _: self.schedule_update(), "+")
+        # Tiles cover the whole graph, the mouse is only over a node or edge if it is close enough to one
+        self._canvas.tag_bind(_TILE_TAG, "<Motion>", self._on_motion)
+        self._canvas.tag_bind(_TILE_TAG, "<Enter>", lambda _: self._canvas.config(cursor=""))
+
+    @property
+    def cache(self) -> _TileCache:
+        return self._cache
+
+    @property
+    def live(self) -> t.Collection[_GraphObject]:
+        """
+        The nodes and edges drawn with canvas objects instead of into the tiles
+        """
+        return self._live.keys()
+
+    @property
+    def tile_count(self) -> int:
+        """
+        The number of tiles on the canvas
+        """
+        return len(self._shown)
+
+    def is_live(self, obj: _GraphObject) -> bool:
+        return obj in self._live
+
+    def _on_motion(self, event: tk.Event) -> None:
+        x, y = self._canvas.canvasx(event.x), self._canvas.canvasy(event.y)
+        obj: t.Optional[_GraphObject] = self._index.nearest_node(x, y, 0)
+        if obj is None:
+            obj = self._index.nearest_edge(x, y, _HOVER_DISTANCE)
+
+        if obj is not None and obj not in self._live:
+            self.activate(obj)
+
+    def _component(self, obj: _GraphObject) -> list[_GraphObject]:
+        components = self._manager.component_manager
+        nodes, edges = components.nodes(obj), components.edges(obj)
+        if len(nodes) + len(edges) > self._config.max_live:
+            if isinstance(obj, _node.CanvasNode):
+                nodes, edges = [obj], list(obj.edges)
+            else:
+                nodes, edges = list(obj.endpoints), [obj]
+
+        return [
+            *(node for node in nodes if node.is_rendered),
+            *(edge for edge in edges if all(node.is_rendered for node in edge.endpoints))
+        ]
+
+    def activate(self, obj: t.Optional[_GraphObject]) -> None:
+        """
+        Draw the component of the node or edge with canvas objects and the component that was drawn that way
+        before into the tiles again. If None, every node and edge is drawn into the tiles.
+        """
+        live = dict.fromkeys(self._component(obj)) if obj is not None else {}
+        previous = [other for other in self._live if other not in live]
+        added = [other for other in live if other not in self._live]
+        self._live = live
+
+        for other in previous:
+            other.obj_container.remove_all()
+            self._manager.viewport.discard(other)
+
+        for other in (*previous, *added):
+            self._changed.setdefault(other, self._index.indexed_bounds(other))
+
+        with self._manager.batch():
+            for other in added:
+                if isinstance(other, _node.CanvasNode):
+                    other.render(other.get_center())
+            for other in added:
+                if not isinstance(other, _node.CanvasNode):
+                    other.render()
+
+        self.schedule_update()
+
+    def _on_change(self, obj: _GraphObject) -> None:
+        # Past the limit all tiles are drawn again anyway, e.g. while a large component is dragged
+        if obj in self._live or len(self._changed) > _MAX_INVALIDATIONS:
+            return
+
+        self._changed.setdefault(obj, self._index.indexed_bounds(obj))
+        if isinstance(obj, _node.CanvasNode):
+            # The edges are indexed again together with the node
+            for edge in obj.edges:
+                if edge not in self._live:
+                    self._changed.setdefault(edge, self._index.indexed_bounds(edge))
+
+        self.schedule_update()
+
+    def schedule_update(self) -> None:
+        """
+        Show the tiles in view once tkinter is idle
+        """
+        if self._pending is None:
+            self._pending = self._canvas.after_idle(self.update)
+
+    def _invalidate(self, box: t.Optional[_Box]) -> None:
+        if box is not None:
+            padded = (box[0] - _PADDING, box[1] - _PADDING, box[2] + _PADDING, box[3] + _PADDING)
+            self._cache.invalidate(padded, self._manager.view.scale, self._config.tile_size)
+
+    def update(self) -> None:
+        """
+        Put the tiles in view on the canvas, drawing the ones that aren't cached, and remove the others
+        """
+        if self._pending is not None:
+            self._canvas.after_cancel(self._pending)
+            self._pending = None
+
+        # The background is read again by `NetManager.redraw`, the nodes in every tile are filled with the old one
+        background = self._manager.sprites.background
+        if background != self._background:
+            self._background = background
+            self._sprites.clear()
+            self._cache.clear()
+
+        changed, self._changed = self._changed, {}
+        if len(changed) > _MAX_INVALIDATIONS:
+            self._cache.clear()
+        else:
+            for obj, box in changed.items():
+                self._invalidate(box)
+                self._invalidate(self._index.bounds(obj))
+
+        size = self._config.tile_size
+        scale = self._manager.view.scale
+        x0, y0 = self._canvas.canvasx(0), self._canvas.canvasy(0)
+        x1, y1 = self._canvas.canvasx(self._canvas.winfo_width()), self._canvas.canvasy(self._canvas.winfo_height())
+        keys = [
+            (scale, column, row)
+            for column in range(math.floor(x0 / size), math.floor(x1 / size) + 1)
+            for row in range(math.floor(y0 / size), math.floor(y1 / size) + 1)
+        ]
+
+        created = False
+        for key in keys:
+            image = self._cache.get(key)
+            if image is None:
+                image = self._canvas.photo_image(self._draw(key))
+                self._cache.put(key, image)
+
+            shown = self._shown.get(key)
+            if shown is None:
+                item = self._canvas.create_image(
+                    (key[1] + 0.5) * size, (key[2] + 0.5) * size, image=image, tags=(_TILE_TAG,)
+                )
+                self._shown[key] = (item, image)
+                created = True
+            elif shown[1] is not image:
+                self._canvas.itemconfig(shown[0], image=image)
+                self._shown[key] = (shown[0], image)
+
+        visible = set(keys)
+        for key in [key for key in self._shown if key not in visible]:
+            self._canvas.delete(self._shown.pop(key)[0])
+
+        if created:
+            self._canvas.tag_lower(_TILE_TAG)
+
+    def _draw(self, key: _TileKey) -> Image.Image:
+        size = self._config.tile_size
+        left, top = key[1] * size, key[2] * size
+        area = (left - _PADDING, top - _PADDING, left + size + _PADDING, top + size + _PADDING)
+        detail = self._manager.detail
+
+        image = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(image)
+
+        # Edges lie below the nodes like their canvas objects
+        edges = [edge for edge in self._index.edges_in(area) if edge not in self._live]
+        for edge, geometry in zip(edges, _compute_geometries(edges)):
+            points = _math._calc_smooth_points(geometry.points, detail.spline_steps(edge.config.line_segments))
+            points = [value - offset for value, offset in zip(points, (left, top) * (len(points) // 2))]
+            if detail.antialias:
+                draw.line(points, fill="#AAA", width=2, joint="curve")
+            draw.line(points, fill="#000", width=1 if detail.antialias else 2, joint="curve")
+
+            if detail.text:
+                for config, text in (
+                    (edge.config.label_config, edge.label), (edge.config.weight_config, str(edge.weight) if edge.weight else "")
+                ):
+                    x, y = geometry.text_position(config.gap)
+                    _draw_text(image, draw, x - left, y - top, text, geometry.angle or 0, config.color)
+
+        for node in self._index.nodes_in(area):
+            if node in self._live:
+                continue
+
+            x, y = node.get_center()
+            sprite = self._sprite(node, detail)
+            image.paste(sprite, (round(x - left - sprite.width / 2), round(y - top - sprite.height / 2)), sprite)
+            if detail.text:
+                _draw_text(image, draw, x - left, y - top, node.label, 0, node.config.label_color)
+
+        return image
+
+    def _sprite(self, node: CanvasNode, detail: _DetailLevel) -> Image.Image:
+        key = _SpriteKey(
+            _RADIUS, _SPACE, _BORDER, "black", t.cast(str, self._background), node.config.antialiased, detail.borders
+        )
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = self._sprites[key] = _render_sprite(self._canvas, key)
+
+        return sprite
+
+@functools.lru_cache(maxsize=None)
+def _font() -> ImageFont.ImageFont:
+    return ImageFont.load_default()
+
+@functools.lru_cache(maxsize=4096)
+def _rotated_text(text: str, angle: int, fill: str) -> Image.Image:
+    # Only whole images can be rotated. Edge texts repeat a lot, e.g. the weights, so they are cached per angle.
+    x0, y0, x1, y1 = _font().getbbox(text)
+    label = Image.new("RGBA", (x1 - x0 + 2, y1 - y0 + 2), (0, 0, 0, 0))
+    ImageDraw.Draw(label).text((1 - x0, 1 - y0), text, fill=fill, font=_font())
+    return label.rotate(angle, resample=Image.BICUBIC, expand=True)
+
+def _draw_text(image: Image.Image, draw: ImageDraw.ImageDraw, x: float, y: float, text: str, angle: float, fill: str) -> None:
+    if not text or not (-_TEXT_REACH < x < image.width + _TEXT_REACH and -_TEXT_REACH < y < image.height + _TEXT_REACH):
+        return
+
+    if not angle:
+        draw.text((x, y), text, fill=fill, font=_font(), anchor="mm")
+        return
+
+    label = _rotated_text(text, round(angle), fill)
+    image.paste(label, (round(x - label.width / 2), round(y - label.height / 2)), label)
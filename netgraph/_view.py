@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+# Copyright © YodaPY 2024-present
+#
+# This file is part of tk-netgraph.
+#
+# tk-netgraph is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# tk-netgraph is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with tk-netgraph. If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import typing as t
+
+class _ViewTransform:
+    """
+    Maps the world coordinates nodes are stored in to canvas coordinates: canvas = world * scale.
+    Zooming only changes the scale, so positions never drift from repeated scaling. Panning scrolls
+    the canvas and doesn't touch the transform at all.
+    """
+    __slots__: t.Sequence[str] = ("_scale",)
+
+    def __init__(self, scale: float = 1.0) -> None:
+        self._scale = scale
+
+    @property
+    def scale(self) -> float:
+        return self._scale
+
+    def zoom(self, factor: float) -> None:
+        self._scale *= factor
+
+    def to_canvas(self, x: float, y: float) -> tuple[float, float]:
+        return x * self._scale, y * self._scale
+
+    def to_world(self, x: float, y: float) -> tuple[float, float]:
+        return x / self._scale, y / self._scale
+
+class _PendingZoom:
+    """
+    The wheel steps received since the last zoom was applied, combined into one affine map of window coordinates:
+    window' = window * factor + offset
+    """
+    __slots__: t.Sequence[str] = ("factor", "offset_x", "offset_y")
+
+    def __init__(self) -> None:
+        self.factor = 1.0
+        self.offset_x = 0.0
+        self.offset_y = 0.0
+
+    def add(self, x: float, y: float, factor: float) -> None:
+        """
+        Add a step that scales around the given window position
+        """
+        self.factor *= factor
+        self.offset_x = self.offset_x * factor + x * (1 - factor)
+        self.offset_y = self.offset_y * factor + y * (1 - factor)
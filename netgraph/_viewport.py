@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+# Copyright © YodaPY 2024-present
+#
+# This file is part of tk-netgraph.
+#
+# tk-netgraph is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# tk-netgraph is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with tk-netgraph. If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import time
+import typing as t
+
+from netgraph.api import _node
+
+if t.TYPE_CHECKING:
+    from netgraph import NetManager
+    from netgraph.api._edge import CanvasEdge
+    from netgraph.api._node import CanvasNode
+
+_GraphObject = t.Union["CanvasNode", "CanvasEdge"]
+
+_UPDATE_INTERVAL: t.Final[int] = 100
+"""
+The minimum number of milliseconds between two updates while objects keep moving. An update indexes every moved
+node again, which is too expensive to do for every frame of a large component drag. Slow updates are spaced out
+further, to at least twice the time they took.
+"""
+
+class _Viewport:
+    """
+    Keeps canvas objects only for the nodes and edges in and around the visible part of the canvas.
+    Everything else lives in the graph model (positions, edges, the spatial index) without canvas objects.
+    Objects are drawn once they come within the margin of the visible area and deleted once they are more than
+    twice the margin away, so small back and forth movements don't recreate them.
+
+    Independent of virtualization, canvas objects that were drawn with an outdated view scale are only
+    projected again once they come into view.
+    """
+    __slots__: t.Sequence[str] = (
+        "_manager", "_canvas", "_index", "_enabled", "_margin", "_materialized", "_pending", "_last_update", "_update_cost",
+        "_area", "_stale"
+    )
+
+    def __init__(self, manager: NetManager) -> None:
+        self._manager = manager
+        self._canvas = manager.canvas
+        self._index = manager.spatial_index
+        # Tiles only draw the objects in view anyway
+        self._enabled = manager.config.virtualize and not manager.config.raster
+        self._margin = manager.config.viewport_margin
+        self._materialized: dict[_GraphObject, None] = {}
+        self._pending: t.Optional[str] = None
+        self._last_update = 0.0
+        self._update_cost = 0.0
+        self._area: t.Optional[tuple[float, float, float, float]] = None
+        self._stale: dict[_GraphObject, None] = {}
+
+        # Moving objects can bring stale ones into view even without virtualization, see `schedule_update`
+        self._canvas.scheduler.add_move_callback(self.schedule_update)
+
+        self._canvas.bind("<Configure>", self._on_resize, "+")
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @property
+    def materialized(self) -> t.Collection[_GraphObject]:
+        """
+        The nodes and edges that currently have canvas objects
+        """
+        return self._materialized.keys()
+
+    def visible_area(self, margin: float = 0) -> tuple[float, float, float, float]:
+        """
+        The visible part of the canvas in canvas coordinates, grown by the given margin on every side
+        """
+        if self._area is None:
+            self._area = (
+                self._canvas.canvasx(0), self._canvas.canvasy(0),
+                self._canvas.canvasx(self._canvas.winfo_width()), self._canvas.canvasy(self._canvas.winfo_height())
+            )
+
+        x0, y0, x1, y1 = self._area
+        return x0 - margin, y0 - margin, x1 + margin, y1 + margin
+
+    def _on_resize(self, event: t.Any) -> None:
+        self.view_changed()
+
+    def view_changed(self) -> None:
+        """
+        Called after the visible part of the canvas changed, e.g. by scrolling
+        """
+        self._area = None
+        self.schedule_update()
+
+    def mark_stale(self, objects: t.Iterable[_GraphObject]) -> None:
+        """
+        Remember that the canvas objects of the given nodes and edges are not where the current view transform
+        puts them. They are projected again once they come into view.
+        """
+        self._stale.update(dict.fromkeys(objects))
+
+    def should_render(self, obj: _GraphObject) -> bool:
+        """
+        Whether the node or edge should get canvas objects now. Remembers the objects that do.
+        """
+        if not self._enabled:
+            return True
+
+        if isinstance(obj, _node.CanvasNode):
+            visible = self._index.intersects(obj, self.visible_area(self._margin))
+        else:
+            # Edges of drawn nodes are drawn as well, so no edge ends in empty space
+            visible = any(node in self._materialized for node in obj.endpoints) or self._index.intersects(
+                obj, self.visible_area(self._margin)
+            )
+
+        if visible:
+            self._materialized[obj] = None
+
+        return visible
+
+    def discard(self, obj: _GraphObject) -> None:
+        """
+        Forget a node or edge that was removed from the graph
+        """
+        self._materialized.pop(obj, None)
+        self._stale.pop(obj, None)
+
+    def schedule_update(self) -> None:
+        """
+        Update soon, but not more often than every few milliseconds
+        """
+        if (not self._enabled and not self._stale) or self._pending is not None:
+            return
+
+        elapsed = (time.perf_counter() - self._last_update) * 1000
+        interval = max(_UPDATE_INTERVAL, 2000 * self._update_cost)
+        self._pending = self._canvas.after(max(0, int(interval - elapsed)), self.update)
+
+    def update(self) -> None:
+        """
+        Draw the nodes and edges that came into view and delete the canvas objects of those far out of view.
+        Stale canvas objects that came into view are moved to their current position.
+        """
+        if self._pending is not None:
+            self._canvas.after_cancel(self._pending)
+            self._pending = None
+
+        if not self._enabled and not self._stale:
+            return
+
+        start = time.perf_counter()
+        try:
+            self._update()
+        finally:
+            self._last_update = time.perf_counter()
+            self._update_cost = self._last_update - start
+
+    def _update(self) -> None:
+        self._area = None
+        if self._enabled:
+            keep_area = self.visible_area(2 * self._margin)
+            keep: set[_GraphObject] = set(self._index.nodes_in(keep_area))
+            keep.update(self._index.edges_in(keep_area))
+            # The released items of all objects are hidden in one call
+            with self._canvas.buffering():
+                for obj in [obj for obj in self._materialized if obj not in keep]:
+                    del self._materialized[obj]
+                    self._stale.pop(obj, None)
+                    obj.obj_container.remove_all()
+
+        if self._stale:
+            self._project()
+
+        if not self._enabled:
+            return
+
+        area = self.visible_area(self._margin)
+        nodes = [node for node in self._index.nodes_in(area) if node not in self._materialized]
+        edges = [edge for edge in self._index.edges_in(area) if edge not in self._materialized]
+        if not nodes and not edges:
+            return
+
+        with self._manager.batch():
+            for node in nodes:
+                node.render(node.get_center())
+            for edge in edges:
+                edge.render()
+
+    def _project(self) -> None:
+        area = self.visible_area(self._margin)
+        nodes = [node for node in self._index.nodes_in(area) if node in self._stale]
+        edges = [edge for edge in self._index.edges_in(area) if edge in self._stale]
+        for obj in (*nodes, *edges):
+            del self._stale[obj]
+
+        for node in nodes:
+            node.project()
+
+        self._canvas.scheduler.update_edges(edges)
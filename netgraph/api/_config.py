@@ -146,6 +146,78 @@ class NodeConfig(abc.ABC):
         The color of the label
         """
 
+    @property
+    @abc.abstractmethod
+    def sprite(self) -> bool:
+        """
+        Whether to draw the circles of the node as a single image instead of four canvas objects.
+        The image is drawn once for all nodes that look the same. Requires Pillow.
+        """
+
+class LODConfig(abc.ABC):
+    __slots__: t.Sequence[str] = ()
+
+    @property
+    @abc.abstractmethod
+    def text_zoom(self) -> float:
+        """
+        Below this zoom factor node labels, edge labels and weights are not drawn
+        """
+
+    @property
+    @abc.abstractmethod
+    def border_zoom(self) -> float:
+        """
+        Below this zoom factor nodes are drawn as a single filled circle instead of two border circles
+        """
+
+    @property
+    @abc.abstractmethod
+    def antialias_zoom(self) -> float:
+        """
+        Below this zoom factor edges are drawn without the lighter antialiasing line
+        """
+
+    @property
+    @abc.abstractmethod
+    def spline_zoom(self) -> float:
+        """
+        Below this zoom factor the number of line segments of edges is halved for every halving of the zoom factor
+        """
+
+    @property
+    @abc.abstractmethod
+    def min_spline_steps(self) -> int:
+        """
+        The number of line segments an edge keeps however far the canvas is zoomed out
+        """
+
+class RasterConfig(abc.ABC):
+    __slots__: t.Sequence[str] = ()
+
+    @property
+    @abc.abstractmethod
+    def tile_size(self) -> int:
+        """
+        The width and height of a tile in pixels
+        """
+
+    @property
+    @abc.abstractmethod
+    def cache_size(self) -> int:
+        """
+        The number of tiles kept, including tiles of other zoom levels and of parts of the graph out of view.
+        The least recently shown tiles are dropped first.
+        """
+
+    @property
+    @abc.abstractmethod
+    def max_live(self) -> int:
+        """
+        The number of nodes and edges a component may have to be drawn with canvas objects as a whole when the mouse
+        is over it. Of larger components only the node under the mouse and its edges are drawn with canvas objects.
+        """
+
 class NetConfig(abc.ABC):
     __slots__: t.Sequence[str] = ()
 
@@ -156,6 +228,63 @@ class NetConfig(abc.ABC):
         Whether to allow zooming on nodes and edges
         """
 
+    @property
+    @abc.abstractmethod
+    def frame_rate(self) -> t.Optional[int]:
+        """
+        The maximum number of times per second that drags are applied to the canvas.
+        Motion events in between are collapsed into a single update. If None, updates are applied
+        as soon as tkinter is idle.
+        """
+
+    @property
+    @abc.abstractmethod
+    def item_pool_size(self) -> int:
+        """
+        The number of canvas items of removed nodes and edges that are kept hidden to draw new nodes and edges with,
+        which is cheaper than deleting and creating items while nodes and edges come and go, e.g. when panning.
+        0 deletes every removed item.
+        """
+
+    @property
+    @abc.abstractmethod
+    def virtualize(self) -> bool:
+        """
+        Whether to only keep canvas objects for nodes and edges in and around the visible part of the canvas.
+        The other nodes and edges only exist in the graph model until they are scrolled or dragged into view.
+        """
+
+    @property
+    @abc.abstractmethod
+    def viewport_margin(self) -> float:
+        """
+        How far around the visible part of the canvas nodes and edges are drawn when virtualizing, in pixels.
+        Objects are only deleted again when they are more than twice as far away.
+        """
+
+    @property
+    @abc.abstractmethod
+    def raster(self) -> bool:
+        """
+        Whether to draw nodes and edges into cached image tiles instead of canvas objects, for large graphs
+        that are mostly looked at. Only the component under the mouse is drawn with canvas objects, so it can be
+        clicked and dragged. Replaces `virtualize`. Requires Pillow.
+        """
+
+    @property
+    @abc.abstractmethod
+    def raster_config(self) -> RasterConfig:
+        """
+        The size and number of tiles when `raster` is enabled
+        """
+
+    @property
+    @abc.abstractmethod
+    def lod_config(self) -> LODConfig:
+        """
+        The zoom factors at which details are left out when zooming out and drawn again when zooming in
+        """
+
     @property
     @abc.abstractmethod
     def edge_config(self) -> EdgeConfig:
@@ -89,10 +89,50 @@ class CanvasNode(abc.ABC, CanvasAware):
         A list of edges that the node is apart of, which need to be updated when the node is dragged 
         """
 
+    @property
+    @abc.abstractmethod
+    def is_rendered(self) -> bool:
+        """
+        Whether the node was rendered and has a position on the canvas
+        """
+
+    @abc.abstractmethod
+    def get_position(self) -> tuple[float, float]:
+        """
+        Returns the center of the node in world coordinates, which don't change when zooming
+        """
+
     @abc.abstractmethod
     def get_center(self) -> tuple[float, float]:
         """
-        Returns the center of the node
+        Returns the center of the node in canvas coordinates
+        """
+
+    @abc.abstractmethod
+    def get_bbox(self) -> tuple[float, float, float, float]:
+        """
+        Returns the bounding box of the node's canvas objects
+        """
+
+    @abc.abstractmethod
+    def move(self, delta_x: float, delta_y: float) -> None:
+        """
+        Move the node and update the edges connected to it. The canvas is updated with the next frame,
+        or when the current batch of the manager is applied.
+        """
+
+    @abc.abstractmethod
+    def on_move(self, delta_x: float, delta_y: float) -> None:
+        """
+        Called after the canvas objects of the node were moved by the given amount (e.g. by a component drag).
+        Used to keep the stored position of the node in sync with the canvas.
+        """
+
+    @abc.abstractmethod
+    def project(self) -> None:
+        """
+        Move the canvas objects of the node to its current canvas position, e.g. after zooming changed
+        the scale of the view. The position of the node in world coordinates stays the same.
         """
 
     @abc.abstractmethod
@@ -27,6 +27,7 @@ if t.TYPE_CHECKING:
     import tkinter as tk
 
     from netgraph import NetCanvas
+    from netgraph._types import CanvasObjectsLike
 
 class CanvasObject(abc.ABC, CanvasAware):
     __slots__: t.Sequence[str] = ()
@@ -53,6 +54,20 @@ class ObjectContainer(abc.ABC, CanvasAware, Draggable):
         The list of managed objects
         """
 
+    def __len__(self) -> int:
+        """
+        The number of managed objects
+        """
+        return len(self.objects)
+
+    def items(self) -> t.Iterator[tuple[t.Union[str, int], t.Optional[CanvasObject]]]:
+        """
+        The canvas ID of every managed object with the object itself. Containers that keep plain canvas items
+        as their ID yield None instead of creating an object for them.
+        """
+        for obj in self.objects:
+            yield obj.canvas_id, obj
+
     @property
     @abc.abstractmethod
     def tags(self) -> list[str]:
@@ -66,6 +81,13 @@ class ObjectContainer(abc.ABC, CanvasAware, Draggable):
         Adds the canvas object with the given ID to the container
         """
 
+    @abc.abstractmethod
+    def render(self, ids: CanvasObjectsLike) -> None:
+        """
+        Consumes the given canvas objects as they are drawn (e.g. the generator returned by `draw`)
+        and adds them to the container. The objects are tagged with the container's tags when they're created.
+        """
+
     @abc.abstractmethod
     def add_tag(self, tag: str) -> None:
         """
@@ -96,6 +118,12 @@ class ObjectContainer(abc.ABC, CanvasAware, Draggable):
         Lower all objects in the stacking order
         """
 
+    @abc.abstractmethod
+    def lift(self) -> None:
+        """
+        Raise all objects to the top of the stacking order
+        """
+
     @abc.abstractmethod
     def bind(self, event: str, callback: t.Callable[[tk.Event], None]) -> None:
         """
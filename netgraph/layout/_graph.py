@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+# Copyright © YodaPY 2024-present
+#
+# This file is part of tk-netgraph.
+#
+# tk-netgraph is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# tk-netgraph is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with tk-netgraph. If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import math
+import typing as t
+
+import numpy as np
+
+if t.TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from netgraph import NetManager
+    from netgraph.api._node import CanvasNode
+
+__all__: t.Sequence[str] = (
+    "LayoutGraph",
+)
+
+class LayoutGraph:
+    """
+    The structure of a graph as arrays, which is what the layout algorithms work on.
+    Row i of `positions` and `pinned` belongs to `nodes[i]`, every row of `edges` holds the row indices of two
+    different connected nodes. Parallel edges and self-loops don't affect a layout and are left out.
+    A detached graph has no nodes, only the arrays.
+    """
+    __slots__: t.Sequence[str] = ("_nodes", "_positions", "_edges", "_pinned")
+
+    def __init__(
+        self,
+        nodes: t.Sequence[CanvasNode],
+        positions: NDArray[np.float64],
+        edges: NDArray[np.intp],
+        pinned: t.Optional[NDArray[np.bool_]] = None
+    ) -> None:
+        self._nodes = list(nodes)
+        self._positions = positions
+        self._edges = edges
+        self._pinned = pinned if pinned is not None else np.zeros(len(self._nodes), dtype=bool)
+
+    @classmethod
+    def from_manager(
+        cls,
+        manager: NetManager,
+        *,
+        pinned: t.Iterable[CanvasNode] = (),
+        positions: t.Optional[t.Mapping[CanvasNode, tuple[float, float]]] = None,
+        spacing: float = 100.0,
+        seed: t.Optional[int] = None
+    ) -> LayoutGraph:
+        """
+        Read the nodes and edges of the manager. Nodes start at the given position, or at their current position
+        if they are rendered. The remaining nodes are placed randomly around the others, in a square that leaves
+        about `spacing` pixels per node. Pinned nodes need a position.
+        """
+        nodes = manager.nodes
+        index = {node: row for row, node in enumerate(nodes)}
+        positions = positions or {}
+
+        coords = np.full((len(nodes), 2), np.nan)
+        for row, node in enumerate(nodes):
+            if node in positions:
+                coords[row] = positions[node]
+            elif node.is_rendered:
+                coords[row] = node.get_center()
+
+        pinned_mask = np.zeros(len(nodes), dtype=bool)
+        for node in pinned:
+            pinned_mask[index[node]] = True
+
+        unplaced = np.isnan(coords[:, 0])
+        if np.any(pinned_mask & unplaced):
+            raise ValueError("Pinned nodes have to be rendered or given a position")
+
+        if np.any(unplaced):
+            side = spacing * math.sqrt(len(nodes))
+            center = coords[~unplaced].mean(axis=0) if not np.all(unplaced) else np.array([side / 2, side / 2])
+            rng = np.random.default_rng(seed)
+            coords[unplaced] = center + rng.uniform(-side / 2, side / 2, size=(int(np.count_nonzero(unplaced)), 2))
+
+        pairs = {
+            (min(first, second), max(first, second))
+            for first, second in (
+                (index[edge.endpoints[0]], index[edge.endpoints[1]]) for edge in manager.edges
+            )
+            if first != second
+        }
+        edges = np.array(sorted(pairs), dtype=np.intp).reshape(-1, 2)
+
+        return cls(nodes, coords, edges, pinned_mask)
+
+    @property
+    def nodes(self) -> list[CanvasNode]:
+        return self._nodes
+
+    @property
+    def positions(self) -> NDArray[np.float64]:
+        """
+        The positions of the nodes as an (n, 2) array, updated in place by the layout algorithms
+        """
+        return self._positions
+
+    @property
+    def edges(self) -> NDArray[np.intp]:
+        return self._edges
+
+    @property
+    def pinned(self) -> NDArray[np.bool_]:
+        return self._pinned
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def detach(self) -> LayoutGraph:
+        """
+        A copy of the arrays without the nodes, which can be sent to another process or thread
+        """
+        return LayoutGraph((), self._positions.copy(), self._edges, self._pinned)
+
+    def to_mapping(self, positions: t.Optional[NDArray[np.float64]] = None) -> dict[CanvasNode, tuple[float, float]]:
+        """
+        Map every node to its position, e.g. to pass them to `NetManager.set_positions`
+        """
+        if positions is None:
+            positions = self._positions
+
+        return {node: (x, y) for node, (x, y) in zip(self._nodes, positions.tolist())}
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+# Copyright © YodaPY 2024-present
+#
+# This file is part of tk-netgraph.
+#
+# tk-netgraph is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# tk-netgraph is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with tk-netgraph. If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+from multiprocessing import shared_memory
+import contextlib
+import multiprocessing
+import os
+import typing as t
+
+import numpy as np
+
+from netgraph.layout._quadtree import QuadTree, _morton_codes
+from netgraph.layout._spring import SpringLayout, _exact_repulsion
+
+if t.TYPE_CHECKING:
+    from multiprocessing.pool import Pool
+
+    from numpy.typing import NDArray
+
+    from netgraph.layout._graph import LayoutGraph
+
+__all__: t.Sequence[str] = (
+    "ParallelSpringLayout",
+)
+
+_TASKS_PER_WORKER: t.Final[int] = 4
+"""Each worker gets several smaller parts of the graph per iteration, so workers that finish early can take more"""
+
+class _SharedArrays:
+    """
+    Arrays in shared memory: the positions and the node order are written by the layout and read by the workers,
+    the forces are written by the workers. Nothing but the bounds of a task is pickled per iteration.
+    """
+    __slots__: t.Sequence[str] = ("_blocks", "positions", "forces", "order")
+
+    def __init__(self, node_count: int, names: t.Optional[tuple[str, str, str]] = None) -> None:
+        shapes = (((node_count, 2), np.float64), ((node_count, 2), np.float64), ((node_count,), np.intp))
+        if names is None:
+            self._blocks = [
+                shared_memory.SharedMemory(create=True, size=max(1, int(np.prod(shape)) * np.dtype(dtype).itemsize))
+                for shape, dtype in shapes
+            ]
+        else:
+            self._blocks = [shared_memory.SharedMemory(name=name) for name in names]
+
+        self.positions, self.forces, self.order = (
+            np.ndarray(shape, dtype=dtype, buffer=block.buf) for (shape, dtype), block in zip(shapes, self._blocks)
+        )
+
+    @property
+    def names(self) -> tuple[str, str, str]:
+        return t.cast(tuple[str, str, str], tuple(block.name for block in self._blocks))
+
+    def close(self, *, unlink: bool = False) -> None:
+        # The arrays have to be released before the memory can be closed
+        del self.positions, self.forces, self.order
+        for block in self._blocks:
+            block.close()
+            if unlink:
+                block.unlink()
+
+_worker_arrays: t.Optional[_SharedArrays] = None
+_worker_tree: tuple[int, t.Optional[QuadTree]] = (-1, None)
+
+def _attach(node_count: int, names: tuple[str, str, str]) -> None:
+    global _worker_arrays
+    _worker_arrays = _SharedArrays(node_count, names)
+
+def _compute_repulsion(iteration: int, start: int, stop: int, k: float, theta: float, exact: bool) -> None:
+    """
+    Compute the repulsion on the nodes order[start:stop] and write it into the shared forces
+    """
+    global _worker_tree
+    arrays = t.cast(_SharedArrays, _worker_arrays)
+    points = arrays.order[start:stop].copy()
+
+    if exact:
+        arrays.forces[points] = _exact_repulsion(arrays.positions, k, points)
+        return
+
+    # A worker usually handles several tasks per iteration, the tree only has to be built for the first one
+    if _worker_tree[0] != iteration:
+        _worker_tree = (iteration, QuadTree(arrays.positions))
+
+    arrays.forces[points] = t.cast(QuadTree, _worker_tree[1]).repulsion(arrays.positions, k, theta, points)
+
+class ParallelSpringLayout(SpringLayout):
+    """
+    A spring layout that splits the repulsion, the expensive part of every iteration, across a pool of processes.
+    The nodes are ordered along a Morton curve every iteration and cut into parts of neighbouring nodes,
+    so each worker traverses the same region of the quadtree for all of its nodes.
+    Positions and forces are exchanged through shared memory.
+    Inside a `LayoutRunner` use `mode="thread"`, the runner's worker process can't start the pool.
+    """
+    __slots__: t.Sequence[str] = ("_workers", "_shared", "_pool", "_iteration")
+
+    def __init__(self, *, workers: t.Optional[int] = None, **kwargs: t.Any) -> None:
+        super().__init__(**kwargs)
+        self._workers = workers or os.cpu_count() or 1
+        self._shared: t.Optional[_SharedArrays] = None
+        self._pool: t.Optional[Pool] = None
+        self._iteration = 0
+
+    @property
+    def workers(self) -> int:
+        """
+        The number of worker processes
+        """
+        return self._workers
+
+    def iterate(self, graph: LayoutGraph) -> t.Iterator[float]:
+        with self._start_pool(len(graph)):
+            yield from super().iterate(graph)
+
+    @contextlib.contextmanager
+    def _start_pool(self, node_count: int) -> t.Iterator[None]:
+        self._shared = _SharedArrays(node_count)
+        try:
+            # fork would copy the state of the Tk interpreter into the workers
+            context = multiprocessing.get_context("spawn")
+            with context.Pool(self._workers, initializer=_attach, initargs=(node_count, self._shared.names)) as pool:
+                self._pool = pool
+                yield
+        finally:
+            self._pool = None
+            self._shared.close(unlink=True)
+            self._shared = None
+
+    def _repulsion(self, positions: NDArray[np.float64]) -> NDArray[np.float64]:
+        if self._pool is None or self._shared is None:
+            return super()._repulsion(positions)
+
+        node_count = len(positions)
+        self._iteration += 1
+        self._shared.positions[:] = positions
+        self._shared.order[:] = np.argsort(_morton_codes(positions)[0], kind="stable")
+
+        bounds = np.linspace(0, node_count, self._workers * _TASKS_PER_WORKER + 1).astype(int).tolist()
+        exact = self._uses_exact_repulsion(node_count)
+        self._pool.starmap(_compute_repulsion, [
+            (self._iteration, start, stop, self._spacing, self._theta, exact)
+            for start, stop in zip(bounds, bounds[1:]) if stop > start
+        ])
+        return self._shared.forces.copy()
@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+# Copyright © YodaPY 2024-present
+#
+# This file is part of tk-netgraph.
+#
+# tk-netgraph is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# tk-netgraph is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with tk-netgraph. If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import typing as t
+
+import numpy as np
+
+if t.TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+__all__: t.Sequence[str] = (
+    "QuadTree",
+)
+
+_MAX_DEPTH: t.Final[int] = 16
+"""Cells at this depth are leaves, the codes of a cell need 2 bits per level"""
+_POINT_BLOCK: t.Final[int] = 2048
+"""The number of points that traverse the tree together, bounds the size of the traversal frontier"""
+_MIN_DISTANCE: t.Final[float] = 1e-2
+_PAIR_BLOCK: t.Final[int] = 1 << 20
+"""The maximum number of point pairs of leaves whose forces are computed together"""
+
+def _spread_bits(values: NDArray[np.int64]) -> NDArray[np.int64]:
+    # Insert a zero bit between each of the lower 16 bits
+    values = values & 0xFFFF
+    values = (values | (values << 8)) & 0x00FF00FF
+    values = (values | (values << 4)) & 0x0F0F0F0F
+    values = (values | (values << 2)) & 0x33333333
+    values = (values | (values << 1)) & 0x55555555
+    return values
+
+def _morton_codes(positions: NDArray[np.float64], depth: int = _MAX_DEPTH) -> tuple[NDArray[np.int64], float]:
+    """
+    The code of the leaf cell each position falls into, and the side length of the square the cells divide.
+    Sorting positions by their code keeps positions that are close to each other close in the order.
+    """
+    low = positions.min(axis=0) if len(positions) else np.zeros(2)
+    side = float(np.ptp(positions, axis=0).max()) if len(positions) else 0.0
+    side = max(side, _MIN_DISTANCE) * (1 + 1e-9) # keep the maximum inside the last cell
+    cells_per_side = 1 << depth
+
+    grid = np.clip(((positions - low) / side * cells_per_side).astype(np.int64), 0, cells_per_side - 1)
+    return _spread_bits(grid[:, 0]) | (_spread_bits(grid[:, 1]) << 1), side
+
+class QuadTree:
+    """
+    A linear quadtree over point positions, stored as one set of arrays per level instead of node objects.
+    The points are sorted by their Morton code, which makes the occupied cells of every level and the children
+    of every cell contiguous ranges, so building the tree is a few array passes per level.
+    Only cells that contain points are stored. The points of a leaf are a range of the sorted points,
+    the forces between points in the same leaf are computed pair by pair.
+    """
+    __slots__: t.Sequence[str] = (
+        "_depth", "_point_codes", "_order", "_leaf_bounds", "_codes", "_mass", "_center", "_child_start",
+        "_child_end", "_sizes"
+    )
+
+    def __init__(self, positions: NDArray[np.float64], *, depth: int = _MAX_DEPTH) -> None:
+        if not 0 < depth <= _MAX_DEPTH:
+            raise ValueError(f"The depth of the tree has to be between 1 and {_MAX_DEPTH}")
+
+        self._depth = depth
+
+        self._point_codes, side = _morton_codes(positions, depth)
+
+        order = self._order = np.argsort(self._point_codes, kind="stable")
+        codes = self._point_codes[order]
+        # The sorted points of leaf i are order[bounds[i]:bounds[i + 1]]
+        self._leaf_bounds = np.concatenate(([0], np.flatnonzero(np.diff(codes)) + 1, [len(codes)]))
+        weighted = positions[order]
+        mass = np.ones(len(positions))
+
+        # Build the levels bottom up, every level merges the cells of the level below with the same parent
+        levels_codes: list[NDArray[np.int64]] = []
+        levels_mass: list[NDArray[np.float64]] = []
+        levels_center: list[NDArray[np.float64]] = []
+        for _ in range(depth + 1):
+            if len(codes):
+                starts = np.concatenate(([0], np.flatnonzero(np.diff(codes)) + 1))
+                codes = codes[starts]
+                mass = np.add.reduceat(mass, starts)
+                weighted = np.add.reduceat(weighted, starts, axis=0)
+
+            levels_codes.append(codes)
+            levels_mass.append(mass)
+            levels_center.append(weighted / np.maximum(mass, 1)[:, None])
+            # weighted keeps the sum of the positions, so the next level can merge it
+            codes = codes >> 2
+
+        self._codes = levels_codes[::-1]
+        self._mass = levels_mass[::-1]
+        self._center = levels_center[::-1]
+
+        self._child_start: list[NDArray[np.intp]] = []
+        self._child_end: list[NDArray[np.intp]] = []
+        for level in range(depth):
+            parents = self._codes[level + 1] >> 2
+            self._child_start.append(np.searchsorted(parents, self._codes[level], side="left"))
+            self._child_end.append(np.searchsorted(parents, self._codes[level], side="right"))
+
+        self._sizes = side / (1 << np.arange(depth + 1))
+
+    @property
+    def depth(self) -> int:
+        return self._depth
+
+    def cell_count(self, level: int) -> int:
+        """
+        The number of occupied cells on the given level, the root is level 0
+        """
+        return len(self._codes[level])
+
+    def mass(self, level: int) -> NDArray[np.float64]:
+        """
+        The number of points in each occupied cell of the given level
+        """
+        return self._mass[level]
+
+    def center(self, level: int) -> NDArray[np.float64]:
+        """
+        The center of mass of each occupied cell of the given level
+        """
+        return self._center[level]
+
+    def repulsion(
+        self, positions: NDArray[np.float64], k: float, theta: float, points: t.Optional[NDArray[np.intp]] = None
+    ) -> NDArray[np.float64]:
+        """
+        Approximate the repulsive force k²/d that all points put on each point (Barnes-Hut).
+        A cell is treated as a single mass in its center if its size divided by the distance is less than theta,
+        otherwise its children are visited. The points of the leaves that are reached push exactly,
+        so close or coincident points don't stand in for each other. `positions` have to be the positions the tree
+        was built from.
+        If the indices of some points are given, only the forces on these points are returned.
+        """
+        indices = np.arange(len(positions)) if points is None else points
+        force = np.zeros((len(indices), 2))
+        theta_sq = theta * theta
+        k_sq = k * k
+        depth = self._depth
+
+        for start in range(0, len(indices), _POINT_BLOCK):
+            block = indices[start:start + _POINT_BLOCK]
+            # The frontier holds pairs of a point (as index into the block) and a cell of the current level
+            local = np.arange(len(block))
+            cells = np.zeros(len(block), dtype=np.intp)
+
+            for level in range(depth + 1):
+                if len(local) == 0:
+                    break
+
+                if level == depth:
+                    force[start:start + len(block)] += self._leaf_repulsion(positions, block, local, cells, k_sq)
+                    break
+
+                points_ = block[local]
+                center = self._center[level][cells]
+                mass = self._mass[level][cells]
+                contains = (self._point_codes[points_] >> (2 * (depth - level))) == self._codes[level][cells]
+
+                delta = positions[points_] - center
+                distance_sq = np.einsum("ij,ij->i", delta, delta)
+                accept = ~contains & (self._sizes[level] ** 2 < theta_sq * distance_sq)
+
+                if np.any(accept):
+                    delta = positions[points_[accept]] - center[accept]
+                    distance_sq = np.maximum(np.einsum("ij,ij->i", delta, delta), _MIN_DISTANCE ** 2)
+                    pushed = delta * (mass[accept] * k_sq / distance_sq)[:, None]
+                    for axis in range(2):
+                        force[start:start + len(block), axis] += np.bincount(
+                            local[accept], pushed[:, axis], minlength=len(block)
+                        )
+
+                # Replace every opened pair by one pair per child of the cell
+                opened = ~accept
+                local, cells = local[opened], cells[opened]
+                first = self._child_start[level][cells]
+                counts = self._child_end[level][cells] - first
+                total = int(counts.sum())
+                offsets = np.repeat(np.cumsum(counts) - counts, counts)
+                local = np.repeat(local, counts)
+                cells = np.repeat(first, counts) + (np.arange(total) - offsets)
+
+        return force
+
+    def _leaf_repulsion(
+        self,
+        positions: NDArray[np.float64],
+        block: NDArray[np.intp],
+        local: NDArray[np.intp],
+        cells: NDArray[np.intp],
+        k_sq: float
+    ) -> NDArray[np.float64]:
+        """
+        The force the points of each leaf put on the point of the block it is paired with, summed per point.
+        The point itself is at distance 0 and adds nothing, like in the exact sum.
+        """
+        force = np.zeros((len(block), 2))
+        first = self._leaf_bounds[cells]
+        counts = self._leaf_bounds[cells + 1] - first
+        # Split the pairs of the frontier, a leaf of many coincident points would otherwise allocate a lot at once
+        ends = np.cumsum(counts)
+        chunk_start = 0
+        while chunk_start < len(local):
+            done = int(ends[chunk_start - 1]) if chunk_start else 0
+            chunk_end = max(chunk_start + 1, int(np.searchsorted(ends, done + _PAIR_BLOCK, side="right")))
+            chunk_counts = counts[chunk_start:chunk_end]
+            total = int(chunk_counts.sum())
+            offsets = np.repeat(np.cumsum(chunk_counts) - chunk_counts, chunk_counts)
+            pair_local = np.repeat(local[chunk_start:chunk_end], chunk_counts)
+            others = self._order[np.repeat(first[chunk_start:chunk_end], chunk_counts) + (np.arange(total) - offsets)]
+
+            delta = positions[block[pair_local]] - positions[others]
+            distance_sq = np.maximum(np.einsum("ij,ij->i", delta, delta), _MIN_DISTANCE ** 2)
+            pushed = delta * (k_sq / distance_sq)[:, None]
+            for axis in range(2):
+                force[:, axis] += np.bincount(pair_local, pushed[:, axis], minlength=len(block))
+
+            chunk_start = chunk_end
+
+        return force
@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+# Copyright © YodaPY 2024-present
+#
+# This file is part of tk-netgraph.
+#
+# tk-netgraph is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# tk-netgraph is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with tk-netgraph. If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import multiprocessing
+import multiprocessing.queues
+import queue
+import threading
+import traceback
+import typing as t
+
+if t.TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+    from netgraph import NetManager
+    from netgraph.api._node import CanvasNode
+    from netgraph.layout._graph import LayoutGraph
+    from netgraph.layout._spring import SpringLayout
+
+__all__: t.Sequence[str] = (
+    "LayoutRunner",
+)
+
+_Message = tuple[str, int, t.Any]
+"""The kind of the message ("snapshot", "done" or "error"), the iteration and the positions or the error"""
+
+def _run_layout(
+    layout: SpringLayout,
+    graph: LayoutGraph,
+    messages: t.Any,
+    resume: t.Any,
+    cancel: t.Any,
+    snapshot_every: int
+) -> None:
+    """
+    The worker: run the layout and put a copy of the positions into the queue every few iterations
+    """
+    iteration = 0
+    try:
+        for iteration, _ in enumerate(layout.iterate(graph), start=1):
+            resume.wait()
+            if cancel.is_set():
+                if isinstance(messages, multiprocessing.queues.Queue):
+                    # Nobody reads the remaining snapshots, don't wait for them to be flushed on exit
+                    messages.cancel_join_thread()
+                return
+
+            if iteration % snapshot_every == 0:
+                messages.put(("snapshot", iteration, graph.positions.copy()))
+
+        messages.put(("done", iteration, graph.positions.copy()))
+    except Exception:
+        messages.put(("error", iteration, traceback.format_exc()))
+
+class LayoutRunner:
+    """
+    Runs a layout in a worker process or thread so the canvas stays responsive.
+    The worker puts snapshots of the positions into a queue, and a poller on the canvas moves the nodes to the
+    newest snapshot in one batch. Snapshots the poller didn't get to in time are skipped.
+
+    A process computes the layout without holding the GIL of the Tk thread but has to start an interpreter first
+    and pickle every snapshot. A thread starts instantly and works well when most of the time is spent in numpy
+    operations that release the GIL.
+    Processes are spawned, so a script that starts a runner in process mode needs an `if __name__ == "__main__":` guard.
+    """
+    __slots__: t.Sequence[str] = (
+        "_layout", "_manager", "_graph", "_mode", "_interval", "_snapshot_every", "_on_converged",
+        "_worker", "_messages", "_resume", "_cancel", "_poll_id", "_iteration"
+    )
+
+    def __init__(
+        self,
+        layout: SpringLayout,
+        manager: NetManager,
+        *,
+        pinned: t.Iterable[CanvasNode] = (),
+        positions: t.Optional[t.Mapping[CanvasNode, tuple[float, float]]] = None,
+        mode: t.Literal["process", "thread"] = "process",
+        interval: int = 50,
+        snapshot_every: int = 1,
+        on_converged: t.Optional[t.Callable[[dict[CanvasNode, tuple[float, float]]], None]] = None
+    ) -> None:
+        if mode not in ("process", "thread"):
+            raise ValueError(f"Unknown mode {mode!r}, expected 'process' or 'thread'")
+
+        self._layout = layout
+        self._manager = manager
+        self._graph = layout.graph(manager, pinned=pinned, positions=positions)
+        self._mode = mode
+        self._interval = interval
+        self._snapshot_every = max(1, snapshot_every)
+        self._on_converged = on_converged
+
+        self._worker: t.Optional[t.Union[multiprocessing.process.BaseProcess, threading.Thread]] = None
+        self._messages: t.Any = None
+        self._resume: t.Any = None
+        self._cancel: t.Any = None
+        self._poll_id: t.Optional[str] = None
+        self._iteration = 0
+
+    @property
+    def graph(self) -> LayoutGraph:
+        """
+        The graph the layout runs on, its positions are the last ones applied to the canvas
+        """
+        return self._graph
+
+    @property
+    def iteration(self) -> int:
+        """
+        The iteration of the last snapshot applied to the canvas
+        """
+        return self._iteration
+
+    @property
+    def is_running(self) -> bool:
+        return self._poll_id is not None
+
+    @property
+    def is_paused(self) -> bool:
+        return self._resume is not None and not self._resume.is_set()
+
+    def start(self) -> None:
+        if self._worker is not None:
+            raise RuntimeError("The layout runner was already started")
+
+        if self._mode == "process":
+            # fork would copy the state of the Tk interpreter into the child
+            context = multiprocessing.get_context("spawn")
+            self._messages, self._resume, self._cancel = context.Queue(), context.Event(), context.Event()
+            worker_type: t.Callable[..., t.Any] = context.Process
+        else:
+            self._messages, self._resume, self._cancel = queue.Queue(), threading.Event(), threading.Event()
+            worker_type = threading.Thread
+
+        self._resume.set()
+        self._worker = worker_type(
+            target=_run_layout,
+            args=(self._layout, self._graph.detach(), self._messages, self._resume, self._cancel, self._snapshot_every),
+            daemon=True
+        )
+        self._worker.start()
+        self._poll_id = self._manager.canvas.after(self._interval, self._poll)
+
+    def pause(self) -> None:
+        """
+        Stop the worker after its current iteration until `resume` is called
+        """
+        if self._resume is not None:
+            self._resume.clear()
+
+    def resume(self) -> None:
+        if self._resume is not None:
+            self._resume.set()
+
+    def cancel(self) -> None:
+        """
+        Stop the worker and the poller. The nodes stay at the last applied snapshot.
+        """
+        if self._cancel is None:
+            return
+
+        self._cancel.set()
+        self._resume.set() # a paused worker has to wake up to see the cancellation
+        self._stop()
+
+    def _stop(self) -> None:
+        if self._poll_id is not None:
+            self._manager.canvas.after_cancel(self._poll_id)
+            self._poll_id = None
+
+        if isinstance(self._worker, multiprocessing.process.BaseProcess):
+            self._worker.join(timeout=1)
+            if self._worker.is_alive():
+                self._worker.terminate()
+                self._worker.join()
+
+            self._messages.close()
+
+    def _poll(self) -> None:
+        self._poll_id = None
+        latest: t.Optional[_Message] = None
+        while True:
+            try:
+                message = self._messages.get_nowait()
+            except queue.Empty:
+                break
+
+            latest = message
+            if message[0] != "snapshot":
+                break
+
+        if latest is not None:
+            kind, iteration, payload = latest
+            if kind == "error":
+                self._stop()
+                raise RuntimeError(f"The layout failed in iteration {iteration}:\n{payload}")
+
+            self._apply(iteration, payload)
+            if kind == "done":
+                self._stop()
+                if self._on_converged is not None:
+                    self._on_converged(self._live_mapping())
+                return
+
+        self._poll_id = self._manager.canvas.after(self._interval, self._poll)
+
+    def _apply(self, iteration: int, positions: NDArray[np.float64]) -> None:
+        self._iteration = iteration
+        self._graph.positions[:] = positions
+        self._manager.set_positions(self._live_mapping())
+
+    def _live_mapping(self) -> dict[CanvasNode, tuple[float, float]]:
+        """
+        The positions of the graph nodes that are still part of the manager, nodes removed while the layout
+        is running are left out
+        """
+        live = set(self._manager.nodes)
+        return {node: position for node, position in self._graph.to_mapping().items() if node in live}
@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+# Copyright © YodaPY 2024-present
+#
+# This file is part of tk-netgraph.
+#
+# tk-netgraph is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# tk-netgraph is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with tk-netgraph. If not, see <https://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import typing as t
+
+import numpy as np
+
+from netgraph.layout._graph import LayoutGraph
+from netgraph.layout._quadtree import QuadTree
+
+if t.TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from netgraph import NetManager
+    from netgraph.api._node import CanvasNode
+
+__all__: t.Sequence[str] = (
+    "SpringLayout",
+)
+
+_PAIRWISE_BLOCK: t.Final[int] = 1 << 22
+"""The maximum number of node pairs whose distances are held in memory at once by the exact repulsion"""
+_EXACT_THRESHOLD: t.Final[int] = 1000
+"""Graphs with fewer nodes use the exact repulsion, which is faster than building a quadtree at that size"""
+_MIN_DISTANCE: t.Final[float] = 1e-2
+"""Distances are clamped to this value so nodes close to each other don't receive infinite forces"""
+
+def _exact_repulsion(
+    positions: NDArray[np.float64], k: float, points: t.Optional[NDArray[np.intp]] = None
+) -> NDArray[np.float64]:
+    """
+    The repulsive force k²/d of every node pair, computed block by block to bound the memory use.
+    If the indices of some nodes are given, only the forces on these nodes are returned.
+    """
+    indices = np.arange(len(positions)) if points is None else points
+    force = np.zeros((len(indices), 2))
+    block = max(1, _PAIRWISE_BLOCK // max(len(positions), 1))
+    for start in range(0, len(indices), block):
+        delta = positions[indices[start:start + block], None, :] - positions[None, :, :]
+        distance_sq = np.einsum("ijk,ijk->ij", delta, delta)
+        np.maximum(distance_sq, _MIN_DISTANCE ** 2, out=distance_sq)
+        force[start:start + block] = np.einsum("ijk,ij->ik", delta, (k * k) / distance_sq)
+
+    return force
+
+def _attraction(positions: NDArray[np.float64], edges: NDArray[np.intp], k: float) -> NDArray[np.float64]:
+    """
+    The attractive force d²/k between connected nodes
+    """
+    force = np.zeros_like(positions)
+    if len(edges) == 0:
+        return force
+
+    delta = positions[edges[:, 0]] - positions[edges[:, 1]]
+    pull = delta * (np.hypot(delta[:, 0], delta[:, 1]) / k)[:, None]
+    count = len(positions)
+    for axis in range(2):
+        # bincount sums the forces per node much faster than np.add.at
+        force[:, axis] = (
+            np.bincount(edges[:, 1], pull[:, axis], minlength=count)
+            - np.bincount(edges[:, 0], pull[:, axis], minlength=count)
+        )
+
+    return force
+
+def _separate_duplicates(positions: NDArray[np.float64], movable: NDArray[np.bool_], scale: float, rng: np.random.Generator) -> None:
+    """
+    Nodes on the same position don't repel each other, move them apart slightly
+    """
+    _, inverse, counts = np.unique(positions, axis=0, return_inverse=True, return_counts=True)
+    duplicates = (counts[inverse.reshape(-1)] > 1) & movable
+    if np.any(duplicates):
+        positions[duplicates] += rng.uniform(-scale, scale, size=(int(np.count_nonzero(duplicates)), 2))
+
+class SpringLayout:
+    """
+    A Fruchterman-Reingold force-directed layout. Connected nodes attract each other, all nodes repel each other,
+    and the step size of the nodes shrinks every iteration until the layout settles.
+    On large graphs the repulsion is approximated with a Barnes-Hut quadtree in O(n log n).
+    """
+    __slots__: t.Sequence[str] = ("_iterations", "_spacing", "_seed", "_tolerance", "_theta")
+
+    def __init__(
+        self,
+        *,
+        iterations: int = 50,
+        spacing: float = 100.0,
+        seed: t.Optional[int] = None,
+        tolerance: float = 1e-3,
+        theta: float = 1.0
+    ) -> None:
+        self._iterations = iterations
+        self._spacing = spacing
+        self._seed = seed
+        self._tolerance = tolerance
+        self._theta = theta
+
+    @property
+    def iterations(self) -> int:
+        """
+        The maximum number of iterations
+        """
+        return self._iterations
+
+    @property
+    def spacing(self) -> float:
+        """
+        The ideal distance between nodes in pixels, larger values spread the graph out
+        """
+        return self._spacing
+
+    @property
+    def seed(self) -> t.Optional[int]:
+        """
+        The seed for the random initial positions, the same seed and graph always give the same layout
+        """
+        return self._seed
+
+    @property
+    def tolerance(self) -> float:
+        """
+        The layout stops early once the mean step of the nodes is smaller than this fraction of the spacing
+        """
+        return self._tolerance
+
+    @property
+    def theta(self) -> float:
+        """
+        The accuracy of the Barnes-Hut approximation of the repulsion. Lower values are more accurate and slower,
+        0 computes the exact O(n²) repulsion.
+        """
+        return self._theta
+
+    def graph(
+        self,
+        manager: NetManager,
+        *,
+        pinned: t.Iterable[CanvasNode] = (),
+        positions: t.Optional[t.Mapping[CanvasNode, tuple[float, float]]] = None
+    ) -> LayoutGraph:
+        """
+        Read the graph of the manager into arrays with initial positions for this layout
+        """
+        return LayoutGraph.from_manager(manager, pinned=pinned, positions=positions, spacing=self._spacing, seed=self._seed)
+
+    def _uses_exact_repulsion(self, node_count: int) -> bool:
+        return self._theta <= 0 or node_count < _EXACT_THRESHOLD
+
+    def _repulsion(self, positions: NDArray[np.float64]) -> NDArray[np.float64]:
+        if self._uses_exact_repulsion(len(positions)):
+            return _exact_repulsion(positions, self._spacing)
+
+        # The tree is rebuilt every iteration, which is cheap compared to traversing it
+        return QuadTree(positions).repulsion(positions, self._spacing, self._theta)
+
+    def iterate(self, graph: LayoutGraph) -> t.Iterator[float]:
+        """
+        Run the layout on the positions of the graph in place, one iteration per step of the iterator.
+        Yields the mean distance the movable nodes moved in the iteration.
+        """
+        positions = graph.positions
+        movable = ~graph.pinned
+        if len(graph) == 0 or not np.any(movable):
+            return
+
+        k = self._spacing
+        rng = np.random.default_rng(self._seed)
+        _separate_duplicates(positions, movable, k * 1e-3, rng)
+
+        extent = np.ptp(positions[movable], axis=0).max()
+        initial_temperature = max(extent, k) / 10
+        for iteration in range(self._iterations):
+            temperature = initial_temperature * (1 - iteration / self._iterations)
+
+            displacement = self._repulsion(positions) + _attraction(positions, graph.edges, k)
+            length = np.hypot(displacement[:, 0], displacement[:, 1])
+            step = np.minimum(length, temperature)
+            positions[movable] += (displacement * (step / np.maximum(length, _MIN_DISTANCE))[:, None])[movable]
+
+            mean_step = float(step[movable].mean())
+            yield mean_step
+            if mean_step < self._tolerance * k:
+                return
+
+    def run(
+        self,
+        manager: NetManager,
+        *,
+        pinned: t.Iterable[CanvasNode] = (),
+        positions: t.Optional[t.Mapping[CanvasNode, tuple[float, float]]] = None
+    ) -> dict[CanvasNode, tuple[float, float]]:
+        """
+        Compute the layout of the manager's graph without touching the canvas
+        """
+        graph = self.graph(manager, pinned=pinned, positions=positions)
+        for _ in self.iterate(graph):
+            pass
+
+        return graph.to_mapping()
+
+    def apply(
+        self,
+        manager: NetManager,
+        *,
+        pinned: t.Iterable[CanvasNode] = (),
+        positions: t.Optional[t.Mapping[CanvasNode, tuple[float, float]]] = None
+    ) -> dict[CanvasNode, tuple[float, float]]:
+        """
+        Compute the layout and move the nodes to it in one batch. Nodes that were not rendered yet are rendered.
+        """
+        layout = self.run(manager, pinned=pinned, positions=positions)
+        manager.set_positions(layout)
+        return layout
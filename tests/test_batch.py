@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+# Copyright © YodaPY 2024-present
+#
+# This file is part of tk-netgraph.
+#
+# tk-netgraph is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# tk-netgraph is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with tk-netgraph. If not, see <https://www.gnu.org/licenses/>.
+from __future__ import annotations
+
+from netgraph import NetManager
+
+
+def test_edges_rendered_in_a_batch_are_drawn_when_it_is_left(manager: NetManager) -> None:
+    canvas = manager.canvas
+    a, b, c = manager.add_nodes_from(["a", "b", "c"], [(0, 0), (200, 0), (400, 0)])
+
+    with manager.batch():
+        with manager.batch():
+            first = manager.create_edge((a, b), "")
+            second = manager.create_edge((b, c), "")
+            first.render()
+            second.render()
+            a.move(0, 100)
+
+        assert manager.is_batching
+        assert not canvas.find_withtag(first.canvas_id)
+
+    assert not manager.is_batching
+    line = canvas.find_withtag(first.canvas_id)[0]
+    assert canvas.coords(line)[:2] == [0, 100]
+    assert canvas.find_withtag(second.canvas_id)
+
+
+def test_batch_lowers_edges_below_their_nodes_once(manager: NetManager) -> None:
+    canvas = manager.canvas
+    nodes = manager.add_nodes_from([str(i) for i in range(4)], [(i * 200, 0) for i in range(4)])
+    lowered = canvas.calls["tag_lower"]
+    raised = canvas.calls["tag_raise"]
+
+    with manager.batch():
+        for first, second in zip(nodes, nodes[1:]):
+            manager.create_edge((first, second), "").render()
+
+    canvas.update()
+    assert canvas.calls["tag_lower"] == lowered
+    assert canvas.calls["tag_raise"] - raised == len(nodes)
+    stacking = canvas.find_withtag("all")
+    for node in nodes:
+        for edge in node.edges:
+            assert max(map(stacking.index, canvas.find_withtag(edge.canvas_id))) < min(
+                map(stacking.index, canvas.find_withtag(node.canvas_id))
+            )
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+# Copyright © YodaPY 2024-present
+#
+# This file is part of tk-netgraph.
+#
+# tk-netgraph is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# tk-netgraph is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with tk-netgraph. If not, see <https://www.gnu.org/licenses/>.
+from __future__ import annotations
+
+import pytest
+
+from netgraph import NetManager
+
+
+def test_add_edges_from_matches_create_edge(manager: NetManager) -> None:
+    a, b = manager.add_nodes_from(["a", "b"], [(0, 0), (200, 0)])
+    single = manager.create_edge((a, b), "x", 2)
+    bulk = manager.add_edges_from([(a, b), (a, b, "y"), (b, a, "z", 3)])
+
+    assert [edge.position for edge in (single, *bulk)] == [1, 2, 3, 1]
+    assert [(edge.label, edge.weight) for edge in bulk] == [("", None), ("y", None), ("z", 3)]
+    assert manager.edge_count(a, b) == 4
+    assert all(edge in a.edges and edge in b.edges for edge in bulk)
+
+
+def test_add_edges_from_uses_given_positions(manager: NetManager) -> None:
+    a, b = manager.add_nodes_from(["a", "b"], [(0, 0), (200, 0)])
+    edges = manager.add_edges_from(((a, b), (a, b)), positions=iter((3, 1)))
+
+    assert [edge.position for edge in edges] == [3, 1]
+    assert manager.create_edge((a, b), "").position == 4
+
+
+@pytest.mark.parametrize("positions", [(1,), (1, 2, 3)])
+def test_add_edges_from_rejects_mismatched_positions(manager: NetManager, positions: tuple[int, ...]) -> None:
+    a, b = manager.add_nodes_from(["a", "b"], [(0, 0), (200, 0)])
+
+    with pytest.raises(ValueError):
+        manager.add_edges_from(((a, b), (a, b)), positions=iter(positions))
+
+    assert manager.edges == []
+
+
+def test_remove_nodes_keeps_the_order_of_the_others(manager: NetManager) -> None:
+    nodes = manager.add_nodes_from([str(i) for i in range(6)])
+    manager.add_edges_from([(nodes[0], nodes[1]), (nodes[1], nodes[2])], render=False)
+
+    manager.remove_nodes([nodes[1], nodes[4], nodes[1]])
+    manager.remove_node(nodes[4])
+
+    assert manager.nodes == [nodes[0], nodes[2], nodes[3], nodes[5]]
+    assert manager.edges == []
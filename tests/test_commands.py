@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+# Copyright © YodaPY 2024-present
+#
+# This file is part of tk-netgraph.
+#
+# tk-netgraph is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# tk-netgraph is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with tk-netgraph. If not, see <https://www.gnu.org/licenses/>.
+from __future__ import annotations
+
+from netgraph import HeadlessCanvas
+
+
+def test_commands_are_sent_once_the_outermost_block_is_left() -> None:
+    canvas = HeadlessCanvas()
+    line = canvas.create_line(0, 0, 10, 10)
+    text = canvas.create_text(50, 50, text="a", tags=("label",))
+
+    with canvas.buffering():
+        with canvas.buffering():
+            canvas.coords(line, 0, 0, 20, 20)
+            canvas.move("label", 5, 0)
+            canvas.itemconfigure(text, fill="red")
+
+        assert len(canvas._commands) == 3
+        assert canvas.calls["run_commands"] == 0
+
+    assert len(canvas._commands) == 0
+    assert canvas.calls["run_commands"] == 1
+    assert (canvas.calls["move"], canvas.calls["itemconfigure"]) == (0, 0)
+    assert canvas.coords(line) == [0, 0, 20, 20]
+    assert canvas.coords(text) == [55, 50]
+    assert canvas.itemcget(text, "fill") == "red"
+
+
+def test_reading_the_canvas_sends_the_collected_commands_first() -> None:
+    canvas = HeadlessCanvas()
+    line = canvas.create_line(0, 0, 10, 10)
+
+    with canvas.buffering():
+        canvas.move(line, 100, 0)
+        assert canvas.coords(line) == [100, 0, 110, 10]
+        assert canvas.calls["run_commands"] == 1
+
+        canvas.coords(line, 0, 0, 30, 30)
+        # The bounding box includes the width of the line
+        assert canvas.bbox(line)[2] > 30
+        assert canvas.calls["run_commands"] == 2
+
+    # Nothing was left to send
+    assert canvas.calls["run_commands"] == 2
+
+
+def test_commands_outside_a_block_run_immediately() -> None:
+    canvas = HeadlessCanvas()
+    line = canvas.create_line(0, 0, 10, 10)
+
+    canvas.move(line, 1, 1)
+
+    assert len(canvas._commands) == 0
+    assert canvas.calls["move"] == 1
+    assert canvas.calls["run_commands"] == 0
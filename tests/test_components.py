@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+# Copyright © YodaPY 2024-present
+#
+# This file is part of tk-netgraph.
+#
+# tk-netgraph is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# tk-netgraph is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with tk-netgraph. If not, see <https://www.gnu.org/licenses/>.
+from __future__ import annotations
+
+from netgraph import NetManager
+
+
+def _path(manager: NetManager, *labels: str) -> tuple[list, list]:
+    nodes = [manager.create_node(label) for label in labels]
+    for index, node in enumerate(nodes):
+        node.render((index * 200, 0))
+
+    edges = [manager.create_edge((first, second), "") for first, second in zip(nodes, nodes[1:])]
+    for edge in edges:
+        edge.render()
+
+    return nodes, edges
+
+
+def test_removing_an_edge_splits_its_component(manager: NetManager) -> None:
+    (a, b, c, d), (ab, bc, cd) = _path(manager, "a", "b", "c", "d")
+    components = manager.component_manager
+    assert len(components) == 1
+
+    manager.remove_edge(bc)
+
+    assert len(components) == 2
+    assert set(components.nodes(a)) == {a, b}
+    assert set(components.nodes(d)) == {c, d}
+    assert components.edges(a) == [ab]
+    assert components.edges(cd) == [cd]
+    assert components.get_tag(a) != components.get_tag(d)
+
+
+def test_rebuild_leaves_other_components_untouched(manager: NetManager) -> None:
+    (a, b, c), (ab, bc) = _path(manager, "a", "b", "c")
+    (x, y), _ = _path(manager, "x", "y")
+    components = manager.component_manager
+    tag = components.get_tag(x)
+
+    manager.remove_edge(bc)
+
+    assert components.get_tag(y) == tag
+    assert set(components.nodes(x)) == {x, y}
+    assert set(components.nodes(b)) == {a, b}
+
+
+def test_component_tags_are_materialized_again_after_a_rebuild(manager: NetManager) -> None:
+    canvas = manager.canvas
+    (a, b, c), (ab, bc) = _path(manager, "a", "b", "c")
+    components = manager.component_manager
+    old_tag = components.materialize(a)
+    assert old_tag is not None
+    assert set(canvas.find_withtag(old_tag)) == {
+        item for obj in (a, b, c, ab, bc) for item in canvas.find_withtag(obj.canvas_id)
+    }
+
+    manager.remove_edge(bc)
+    new_tag = components.materialize(a)
+
+    assert new_tag is not None and new_tag != old_tag
+    assert set(canvas.find_withtag(new_tag)) == {
+        item for obj in (a, b, ab) for item in canvas.find_withtag(obj.canvas_id)
+    }
+    # c has no edge left, dragging a or b must not move it
+    assert not set(canvas.find_withtag(new_tag)) & set(canvas.find_withtag(c.canvas_id))
+    for item in canvas.find_withtag(a.canvas_id):
+        assert old_tag not in canvas.gettags(item)
+
+
+def test_isolated_nodes_have_no_component(manager: NetManager) -> None:
+    (a, b), (ab,) = _path(manager, "a", "b")
+    lone = manager.create_node("lone")
+    components = manager.component_manager
+
+    assert lone not in components
+    assert components.get_tag(lone) is None
+    assert components.nodes(lone) == []
+    assert components.materialize(lone) is None
+
+    manager.remove_edge(ab)
+
+    assert len(components) == 0
+    assert a not in components and b not in components
+    assert components.get_tag(a) is None
+
+
+def test_merging_after_a_split(manager: NetManager) -> None:
+    (a, b, c), (ab, bc) = _path(manager, "a", "b", "c")
+    manager.remove_edge(ab)
+    manager.create_edge((a, c), "")
+
+    components = manager.component_manager
+    assert len(components) == 1
+    assert set(components.nodes(a)) == {a, b, c}
+    assert len(components.edges(b)) == 2
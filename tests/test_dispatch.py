@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+# Copyright © YodaPY 2024-present
+#
+# This file is part of tk-netgraph.
+#
+# tk-netgraph is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# tk-netgraph is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with tk-netgraph. If not, see <https://www.gnu.org/licenses/>.
+from __future__ import annotations
+
+import tkinter as tk
+
+from netgraph import NetManager
+from netgraph._dispatch import _PRESS
+
+
+def test_a_press_routes_the_drag_to_the_object_under_the_mouse(manager: NetManager) -> None:
+    canvas = manager.canvas
+    a, b = manager.add_nodes_from(["a", "b"], [(100, 100), (400, 100)])
+    edge = manager.create_edge((a, b), "")
+    edge.render()
+    canvas.update()
+
+    # The middle of the edge, which curves up to (250, -50)
+    canvas.event_generate("<ButtonPress-1>", x=250, y=25)
+    assert canvas.dispatcher.target == edge.canvas_id
+    canvas.event_generate("<ButtonRelease-1>", x=250, y=25)
+
+    canvas.event_generate("<ButtonPress-1>", x=100, y=100)
+    assert canvas.dispatcher.target == a.canvas_id
+
+    # The drag stays with the node although the mouse left it
+    canvas.event_generate("<B1-Motion>", x=300, y=300)
+    canvas.update()
+    assert a.get_center() == (300, 300)
+    assert b.get_center() == (400, 100)
+
+    canvas.event_generate("<ButtonRelease-1>", x=300, y=300)
+    assert canvas.dispatcher.target is None
+
+    canvas.event_generate("<ButtonPress-1>", x=700, y=500)
+    assert canvas.dispatcher.target is None
+
+
+def test_owner_handlers_run_before_bound_callbacks(manager: NetManager) -> None:
+    canvas = manager.canvas
+    dispatcher = canvas.dispatcher
+    calls: list[str] = []
+
+    class Owner:
+        def on_press(self, event: tk.Event) -> None:
+            calls.append("owner")
+
+    canvas.create_text(50, 50, text="x", tags=("box",))
+    dispatcher.attach("box", Owner(), {_PRESS: ("on_press",)})
+    # Other spellings of the sequence are handled by the dispatcher as well
+    dispatcher.bind("box", "<Button-1>", lambda event: calls.append("callback"))
+    tag_binds = canvas.calls["tag_bind"]
+    dispatcher.bind("box", "<Double-Button-1>", lambda event: None)
+
+    canvas.event_generate("<ButtonPress-1>", x=50, y=50)
+    assert calls == ["owner", "callback"]
+    assert canvas.calls["tag_bind"] == tag_binds + 1
+
+    dispatcher.forget("box")
+    assert dispatcher.target is None
+    canvas.event_generate("<ButtonPress-1>", x=50, y=50)
+    assert calls == ["owner", "callback"]
+
+
+def test_removing_the_dragged_node_ends_the_drag(manager: NetManager) -> None:
+    canvas = manager.canvas
+    a, b = manager.add_nodes_from(["a", "b"], [(100, 100), (400, 100)])
+    canvas.update()
+
+    canvas.event_generate("<ButtonPress-1>", x=100, y=100)
+    manager.remove_node(a)
+    canvas.event_generate("<B1-Motion>", x=300, y=300)
+    canvas.update()
+
+    assert canvas.dispatcher.target is None
+    assert b.get_center() == (400, 100)
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+# Copyright © YodaPY 2024-present
+#
+# This file is part of tk-netgraph.
+#
+# tk-netgraph is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# tk-netgraph is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with tk-netgraph. If not, see <https://www.gnu.org/licenses/>.
+from __future__ import annotations
+
+from netgraph import NetManager
+
+
+def test_parallel_edges_get_consecutive_positions_and_reuse_freed_ones(manager: NetManager) -> None:
+    a, b = manager.add_nodes_from(["a", "b"], [(0, 0), (200, 0)])
+    first, second, third = (manager.create_edge((a, b), "") for _ in range(3))
+    backwards = manager.create_edge((b, a), "")
+    assert [edge.position for edge in (first, second, third, backwards)] == [1, 2, 3, 1]
+
+    manager.remove_edge(second)
+    assert manager.create_edge((a, b), "").position == 2
+    assert manager.create_edge((a, b), "").position == 4
+
+
+def test_edges_between_in_both_directions(manager: NetManager) -> None:
+    a, b, c = manager.add_nodes_from(["a", "b", "c"], [(0, 0), (200, 0), (400, 0)])
+    forward = manager.create_edge((a, b), "")
+    backward = manager.create_edge((b, a), "")
+    loop = manager.create_edge((a, a), "")
+
+    assert manager.edges_between(a, b, directed=True) == [forward]
+    assert manager.edges_between(a, b) == [forward, backward]
+    assert manager.edges_between(b, a) == [backward, forward]
+    assert manager.edges_between(a, a) == [loop]
+    assert manager.edges_between(a, c) == []
+    assert (manager.edge_count(a, b), manager.edge_count(a, b, directed=True), manager.edge_count(a, a)) == (2, 1, 1)
+    assert set(manager.neighbors(a)) == {a, b}
+
+
+def test_removing_the_last_edge_of_a_pair_forgets_it(manager: NetManager) -> None:
+    a, b = manager.add_nodes_from(["a", "b"], [(0, 0), (200, 0)])
+    first, second = manager.create_edge((a, b), ""), manager.create_edge((a, b), "")
+
+    manager.remove_edge(first)
+    manager.remove_edge(second)
+
+    assert manager.edge_count(a, b) == 0
+    assert manager.neighbors(a) == []
+    assert manager.create_edge((a, b), "").position == 1
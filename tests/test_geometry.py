@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+# Copyright © YodaPY 2024-present
+#
+# This file is part of tk-netgraph.
+#
+# tk-netgraph is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# tk-netgraph is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with tk-netgraph. If not, see <https://www.gnu.org/licenses/>.
+from __future__ import annotations
+
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from netgraph import NetManager
+from netgraph._edge import _VECTORIZE_THRESHOLD, _compute_geometries, _compute_geometry
+
+
+def test_vectorized_geometry_matches_the_scalar_geometry(manager: NetManager) -> None:
+    rng = random.Random(0)
+    nodes = manager.add_nodes_from(
+        [str(i) for i in range(20)], [(rng.randrange(1000), rng.randrange(1000)) for _ in range(20)]
+    )
+    edges = [manager.create_edge((rng.choice(nodes), rng.choice(nodes)), "") for _ in range(3 * _VECTORIZE_THRESHOLD)]
+    # Parallel edges and self-loops at higher positions
+    edges += [manager.create_edge((nodes[0], nodes[1]), "") for _ in range(3)]
+    edges += [manager.create_edge((nodes[2], nodes[2]), "") for _ in range(3)]
+
+    vectorized = _compute_geometries(edges)
+
+    for edge, geometry in zip(edges, vectorized):
+        expected = _compute_geometry(edge)
+        assert geometry.points == pytest.approx(expected.points)
+        assert geometry.anchor == pytest.approx(expected.anchor)
+        assert geometry.normal == pytest.approx(expected.normal)
+        if expected.angle is None:
+            assert geometry.angle is None
+        else:
+            assert geometry.angle == pytest.approx(expected.angle)
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+# Copyright © YodaPY 2024-present
+#
+# This file is part of tk-netgraph.
+#
+# tk-netgraph is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# tk-netgraph is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with tk-netgraph. If not, see <https://www.gnu.org/licenses/>.
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from netgraph import NetManager
+from netgraph.layout import LayoutGraph, ParallelSpringLayout, SpringLayout
+
+
+def _ring(manager: NetManager, count: int) -> list:
+    nodes = manager.add_nodes_from([str(i) for i in range(count)])
+    manager.add_edges_from(((nodes[i], nodes[i - 1]) for i in range(count)), render=False)
+    return nodes
+
+
+def test_the_same_seed_gives_the_same_layout(manager: NetManager) -> None:
+    nodes = _ring(manager, 30)
+
+    first = SpringLayout(iterations=30, seed=7).run(manager)
+    second = SpringLayout(iterations=30, seed=7).run(manager)
+
+    assert first == second
+    assert set(first) == set(nodes)
+
+
+def test_the_graph_leaves_out_parallel_edges_and_self_loops(manager: NetManager) -> None:
+    a, b = manager.add_nodes_from(["a", "b"])
+    manager.add_edges_from([(a, b), (b, a), (a, a)], render=False)
+
+    graph = LayoutGraph.from_manager(manager, seed=0)
+
+    assert graph.edges.tolist() == [[0, 1]]
+
+
+def test_apply_moves_the_nodes_and_keeps_pinned_ones(manager: NetManager) -> None:
+    nodes = _ring(manager, 10)
+    nodes[0].render((400, 300))
+
+    layout = SpringLayout(iterations=20, seed=3).apply(manager, pinned=[nodes[0]])
+
+    assert layout[nodes[0]] == (400, 300)
+    for node in nodes:
+        assert node.is_rendered
+        assert node.get_center() == pytest.approx(layout[node], abs=1)
+
+
+def test_parallel_layout_matches_the_serial_one(manager: NetManager) -> None:
+    _ring(manager, 40)
+
+    serial = SpringLayout(iterations=10, seed=5).run(manager)
+    parallel = ParallelSpringLayout(iterations=10, seed=5, workers=2).run(manager)
+
+    assert parallel.keys() == serial.keys()
+    for node, position in serial.items():
+        assert parallel[node] == pytest.approx(position)
+
+
+def test_parallel_barnes_hut_layout_matches_the_serial_one(manager: NetManager) -> None:
+    _ring(manager, 1200)
+
+    serial = SpringLayout(iterations=3, seed=5, theta=0.5).run(manager)
+    parallel = ParallelSpringLayout(iterations=3, seed=5, theta=0.5, workers=2).run(manager)
+
+    for node, position in serial.items():
+        assert parallel[node] == pytest.approx(position)
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+# Copyright © YodaPY 2024-present
+#
+# This file is part of tk-netgraph.
+#
+# tk-netgraph is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# tk-netgraph is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with tk-netgraph. If not, see <https://www.gnu.org/licenses/>.
+from __future__ import annotations
+
+import time
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from netgraph import HeadlessCanvas, NetManager
+from netgraph.layout import LayoutRunner, SpringLayout
+
+
+def test_nodes_removed_during_a_run_are_not_moved() -> None:
+    canvas = HeadlessCanvas()
+    manager = NetManager(canvas)
+    nodes = manager.add_nodes_from([str(i) for i in range(20)])
+    manager.add_edges_from(((nodes[i], nodes[i - 1]) for i in range(1, 20)), render=False)
+
+    converged: list[dict] = []
+    runner = LayoutRunner(
+        SpringLayout(iterations=50, seed=1), manager, mode="thread", interval=1, on_converged=converged.append
+    )
+    runner.start()
+
+    removed = nodes[5]
+    manager.remove_node(removed)
+    # A new node takes the place the removed one had in the node store
+    newcomer = manager.create_node("new")
+    newcomer.render((900, 900))
+
+    deadline = time.perf_counter() + 30
+    while not converged:
+        assert time.perf_counter() < deadline
+        canvas.update()
+        time.sleep(0.001)
+
+    assert removed not in converged[0]
+    assert newcomer.get_center() == (900, 900)
+    assert set(converged[0]) == set(nodes) - {removed}
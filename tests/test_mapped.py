@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+# Copyright © YodaPY 2024-present
+#
+# This file is part of tk-netgraph.
+#
+# tk-netgraph is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# tk-netgraph is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with tk-netgraph. If not, see <https://www.gnu.org/licenses/>.
+from __future__ import annotations
+
+import pathlib
+import tkinter as tk
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from netgraph import HeadlessCanvas, MappedGraph, NetManager
+
+
+def _chain(directory: pathlib.Path, count: int, spacing: float) -> MappedGraph:
+    """
+    Nodes on a horizontal line, each connected to the next one
+    """
+    return MappedGraph.create(
+        directory,
+        [f"n{i}" for i in range(count)],
+        [(i * spacing, 100) for i in range(count)],
+        [(i, i + 1) for i in range(count - 1)],
+        cell_size=256
+    )
+
+
+def test_create_and_open_round_trip(tmp_path: pathlib.Path) -> None:
+    MappedGraph.create(
+        tmp_path,
+        ["a", "b", "ünïcode"],
+        [(0, 0), (600, 0), (0, 900)],
+        [(0, 1), (0, 1), (1, 0), (2, 2)],
+        weights=[1, None, -5, 2**40],
+        edge_labels=["x", "", "y", "loop"]
+    )
+    graph = MappedGraph(tmp_path)
+
+    assert (graph.node_count, graph.edge_count) == (3, 4)
+    assert isinstance(graph.positions, np.memmap)
+    assert [graph.label(node) for node in range(3)] == ["a", "b", "ünïcode"]
+    assert [graph.edge_label(edge) for edge in range(4)] == ["x", "", "y", "loop"]
+    assert [graph.weight(edge) for edge in range(4)] == [1, None, -5, 2**40]
+    assert [graph.edge_position(edge) for edge in range(4)] == [1, 2, 1, 1]
+    assert graph.endpoints.tolist() == [[0, 1], [0, 1], [1, 0], [2, 2]]
+
+
+def test_edges_that_reference_missing_nodes_are_rejected(tmp_path: pathlib.Path) -> None:
+    with pytest.raises(ValueError):
+        MappedGraph.create(tmp_path, ["a"], [(0, 0)], [(0, 1)])
+
+
+def test_area_and_neighbourhood_queries(tmp_path: pathlib.Path) -> None:
+    graph = _chain(tmp_path, 20, 100)
+
+    assert graph.nodes_in((250, 0, 650, 200)).tolist() == [3, 4, 5, 6]
+    assert graph.nodes_in((-500, 150, 5000, 200)).tolist() == []
+    assert graph.edges_of([0, 5]).tolist() == [0, 4, 5]
+    assert graph.neighborhood(5, depth=2).tolist() == [3, 4, 5, 6, 7]
+
+
+def test_attach_creates_nodes_only_around_the_view(tmp_path: pathlib.Path) -> None:
+    graph = _chain(tmp_path, 100, 200)
+    canvas = HeadlessCanvas(width=400, height=300)
+    manager = NetManager(canvas)
+
+    window = manager.attach(graph)
+    shown = set(window.nodes)
+    # The nodes within the margin of the view, and the next node of the chain
+    assert shown == set(range(5))
+    assert len(manager.nodes) == len(shown)
+    assert set(window.edges) == {0, 1, 2, 3}
+
+    moved = window.nodes[1]
+    moved.move(0, 50)
+    canvas.update()
+
+    start, end = tk.Event(), tk.Event()
+    start.x = start.y = end.y = 0
+    end.x = -10_000
+    manager.start_pan(start)
+    manager.pan(end)
+    window.update()
+
+    assert 1 not in window.nodes
+    assert min(window.nodes) > 40 and 50 in window.nodes
+
+    # The way back shows the node where it was moved to
+    start.x, end.x = 0, 10_000
+    manager.start_pan(start)
+    manager.pan(end)
+    window.update()
+
+    assert window.nodes[1].get_position() == (200, 150)
+    assert window.index_of(window.nodes[1]) == 1
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+# Copyright © YodaPY 2024-present
+#
+# This file is part of tk-netgraph.
+#
+# tk-netgraph is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# tk-netgraph is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with tk-netgraph. If not, see <https://www.gnu.org/licenses/>.
+from __future__ import annotations
+
+import pytest
+
+from netgraph import NetManager
+
+
+def test_position_is_kept_without_querying_the_canvas(manager: NetManager) -> None:
+    canvas = manager.canvas
+    node = manager.create_node("a")
+    with pytest.raises(RuntimeError):
+        node.get_center()
+
+    node.render((100, 100))
+    bbox_calls = canvas.calls["bbox"]
+
+    assert node.get_center() == (100, 100)
+    assert canvas.calls["bbox"] == bbox_calls
+    assert node.get_bbox() == pytest.approx(canvas.bbox(node.canvas_id), abs=1)
+
+
+def test_moved_node_keeps_its_position_and_bbox(manager: NetManager) -> None:
+    canvas = manager.canvas
+    node = manager.create_node("a")
+    node.render((100, 100))
+
+    node.move(30, -20)
+    canvas.update()
+
+    assert node.get_center() == (130, 80)
+    assert node.get_bbox() == pytest.approx(canvas.bbox(node.canvas_id), abs=1)
+
+
+def test_drag_events_are_coalesced_into_one_move_per_frame(manager: NetManager) -> None:
+    canvas = manager.canvas
+    a, b = manager.add_nodes_from(["a", "b"], [(100, 100), (300, 100)])
+    edge = manager.create_edge((a, b), "")
+    edge.render()
+    canvas.update()
+
+    sent: list[tuple] = []
+    send = canvas._commands._send
+    canvas._commands._send = lambda commands: (sent.extend(commands), send(commands))
+
+    canvas.event_generate("<ButtonPress-1>", x=100, y=100)
+    for step in range(1, 6):
+        canvas.event_generate("<B1-Motion>", x=100 + step * 10, y=100)
+
+    assert not any(command[0] == "move" for command in sent)
+    canvas.update()
+
+    assert [command for command in sent if command[0] == "move"] == [("move", a.canvas_id, 50, 0)]
+    line = canvas.find_withtag(edge.canvas_id)[0]
+    assert [command[1] for command in sent if command[0] == "coords"].count(line) == 1
+    assert a.get_center() == (150, 100)
+    assert canvas.coords(line)[:2] == [150, 100]
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+# Copyright © YodaPY 2024-present
+#
+# This file is part of tk-netgraph.
+#
+# tk-netgraph is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# tk-netgraph is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with tk-netgraph. If not, see <https://www.gnu.org/licenses/>.
+from __future__ import annotations
+
+import io
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from netgraph import HeadlessCanvas, NetManager, NodeConfig
+
+
+def _reload(manager: NetManager, **kwargs: object) -> tuple[NetManager, io.BytesIO]:
+    file = io.BytesIO()
+    manager.save(file, **kwargs)
+    file.seek(0)
+    return NetManager(HeadlessCanvas()), file
+
+
+def test_save_and_load_round_trip(manager: NetManager) -> None:
+    a, b, c = manager.add_nodes_from(["a", "b", "ünïcode"], [(100, 100), (300, 100), (200, 300)])
+    lonely = manager.create_node("lonely")
+    manager.create_edge((a, b), "first", 3)
+    manager.create_edge((a, b), "second")
+    manager.create_edge((c, c), "loop", -7)
+
+    loaded, file = _reload(manager)
+    nodes, edges = loaded.load(file)
+
+    assert [node.label for node in nodes] == ["a", "b", "ünïcode", "lonely"]
+    assert [node.get_position() for node in nodes[:3]] == [(100, 100), (300, 100), (200, 300)]
+    assert not nodes[3].is_rendered and not lonely.is_rendered
+    assert [(edge.label, edge.weight, edge.position) for edge in edges] == [
+        ("first", 3, 1), ("second", None, 2), ("loop", -7, 1)
+    ]
+    assert [tuple(nodes.index(node) for node in edge.endpoints) for edge in edges] == [(0, 1), (0, 1), (2, 2)]
+    tags = loaded.component_manager
+    assert tags.get_tag(nodes[0]) == tags.get_tag(nodes[1]) != tags.get_tag(nodes[2])
+
+
+def test_loaded_positions_follow_the_view_scale(manager: NetManager) -> None:
+    manager.add_nodes_from(["a"], [(100, 50)])
+
+    loaded, file = _reload(manager)
+    loaded.view.zoom(2)
+    (node,), _ = loaded.load(file)
+
+    assert node.get_position() == pytest.approx((100, 50))
+    assert node.get_center() == pytest.approx((200, 100))
+
+
+def test_configs_are_saved_as_references(manager: NetManager) -> None:
+    static = NodeConfig(enable_dragging=False)
+    manager.add_nodes_from(["a"], [(0, 0)])
+    manager.add_nodes_from(["b"], [(100, 0)], config=static)
+
+    loaded, file = _reload(manager, node_configs=[static])
+    with pytest.raises(ValueError, match="node config 0"):
+        loaded.load(file)
+
+    file.seek(0)
+    nodes, _ = NetManager(HeadlessCanvas()).load(file, node_configs=[static])
+    assert nodes[0].config is not static and nodes[1].config is static
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+# Copyright © YodaPY 2024-present
+#
+# This file is part of tk-netgraph.
+#
+# tk-netgraph is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# tk-netgraph is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with tk-netgraph. If not, see <https://www.gnu.org/licenses/>.
+from __future__ import annotations
+
+from netgraph import NetManager
+
+
+def test_deleted_hidden_items_are_not_reused(manager: NetManager) -> None:
+    canvas = manager.canvas
+    old = manager.create_node("a")
+    old.render((0, 0))
+    items = canvas.find_withtag(old.canvas_id)
+    manager.remove_node(old)
+    canvas.update()
+    pool = canvas.item_pool
+    assert len(pool) == len(items)
+
+    # Hidden items can only be deleted by their ID, which Tk accepts as a string as well
+    dead = items
+    canvas.delete(dead[0], *map(str, dead[1:]))
+    assert len(pool) == 0
+
+    new = manager.create_node("b")
+    new.render((100, 100))
+    reused = canvas.find_withtag(new.canvas_id)
+
+    assert not set(dead) & set(reused)
+    assert set(reused) <= set(canvas.find_withtag("all"))
+
+
+def test_pending_options_do_not_reach_reused_items(manager: NetManager) -> None:
+    canvas = manager.canvas
+    a, b = manager.add_nodes_from(["a", "b"], [(0, 0), (200, 0)])
+    old = manager.create_edge((a, b), "")
+    old.render()
+    canvas.update()
+    old.label = "STALE"
+    manager.remove_edge(old)
+
+    new = manager.create_edge((a, b), "", 2)
+    new.render()
+    canvas.update()
+
+    items = canvas.find_withtag(new.canvas_id)
+    texts = {canvas.itemcget(item, "text") for item in items if canvas.type(item) == "text"}
+    assert "STALE" not in texts
+    assert "2" in texts
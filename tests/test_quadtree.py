@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+# Copyright © YodaPY 2024-present
+#
+# This file is part of tk-netgraph.
+#
+# tk-netgraph is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# tk-netgraph is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with tk-netgraph. If not, see <https://www.gnu.org/licenses/>.
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from netgraph.layout import _quadtree
+from netgraph.layout._quadtree import QuadTree
+from netgraph.layout._spring import _exact_repulsion
+
+
+def _clusters(spread: float, *, coincident: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    centers = rng.uniform(0, 1000, (5, 2))
+    clusters = [center + rng.normal(0, spread, (100, 2)) for center in centers]
+    return np.concatenate([*clusters, np.repeat(centers[:1], coincident, axis=0)])
+
+
+@pytest.mark.parametrize("spread", [1e-3, 1e-2, 3e-2, 0.1, 1.0])
+def test_repulsion_matches_the_exact_sum_on_clustered_points(spread: float) -> None:
+    positions = _clusters(spread, coincident=20)
+    exact = _exact_repulsion(positions, 10.0)
+    approx = QuadTree(positions).repulsion(positions, 10.0, 0.01)
+
+    assert np.linalg.norm(approx - exact) <= 1e-6 * np.linalg.norm(exact)
+
+
+def test_repulsion_of_some_points_in_small_pair_blocks(monkeypatch: pytest.MonkeyPatch) -> None:
+    positions = _clusters(1e-2, coincident=50)
+    points = np.arange(0, len(positions), 7)
+    expected = QuadTree(positions).repulsion(positions, 10.0, 0.01)[points]
+    monkeypatch.setattr(_quadtree, "_PAIR_BLOCK", 64)
+
+    forces = QuadTree(positions).repulsion(positions, 10.0, 0.01, points)
+
+    np.testing.assert_allclose(forces, expected, rtol=1e-12, atol=1e-9)
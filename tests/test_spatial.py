@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+# Copyright © YodaPY 2024-present
+#
+# This file is part of tk-netgraph.
+#
+# tk-netgraph is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# tk-netgraph is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with tk-netgraph. If not, see <https://www.gnu.org/licenses/>.
+from __future__ import annotations
+
+from netgraph import NetManager
+
+
+def test_nodes_and_edges_in_a_rectangle(manager: NetManager) -> None:
+    a, b, c = manager.add_nodes_from(["a", "b", "c"], [(100, 100), (500, 100), (300, 2000)])
+    edge = manager.create_edge((a, b), "")
+    edge.render()
+
+    assert set(manager.nodes_in(0, 0, 600, 200)) == {a, b}
+    assert manager.nodes_in(600, 200, 0, 0) == manager.nodes_in(0, 0, 600, 200)
+    assert manager.nodes_in(250, 1900, 350, 1950) == [c]
+    # The edge is indexed by its control polyline, (100, 100) -> (300, -50) -> (500, 100)
+    assert manager.spatial_index.bounds(edge) == (100, -50, 500, 100)
+    assert manager.edges_in(190, 15, 210, 35) == [edge]
+    assert manager.edges_in(280, 90, 320, 110) == []
+
+
+def test_queries_follow_moved_and_removed_objects(manager: NetManager) -> None:
+    canvas = manager.canvas
+    a, b = manager.add_nodes_from(["a", "b"], [(100, 100), (500, 100)])
+    edge = manager.create_edge((a, b), "")
+    edge.render()
+
+    b.move(0, 1000)
+    canvas.update()
+    assert manager.nodes_in(450, 50, 550, 150) == []
+    assert manager.nodes_in(450, 1050, 550, 1150) == [b]
+    assert manager.edges_in(190, 15, 210, 35) == []
+
+    manager.remove_node(a)
+    assert manager.nodes_in(0, 0, 200, 200) == []
+    assert manager.edges_in(0, 0, 600, 1200) == []
+
+
+def test_nearest_node_and_edge(manager: NetManager) -> None:
+    a, b = manager.add_nodes_from(["a", "b"], [(100, 100), (500, 100)])
+    edge = manager.create_edge((a, b), "")
+    edge.render()
+
+    assert manager.nearest_node(10, 100) is a
+    assert manager.nearest_node(1000, 120) is b
+    assert manager.nearest_node(1000, 120, max_distance=100) is None
+    assert manager.nearest_edge(300, -80) is edge
+    assert manager.nearest_edge(300, 400, max_distance=100) is None
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+# Copyright © YodaPY 2024-present
+#
+# This file is part of tk-netgraph.
+#
+# tk-netgraph is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# tk-netgraph is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with tk-netgraph. If not, see <https://www.gnu.org/licenses/>.
+from __future__ import annotations
+
+import pytest
+
+from netgraph import NetManager
+from netgraph._store import _EdgeStore, _NodeStore
+
+
+def test_releasing_a_free_slot_raises() -> None:
+    nodes, edges = _NodeStore(), _EdgeStore()
+    offset = nodes.add((0.0, 0.0, 0.0, 0.0))
+    slot = edges.add(None)
+    nodes.release(offset)
+    edges.release(slot)
+
+    with pytest.raises(ValueError):
+        nodes.release(offset)
+
+    with pytest.raises(ValueError):
+        edges.release(slot)
+
+
+def test_removing_a_node_twice_keeps_slots_distinct(manager: NetManager) -> None:
+    node = manager.create_node("a")
+    node.render((0, 0))
+    manager.remove_nodes([node])
+    manager.remove_nodes([node])
+
+    first, second = manager.create_node("p"), manager.create_node("q")
+    first.render((10, 10))
+    second.render((900, 900))
+
+    assert first.get_center() == (10, 10)
+    assert second.get_center() == (900, 900)
+    assert len(manager.node_store) == 2
+
+
+def test_removed_node_handle_is_stale(manager: NetManager) -> None:
+    node = manager.create_node("a")
+    node.render((0, 0))
+    manager.remove_nodes([node])
+    other = manager.create_node("b")
+    other.render((300, 300))
+
+    with pytest.raises(RuntimeError):
+        node.get_center()
+
+    with pytest.raises(RuntimeError):
+        node.move(5, 5)
+
+    assert other.get_center() == (300, 300)
+
+
+def test_edges_are_views_of_the_edge_store(manager: NetManager) -> None:
+    a, b = manager.add_nodes_from(["a", "b"], [(0, 0), (200, 0)])
+    edge = manager.create_edge((a, b), "", 3)
+    loop = manager.create_edge((a, a), "")
+
+    assert edge.endpoints == (a, b)
+    assert (edge.weight, loop.weight) == (3, None)
+    assert (edge.is_selfloop, loop.is_selfloop) == (False, True)
+    assert len(manager.edge_store) == 2
+
+    edge.weight = None
+    loop.weight = 5
+    assert (edge.weight, loop.weight) == (None, 5)
+
+
+def test_removed_edge_slot_is_reused(manager: NetManager) -> None:
+    a, b, c = manager.add_nodes_from(["a", "b", "c"], [(0, 0), (200, 0), (400, 0)])
+    old = manager.create_edge((a, b), "", 1)
+    manager.remove_edge(old)
+    new = manager.create_edge((b, c), "", 2)
+
+    assert len(manager.edge_store) == 1
+    assert (new.endpoints, new.weight) == ((b, c), 2)
+    with pytest.raises(RuntimeError):
+        old.weight
+
+
+def test_edges_keep_the_applied_component_id(manager: NetManager) -> None:
+    canvas = manager.canvas
+    a, b, c = manager.add_nodes_from(["a", "b", "c"], [(0, 0), (200, 0), (400, 0)])
+    first, second = manager.add_edges_from([(a, b), (b, c)])
+    for edge in (first, second):
+        edge.render()
+
+    tag = manager.component_manager.materialize(first)
+    assert tag is not None
+    assert manager.edge_store.component(first.slot) == manager.edge_store.component(second.slot) >= 0
+    assert set(canvas.find_withtag(second.canvas_id)) <= set(canvas.find_withtag(tag))
+
+
+@pytest.mark.parametrize("weight", [None, 0, 3, -2 ** 63, 2 ** 53 + 1, 2 ** 70, 2.0, 0.5, "5km", True])
+def test_edge_weights_round_trip_unchanged(manager: NetManager, weight: object) -> None:
+    a, b = manager.add_nodes_from(["a", "b"], [(0, 0), (200, 0)])
+    edge = manager.create_edge((a, b), "", weight)
+    assert edge.weight == weight and type(edge.weight) is type(weight)
+
+    edge.weight = 7
+    assert edge.weight == 7
+    edge.weight = weight
+    assert edge.weight == weight and type(edge.weight) is type(weight)
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+# Copyright © YodaPY 2024-present
+#
+# This file is part of tk-netgraph.
+#
+# tk-netgraph is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# tk-netgraph is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with tk-netgraph. If not, see <https://www.gnu.org/licenses/>.
+from __future__ import annotations
+
+import tkinter as tk
+
+import pytest
+
+from netgraph import HeadlessCanvas, NetConfig, NetManager
+
+
+def _zoom(manager: NetManager, steps: int, x: int = 0, y: int = 0) -> None:
+    """
+    Zoom in by the given number of wheel steps around the window position, out if steps is negative
+    """
+    for _ in range(abs(steps)):
+        event = tk.Event()
+        event.x, event.y, event.delta = x, y, 120 if steps > 0 else -120
+        manager.zoom(event)
+
+    manager.apply_zoom()
+
+
+def _center(canvas: HeadlessCanvas, tag: str) -> tuple[float, float]:
+    left, top, right, bottom = canvas.bbox(tag)
+    return (left + right) / 2, (top + bottom) / 2
+
+
+def test_dragging_brings_stale_nodes_to_their_position() -> None:
+    canvas = HeadlessCanvas(width=400, height=300)
+    manager = NetManager(canvas)
+    a, b = manager.add_nodes_from(["a", "b"], [(100, 100), (600, 100)])
+    edge = manager.create_edge((a, b), "")
+    edge.render()
+    canvas.update()
+    _zoom(manager, 3)
+
+    # b is out of view, its objects are still where the old scale put them
+    x, y = (a.get_center()[0] + b.get_center()[0]) / 2, a.get_center()[1]
+    canvas.event_generate("<ButtonPress-1>", x=x, y=y)
+    canvas.event_generate("<B1-Motion>", x=x - 400, y=y)
+    canvas.update()
+    canvas.update()
+
+    for node in (a, b):
+        center_x, center_y = node.get_center()
+        drawn_x, drawn_y = _center(canvas, node.canvas_id)
+        assert abs(center_x - drawn_x) <= 2 and abs(center_y - drawn_y) <= 2
+
+
+def _visible_items(canvas: HeadlessCanvas) -> list[int]:
+    return [item for item in canvas.find_withtag("all") if canvas.itemcget(item, "state") != "hidden"]
+
+
+def _pan(manager: NetManager, dx: int, dy: int) -> None:
+    start, end = tk.Event(), tk.Event()
+    start.x, start.y = 0, 0
+    end.x, end.y = dx, dy
+    manager.start_pan(start)
+    manager.pan(end)
+
+
+def test_view_transform_round_trip(manager: NetManager) -> None:
+    _zoom(manager, 3)
+
+    view = manager.view
+    assert view.scale == pytest.approx(1.1 ** 3)
+    assert view.to_world(*view.to_canvas(123.5, -40)) == pytest.approx((123.5, -40))
+
+
+def test_zoom_keeps_the_point_under_the_mouse() -> None:
+    canvas = HeadlessCanvas(width=400, height=300)
+    manager = NetManager(canvas)
+    node = manager.create_node("a")
+    node.render((200, 150))
+    canvas.update()
+
+    _zoom(manager, 4, 200, 150)
+    x, y = _center(canvas, node.canvas_id)
+
+    assert abs(x - canvas.canvasx(0) - 200) <= 2 and abs(y - canvas.canvasy(0) - 150) <= 2
+    assert manager.zoom_factor == pytest.approx(1.1 ** 4)
+
+
+def test_pan_scrolls_without_touching_items(manager: NetManager) -> None:
+    canvas = manager.canvas
+    a, b = manager.add_nodes_from(["a", "b"], [(100, 100), (300, 100)])
+    manager.create_edge((a, b), "").render()
+    canvas.update()
+    calls = canvas.calls.copy()
+
+    _pan(manager, -50, -20)
+    canvas.update()
+
+    assert (canvas.canvasx(0), canvas.canvasy(0)) == (50, 20)
+    assert a.get_center() == (100, 100)
+    assert all(canvas.calls[name] == calls[name] for name in ("move", "coords", "run_commands"))
+
+
+def test_only_nodes_near_the_view_get_canvas_objects() -> None:
+    canvas = HeadlessCanvas(width=400, height=300)
+    manager = NetManager(canvas, NetConfig(virtualize=True, viewport_margin=100))
+    near, far = manager.add_nodes_from(["near", "far"], [(100, 100), (3000, 100)])
+    edge = manager.create_edge((near, far), "")
+    edge.render()
+    canvas.update()
+
+    assert set(manager.viewport.materialized) == {near, edge}
+    assert len(far.obj_container) == 0
+    assert far.get_center() == (3000, 100)
+
+    _pan(manager, -2800, 0)
+    manager.viewport.update()
+    canvas.update()
+
+    assert far in manager.viewport.materialized
+    assert len(far.obj_container) > 0
+    assert near not in manager.viewport.materialized
+    assert len(near.obj_container) == 0
+
+
+def test_zooming_out_lowers_the_detail(manager: NetManager) -> None:
+    canvas = manager.canvas
+    node = manager.create_node("label")
+    node.render((100, 100))
+    canvas.update()
+    assert manager.detail.text and manager.detail.borders
+    detailed = _visible_items(canvas)
+
+    # 0.9 ** 7 is about 0.48, below the zoom factor for labels and borders
+    _zoom(manager, -7)
+    canvas.update()
+
+    assert not manager.detail.text and not manager.detail.borders
+    assert manager.detail.spline_divisor == 4
+    # The label and the double border are replaced by a single circle
+    assert len(_visible_items(canvas)) == 1 < len(detailed)
+    assert manager.view.to_world(*node.get_center()) == pytest.approx((100, 100))